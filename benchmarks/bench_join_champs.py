@@ -0,0 +1,81 @@
+"""
+Benchmark of the ChampionIndex join against the previous pd.merge of the mastery and champions tables.
+
+Generates synthetic mastery data for many players and a champions table of the size of the real one, checks that both
+joins produce the same rows and columns and prints the time of each one.
+
+Usage:
+    python -m benchmarks.bench_join_champs --players 1000 --champions 170
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_transform_mastery import generate_mastery, timed
+from pylegends.etl.champs.index import ChampionIndex
+from pylegends.etl.mastery.join import JoinChamps
+
+
+def generate_champions(champions: int) -> pd.DataFrame:
+    """
+    Generates a synthetic clean champions table.
+
+    Args:
+        champions (int): Number of champions.
+
+    Returns:
+        pd.DataFrame: One row per champion, keyed by 'key'.
+    """
+    keys = np.arange(1, champions + 1)
+    return pd.DataFrame(
+        {
+            "key": keys,
+            "champion": [f"Champion {key}" for key in keys],
+            "title": [f"the title of {key}" for key in keys],
+            "tags": [["Fighter", "Tank"][: key % 2 + 1] for key in keys],
+            "partype": np.where(keys % 3 == 0, "Energy", "Mana"),
+            "hp": 500.0 + keys,
+        }
+    )
+
+
+def merge_join(mastery: pd.DataFrame, champions: pd.DataFrame) -> pd.DataFrame:
+    """Previous implementation: a generic merge followed by the column ordering."""
+    joined = pd.merge(mastery, champions, on="key", how="inner", validate="many_to_many")
+    return joined[JoinChamps.ordered_columns(list(joined.columns))]
+
+
+def index_join(mastery: pd.DataFrame, index: ChampionIndex) -> pd.DataFrame:
+    """Current implementation: a positional lookup in the prebuilt index, ordering the columns in the same pass."""
+    return JoinChamps(mastery=mastery, persist=False, champions=index).run()
+
+
+def main() -> None:
+    """Checks the parity of both joins and prints their timings."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1000, help="Number of players.")
+    parser.add_argument("--champions", type=int, default=170, help="Number of champions.")
+    args = parser.parse_args()
+
+    mastery = generate_mastery(args.players, args.champions)
+    champions = generate_champions(args.champions)
+    print(f"📦 {len(mastery)} mastery rows x {len(champions)} champions")
+
+    build_time, index = timed(ChampionIndex, champions)
+    merge_time, expected = timed(merge_join, mastery, champions)
+    index_time, actual = timed(index_join, mastery, index)
+
+    assert list(expected.columns) == list(actual.columns), "columns differ"
+    for column in expected.columns:
+        assert expected[column].astype(object).equals(actual[column].astype(object)), f"'{column}' differs"
+    print("✅ Parity Checked: the index join matches pd.merge!")
+
+    print(f"pd.merge:   {merge_time:.3f}s")
+    print(f"Index join: {index_time:.3f}s (index built once in {build_time:.4f}s)")
+    print(f"Speedup:    {merge_time / index_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
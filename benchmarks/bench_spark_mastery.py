@@ -0,0 +1,114 @@
+"""
+Parity check of the Spark mastery stages against the pandas ones, on a local[*] session.
+
+Generates synthetic raw mastery data and a clean champions table, writes both as Parquet artifacts, runs
+TransformMastery and JoinChamps on one side and SparkTransformMastery and SparkJoinChamps on the other, checks that
+both produce the same columns, in the same order, with the same values ('final', 'last', 'rank' included) and prints
+the time of each one. The points are rounded so that many champions of a player tie on 'level' and 'points', and the
+rows shuffled, so that the rankings only match through their tie-breaker.
+
+Requires PySpark and a Java runtime (JAVA_HOME).
+
+Usage:
+    python -m benchmarks.bench_spark_mastery --rows 100000
+"""
+
+import argparse
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from pyspark.sql import SparkSession
+
+from benchmarks.bench_transform_mastery import timed
+from benchmarks.generators import CHAMPIONS, clean_champions, generate_champion_payload, generate_raw_mastery
+from pylegends.common.spark import SparkStorage
+from pylegends.common.storage import FrameStorage
+from pylegends.etl.champs.extract import ExtractChamps
+from pylegends.etl.mastery.join import JoinChamps
+from pylegends.etl.mastery.spark import SparkJoinChamps, SparkTransformMastery
+from pylegends.etl.mastery.transform import TransformMastery
+
+
+def pandas_stages(storage: FrameStorage, raw_path: str, champs_path: str) -> pd.DataFrame:
+    """Runs TransformMastery and JoinChamps on the artifacts."""
+    clean, status = TransformMastery(dataframe=storage.read(raw_path), persist=False).run()
+    assert clean is not None, status
+    return JoinChamps(mastery=clean, persist=False, champions=storage.read(champs_path)).run()
+
+
+def spark_stages(spark: SparkSession, storage: SparkStorage, raw_path: str, champs_path: str) -> pd.DataFrame:
+    """Runs SparkTransformMastery and SparkJoinChamps on the artifacts and collects the result."""
+    clean = SparkTransformMastery(spark, dataframe=storage.read(raw_path), persist=False).run()
+    joined = SparkJoinChamps(spark, mastery=clean, persist=False, champions=storage.read(champs_path)).run()
+    return joined.toPandas()
+
+
+def normalize(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Brings the output of either backend to comparable types, ordered by player and rank.
+
+    Categoricals become their values, timestamps millisecond precision and arrays tuples.
+
+    Args:
+        dataframe (pd.DataFrame): Joined mastery data of one backend.
+
+    Returns:
+        pd.DataFrame: The same data with plain column types and a fresh index.
+    """
+    columns = {}
+    for column in dataframe.columns:
+        series = dataframe[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(object)
+        if pd.api.types.is_datetime64_any_dtype(series):
+            series = series.astype("datetime64[ms]")
+        elif series.dtype == object:
+            series = series.map(lambda value: tuple(value) if isinstance(value, (list, np.ndarray)) else value)
+        columns[column] = series.to_numpy()
+    normalized = pd.DataFrame(columns)
+    return normalized.sort_values(["puuid", "rank"]).reset_index(drop=True)
+
+
+def main() -> None:
+    """Checks the parity of both backends and prints their timings."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of mastery rows.")
+    parser.add_argument("--champions", type=int, default=CHAMPIONS, help="Number of champions.")
+    args = parser.parse_args()
+
+    raw = generate_raw_mastery(args.rows, champions=args.champions)
+    raw["championPoints"] = raw["championPoints"] // 25_000 * 25_000
+    raw = raw.sample(frac=1, random_state=42, ignore_index=True)
+    champions = clean_champions(ExtractChamps.to_dataframe(generate_champion_payload(args.champions)))
+    print(f"📦 {len(raw)} rows ({raw['puuid'].nunique()} players x {args.champions} champions)")
+
+    spark = (
+        SparkSession.builder.master("local[*]")
+        .appName("bench_spark_mastery")
+        .config("spark.sql.session.timeZone", "UTC")
+        .config("spark.ui.showConsoleProgress", "false")
+        .getOrCreate()
+    )
+    spark.sparkContext.setLogLevel("ERROR")
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = FrameStorage(fmt="parquet", export_csv=False)
+            raw_path = storage.write(raw, os.path.join(temp_dir, "raw"))
+            champs_path = storage.write(champions, os.path.join(temp_dir, "champs"))
+
+            pandas_time, expected = timed(pandas_stages, storage, raw_path, champs_path)
+            spark_time, actual = timed(spark_stages, spark, SparkStorage(spark, storage), raw_path, champs_path)
+    finally:
+        spark.stop()
+
+    assert list(actual.columns) == list(expected.columns), f"column order differs: {actual.columns.tolist()}"
+    pd.testing.assert_frame_equal(normalize(actual), normalize(expected), check_dtype=False)
+    print(f"✅ Parity Checked: {len(expected.columns)} columns and {len(expected)} rows match the pandas stages!")
+    print(f"Pandas:      {pandas_time:.3f}s")
+    print(f"Spark local: {spark_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark of the vectorized TransformMastery columns against the previous row-wise implementations.
+
+Generates synthetic mastery data for many players, checks that both implementations produce the same 'final' and
+'rank' values and prints the time of each one.
+
+Usage:
+    python -m benchmarks.bench_transform_mastery --players 1000 --champions 160
+"""
+
+import argparse
+import time
+from typing import Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pylegends.etl.mastery.transform import TransformMastery
+
+
+def generate_mastery(players: int, champions: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Generates synthetic mastery data, already with the renamed columns used by the transformation.
+
+    Args:
+        players (int): Number of players.
+        champions (int): Number of champions of each player.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        pd.DataFrame: One row per player and champion.
+    """
+    rng = np.random.default_rng(seed)
+    rows = players * champions
+    return pd.DataFrame(
+        {
+            "puuid": np.repeat([f"player-{i}" for i in range(players)], champions),
+            "key": np.tile(np.arange(1, champions + 1), players),
+            "level": rng.integers(1, 8, rows),
+            "points": rng.integers(0, 200_000, rows),
+        }
+    )
+
+
+def final_row_wise(dataframe: pd.DataFrame) -> pd.Series:
+    """Previous implementation of the 'final' column, one Python call per row."""
+    return dataframe.apply(lambda row: 0 if row["level"] >= 5 else 21600 - row["points"], axis=1)
+
+
+def rank_row_wise(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Previous implementation of the 'rank' column, a tuple per row ranked within each player."""
+    frames = []
+    for _, group in dataframe.groupby("puuid", sort=False):
+        group = group.sort_values(by=["level", "points"], ascending=[False, False])
+        group["rank"] = group[["level", "points"]].apply(tuple, axis=1).rank(method="first", ascending=False)
+        frames.append(group)
+    return pd.concat(frames)
+
+
+def vectorized(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """Current implementation of both columns."""
+    transform = TransformMastery(dataframe.copy(), persist=False)
+    transform.calculate_final()
+    transform.create_rank_column()
+    return transform.dataframe
+
+
+def timed(function: Callable, *args) -> Tuple[float, object]:
+    """Runs a function and returns the elapsed seconds and its result."""
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Checks the parity of both implementations and prints their timings."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1000, help="Number of players.")
+    parser.add_argument("--champions", type=int, default=160, help="Number of champions per player.")
+    args = parser.parse_args()
+
+    dataframe = generate_mastery(args.players, args.champions)
+    print(f"📦 {len(dataframe)} rows ({args.players} players x {args.champions} champions)")
+
+    old_final_time, old_final = timed(final_row_wise, dataframe)
+    old_rank_time, old_ranked = timed(rank_row_wise, dataframe)
+    new_time, new = timed(vectorized, dataframe)
+
+    expected = dataframe.assign(final=old_final).merge(old_ranked[["puuid", "key", "rank"]], on=["puuid", "key"])
+    expected = expected.sort_values(["puuid", "key"]).reset_index(drop=True)
+    actual = new.sort_values(["puuid", "key"]).reset_index(drop=True)
+    assert np.array_equal(expected["final"].to_numpy(), actual["final"].to_numpy()), "'final' differs"
+    assert np.array_equal(expected["rank"].to_numpy(), actual["rank"].to_numpy()), "'rank' differs"
+    print("✅ Parity Checked: 'final' and 'rank' match the row-wise implementations!")
+
+    old_time = old_final_time + old_rank_time
+    print(f"Row-wise:   {old_time:.3f}s (final {old_final_time:.3f}s, rank {old_rank_time:.3f}s)")
+    print(f"Vectorized: {new_time:.3f}s")
+    print(f"Speedup:    {old_time / new_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
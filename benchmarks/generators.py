@@ -0,0 +1,184 @@
+"""
+Synthetic datasets for the benchmarks, shaped like the payloads and files of the real pipeline.
+
+Numeric columns are drawn with NumPy and text with Faker; Faker only fills a small pool of values that is then sampled
+with NumPy, so that datasets of millions of rows are generated in seconds. Every generator is deterministic for a seed.
+"""
+
+import math
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+from faker import Faker
+
+from pylegends.etl.champs.transform import TransformChamps
+
+SIZES = {"1k": 1_000, "100k": 100_000, "10m": 10_000_000}
+
+TAGS = ["Assassin", "Fighter", "Mage", "Marksman", "Support", "Tank"]
+PARTYPES = ["Mana", "Energy", "Rage", "Fury", "None"]
+CHAMPION_STATS = (
+    "hp hpperlevel mp mpperlevel movespeed armor armorperlevel spellblock spellblockperlevel attackrange hpregen "
+    "hpregenperlevel mpregen mpregenperlevel crit critperlevel attackdamage attackdamageperlevel attackspeedperlevel "
+    "attackspeed"
+).split()
+ITEM_STATS = ["FlatHPPoolMod", "FlatMPPoolMod", "FlatArmorMod", "FlatSpellBlockMod", "FlatPhysicalDamageMod"]
+ITEM_TAGS = ["Armor", "Boots", "Consumable", "Damage", "Health", "Mana", "SpellDamage"]
+MAPS = ["11", "12", "21", "22", "30"]
+CHAMPIONS = 170
+
+
+def text_pool(generate: Callable[[], str], size: int = 1000) -> np.ndarray:
+    """
+    Generates a pool of distinct-looking texts to sample from.
+
+    Args:
+        generate (Callable[[], str]): Faker method producing one text.
+        size (int): Number of texts in the pool.
+
+    Returns:
+        np.ndarray: The texts.
+    """
+    return np.array([generate() for _ in range(size)], dtype=object)
+
+
+def generate_raw_mastery(rows: int, seed: int = 42, champions: int = CHAMPIONS) -> pd.DataFrame:
+    """
+    Generates raw mastery data as returned by the Champion Mastery API, with the rows of each player contiguous.
+
+    Args:
+        rows (int): Number of rows.
+        seed (int): Seed of the generators.
+        champions (int): Number of champions of each player; the last player may have fewer.
+
+    Returns:
+        pd.DataFrame: One row per player and champion, with the API column names.
+    """
+    rng = np.random.default_rng(seed)
+    fake = Faker()
+    fake.seed_instance(seed)
+    champions = min(champions, rows)
+    players = math.ceil(rows / champions)
+    puuids = np.array([fake.sha256()[:78] for _ in range(players)], dtype=object)
+
+    level = rng.integers(1, 8, rows)
+    points = rng.integers(0, 500_000, rows)
+    return pd.DataFrame(
+        {
+            "puuid": np.repeat(puuids, champions)[:rows],
+            "championId": np.tile(np.arange(1, champions + 1), players)[:rows],
+            "championLevel": level,
+            "championPoints": points,
+            "lastPlayTime": rng.integers(1_600_000_000_000, 1_700_000_000_000, rows),
+            "championPointsSinceLastLevel": rng.integers(0, 20_000, rows),
+            "championPointsUntilNextLevel": np.where(level >= 5, 0, rng.integers(0, 20_000, rows)),
+            "chestGranted": rng.random(rows) < 0.3,
+            "tokensEarned": rng.integers(0, 3, rows),
+            "summonerId": np.repeat(puuids, champions)[:rows],
+        }
+    )
+
+
+def generate_champion_payload(rows: int, seed: int = 42) -> Dict[str, Dict[str, Any]]:
+    """
+    Generates the 'data' object of a Data Dragon champion.json payload.
+
+    Args:
+        rows (int): Number of champions.
+        seed (int): Seed of the generators.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Champion data by champion id, as read by ExtractChamps.
+    """
+    rng = np.random.default_rng(seed)
+    fake = Faker()
+    fake.seed_instance(seed)
+    names = text_pool(fake.first_name)[rng.integers(0, 1000, rows)]
+    titles = text_pool(lambda: f"the {fake.word()} {fake.word()}")[rng.integers(0, 1000, rows)]
+    info = rng.integers(0, 11, (rows, 4))
+    stats = rng.random((rows, len(CHAMPION_STATS))) * 100
+    tag_counts = rng.integers(1, 3, rows)
+    partypes = rng.integers(0, len(PARTYPES), rows)
+
+    payload = {}
+    for row in range(rows):
+        champ_id = f"{names[row]}{row}"
+        payload[champ_id] = {
+            "id": champ_id,
+            "key": str(row + 1),
+            "name": names[row],
+            "title": titles[row],
+            "info": dict(zip(["attack", "defense", "magic", "difficulty"], info[row].tolist())),
+            "tags": TAGS[row % len(TAGS) :][: tag_counts[row]] or TAGS[:1],
+            "partype": PARTYPES[partypes[row]],
+            "stats": dict(zip(CHAMPION_STATS, stats[row].tolist())),
+        }
+    return payload
+
+
+def generate_item_payload(rows: int, seed: int = 42) -> Dict[str, Dict[str, Any]]:
+    """
+    Generates the 'data' object of a Data Dragon item.json payload, with its nested gold, stats, maps and build tree.
+
+    Args:
+        rows (int): Number of items.
+        seed (int): Seed of the generators.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Item data by item id, as read by ExtractItems.
+    """
+    rng = np.random.default_rng(seed)
+    fake = Faker()
+    fake.seed_instance(seed)
+    names = text_pool(lambda: fake.word().capitalize())[rng.integers(0, 1000, rows)]
+    texts = text_pool(fake.sentence)[rng.integers(0, 1000, rows)]
+    gold = rng.integers(0, 3500, (rows, 2))
+    stats = rng.integers(0, 80, (rows, len(ITEM_STATS)))
+    on_maps = rng.random((rows, len(MAPS))) < 0.8
+    ids = [str(1000 + row) for row in range(rows)]
+
+    payload = {}
+    for row, item_id in enumerate(ids):
+        components = [ids[child] for child in rng.integers(0, rows, rng.integers(0, 3)) if child != row]
+        payload[item_id] = {
+            "name": names[row],
+            "description": f"<mainText><stats>{texts[row]}</stats></mainText>",
+            "colloquial": "",
+            "plaintext": texts[row],
+            "from": components,
+            "into": [],
+            "image": {"full": f"{item_id}.png", "sprite": "item0.png", "group": "item"},
+            "gold": {
+                "base": int(gold[row, 0]),
+                "purchasable": bool(gold[row, 1] > 0),
+                "total": int(gold[row].sum()),
+                "sell": int(gold[row].sum() * 0.7),
+            },
+            "tags": ITEM_TAGS[row % len(ITEM_TAGS) :][:2],
+            "maps": dict(zip(MAPS, on_maps[row].tolist())),
+            "stats": {stat: int(value) for stat, value in zip(ITEM_STATS, stats[row]) if value > 40},
+            "depth": int(len(components) + 1),
+        }
+    for item_id, item in payload.items():
+        for component in item["from"]:
+            payload[component]["into"].append(item_id)
+    return payload
+
+
+def clean_champions(raw: pd.DataFrame) -> pd.DataFrame:
+    """
+    Applies the TransformChamps steps to raw champion data in memory, producing the clean champions table.
+
+    Args:
+        raw (pd.DataFrame): Champion data as produced by ExtractChamps.to_dataframe.
+
+    Returns:
+        pd.DataFrame: The clean champions table, keyed by the integer 'key'.
+    """
+    transformer = TransformChamps()
+    transformer.dataframe = raw.copy()
+    transformer.drop_columns(transformer.columns_to_drop)
+    transformer.rename_columns()
+    transformer.cast_types()
+    return transformer.dataframe
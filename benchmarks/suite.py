@@ -0,0 +1,392 @@
+"""
+Benchmark suite of the ETL hot paths, with results stored as JSON to compare them across commits.
+
+Each benchmark times one step of the pipeline (each TransformMastery step, TransformChamps, TransformItems, the
+champion and item payload conversions, the join and the MongoDB loads) on synthetic data from benchmarks.generators, at
+the requested sizes. Every repeat gets a fresh copy of its input, prepared outside the timing. The minimum, median and
+mean of the repeats are stored in a JSON file named after the commit; passing a previous results file compares both
+runs and exits with an error if a benchmark got slower than the threshold.
+
+MongoDB loads run against an in-process mongomock client, or against a real mongod with --mongo-uri.
+
+Usage:
+    python -m benchmarks.suite --sizes 1k 100k --repeat 5
+    python -m benchmarks.suite --sizes 1k --filter transform join --compare benchmarks/results/<previous>.json
+    python -m benchmarks.suite --sizes 100k --filter load --mongo-uri mongodb://localhost:27017
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import mongomock
+import numpy as np
+import pandas as pd
+from pymongo import MongoClient
+
+from benchmarks.generators import (
+    CHAMPIONS,
+    SIZES,
+    clean_champions,
+    generate_champion_payload,
+    generate_item_payload,
+    generate_raw_mastery,
+)
+from pylegends.common.mongodb import MongoDBConnector
+from pylegends.etl.champs.extract import ExtractChamps
+from pylegends.etl.champs.index import ChampionIndex
+from pylegends.etl.items.extract import ExtractItems
+from pylegends.etl.items.transform import TransformItems
+from pylegends.etl.mastery.join import JoinChamps
+from pylegends.etl.mastery.transform import COLUMN_MAPPING, COLUMNS_TO_DROP, TransformMastery
+from pylegends.utils.config import MongoDB, Pipeline
+
+DATABASE = "pylegends_benchmark"
+
+
+class Datasets:
+    """
+    Synthetic inputs of one size, generated on first use and shared by the benchmarks.
+
+    Attributes:
+        rows (int): Number of rows of each dataset.
+        seed (int): Seed of the generators.
+    """
+
+    def __init__(self, rows: int, seed: int = 42) -> None:
+        """Initializes the datasets of the given size; nothing is generated yet."""
+        self.rows = rows
+        self.seed = seed
+
+    @cached_property
+    def raw_mastery(self) -> pd.DataFrame:
+        """Raw mastery data, as returned by the API."""
+        return generate_raw_mastery(self.rows, self.seed)
+
+    @cached_property
+    def renamed_mastery(self) -> pd.DataFrame:
+        """Raw mastery data with the columns dropped and renamed, the input of the column steps."""
+        return self.raw_mastery.drop(columns=COLUMNS_TO_DROP).rename(columns=COLUMN_MAPPING)
+
+    @cached_property
+    def clean_mastery(self) -> pd.DataFrame:
+        """Transformed mastery data, the input of the join."""
+        clean, _ = TransformMastery(dataframe=self.raw_mastery.copy(), persist=False).run()
+        return clean
+
+    @cached_property
+    def final_mastery(self) -> pd.DataFrame:
+        """Joined mastery data, the input of the MongoDB load."""
+        return JoinChamps(mastery=self.clean_mastery, persist=False, champions=self.champion_index).run()
+
+    @cached_property
+    def champion_index(self) -> ChampionIndex:
+        """Index of a champions table of the real size."""
+        raw = ExtractChamps.to_dataframe(generate_champion_payload(CHAMPIONS, self.seed))
+        return ChampionIndex(clean_champions(raw))
+
+    @cached_property
+    def champion_payload(self) -> Dict[str, Dict[str, Any]]:
+        """Data Dragon champion payload with one champion per row."""
+        return generate_champion_payload(self.rows, self.seed)
+
+    @cached_property
+    def raw_champions(self) -> pd.DataFrame:
+        """Raw champion data, the input of TransformChamps."""
+        return ExtractChamps.to_dataframe(self.champion_payload)
+
+    @cached_property
+    def item_payload(self) -> Dict[str, Dict[str, Any]]:
+        """Data Dragon item payload with one item per row."""
+        return generate_item_payload(self.rows, self.seed)
+
+    @cached_property
+    def raw_items(self) -> pd.DataFrame:
+        """Raw item data, the input of TransformItems."""
+        return ExtractItems.to_dataframe(self.item_payload)
+
+
+class Benchmark:
+    """
+    One timed step of the pipeline.
+
+    Attributes:
+        name (str): Name of the benchmark, e.g. "transform.mastery.rank".
+        prepare (Callable[[Datasets], Tuple]): Builds the arguments of a repeat, outside the timing.
+        run (Callable[..., Any]): The timed step.
+        max_rows (Optional[int]): Largest size the benchmark runs at; every size if None.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        prepare: Callable[[Datasets], Tuple],
+        run: Callable[..., Any],
+        max_rows: Optional[int] = None,
+    ) -> None:
+        """Initializes the benchmark."""
+        self.name = name
+        self.prepare = prepare
+        self.run = run
+        self.max_rows = max_rows
+
+    def measure(self, datasets: Datasets, repeat: int) -> List[float]:
+        """
+        Times the step on fresh inputs, silencing its progress messages.
+
+        Args:
+            datasets (Datasets): Inputs of the size being measured.
+            repeat (int): Number of timed runs.
+
+        Returns:
+            List[float]: Seconds taken by each run.
+        """
+        timings = []
+        for _ in range(repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                args = self.prepare(datasets)
+                gc.collect()
+                start = time.perf_counter()
+                self.run(*args)
+                timings.append(time.perf_counter() - start)
+        return timings
+
+
+def transform_step(step: str) -> Callable[[TransformMastery], None]:
+    """Returns a callable running one TransformMastery step on a prepared transformer."""
+    return lambda transformer: getattr(transformer, step)()
+
+
+def transformer_of(frame: Callable[[Datasets], pd.DataFrame]) -> Callable[[Datasets], Tuple[TransformMastery]]:
+    """Returns a prepare function handing a copy of a dataset to a TransformMastery that does not persist."""
+    return lambda datasets: (TransformMastery(dataframe=frame(datasets).copy(), persist=False),)
+
+
+def drop_and_rename(transformer: TransformMastery) -> None:
+    """Runs the first TransformMastery steps on a prepared transformer."""
+    transformer.drop_columns(COLUMNS_TO_DROP)
+    transformer.rename_columns()
+
+
+def mongo_benchmarks(client: MongoClient, max_rows: int) -> List[Benchmark]:
+    """
+    Builds the MongoDB load benchmarks: a first load of the final mastery data, and a reload of the same data, which
+    the diff-only load skips after comparing the content hashes.
+
+    Args:
+        client (MongoClient): Client of the database loaded by the benchmarks, real or mongomock.
+        max_rows (int): Largest size loaded into MongoDB.
+
+    Returns:
+        List[Benchmark]: The load benchmarks.
+    """
+    connector = MongoDBConnector()
+    connector.client = client
+
+    def load(data: pd.DataFrame) -> None:
+        connector.load_data(
+            DATABASE,
+            "mastery",
+            data,
+            ["puuid", "key"],
+            batch_size=MongoDB.BATCH_SIZE,
+            delete_missing=False,
+            chunk_size=Pipeline.CHUNK_SIZE,
+        )
+
+    def empty(datasets: Datasets) -> Tuple[pd.DataFrame]:
+        client.drop_database(DATABASE)
+        return (datasets.final_mastery,)
+
+    def loaded(datasets: Datasets) -> Tuple[pd.DataFrame]:
+        empty(datasets)
+        load(datasets.final_mastery)
+        return (datasets.final_mastery,)
+
+    return [
+        Benchmark("load.mongo.upsert", empty, load, max_rows),
+        Benchmark("load.mongo.unchanged", loaded, load, max_rows),
+    ]
+
+
+def benchmarks(client: MongoClient, mongo_max_rows: int) -> List[Benchmark]:
+    """
+    Lists every benchmark of the suite.
+
+    Args:
+        client (MongoClient): Client of the database loaded by the MongoDB benchmarks.
+        mongo_max_rows (int): Largest size loaded into MongoDB.
+
+    Returns:
+        List[Benchmark]: The benchmarks, in pipeline order.
+    """
+    raw = transformer_of(lambda datasets: datasets.raw_mastery)
+    renamed = transformer_of(lambda datasets: datasets.renamed_mastery)
+    return [
+        Benchmark("extract.champs.frame", lambda d: (d.champion_payload,), ExtractChamps.to_dataframe),
+        Benchmark("extract.items.frame", lambda d: (d.item_payload,), ExtractItems.to_dataframe),
+        Benchmark("transform.champs", lambda d: (d.raw_champions,), clean_champions),
+        Benchmark("transform.items", lambda d: (TransformItems(d.raw_items.copy(), persist=False),), lambda t: t.run()),
+        Benchmark("transform.mastery.drop_rename", raw, drop_and_rename),
+        Benchmark("transform.mastery.final", renamed, transform_step("calculate_final")),
+        Benchmark("transform.mastery.timestamp", renamed, transform_step("converter_timestamp")),
+        Benchmark("transform.mastery.rank", renamed, transform_step("create_rank_column")),
+        Benchmark("transform.mastery.run", raw, lambda t: t.run()),
+        Benchmark(
+            "join.champs",
+            lambda d: (JoinChamps(mastery=d.clean_mastery, persist=False, champions=d.champion_index),),
+            lambda join: join.run(),
+        ),
+        *mongo_benchmarks(client, mongo_max_rows),
+    ]
+
+
+def git_commit() -> Tuple[str, bool]:
+    """
+    Identifies the code being measured.
+
+    Returns:
+        Tuple[str, bool]: Hash of the current commit ("unknown" outside a git checkout) and whether the tree has
+            uncommitted changes.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout
+        status = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True, check=True).stdout
+        return commit.strip(), bool(status.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def run_suite(suite: List[Benchmark], sizes: List[str], repeat: int, seed: int) -> List[Dict[str, Any]]:
+    """
+    Runs the benchmarks at every size, printing each result as it is measured.
+
+    Args:
+        suite (List[Benchmark]): Benchmarks to run.
+        sizes (List[str]): Names of the sizes, keys of SIZES.
+        repeat (int): Number of timed runs of each benchmark.
+        seed (int): Seed of the generators.
+
+    Returns:
+        List[Dict[str, Any]]: One result per benchmark and size.
+    """
+    results = []
+    for size in sizes:
+        rows = SIZES[size]
+        datasets = Datasets(rows, seed)
+        print(f"📦 Size {size} ({rows} rows)")
+        for benchmark in suite:
+            if benchmark.max_rows is not None and rows > benchmark.max_rows:
+                print(f"⏭️ {benchmark.name:<32} skipped above {benchmark.max_rows} rows")
+                continue
+            timings = benchmark.measure(datasets, repeat)
+            result = {
+                "benchmark": benchmark.name,
+                "size": size,
+                "rows": rows,
+                "repeat": repeat,
+                "min": min(timings),
+                "median": statistics.median(timings),
+                "mean": statistics.fmean(timings),
+            }
+            results.append(result)
+            print(f"   {benchmark.name:<32} min {result['min']:9.4f}s  median {result['median']:9.4f}s")
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, threshold: float) -> int:
+    """
+    Compares the results with a previous run, by the minimum time of each benchmark and size.
+
+    Args:
+        results (List[Dict[str, Any]]): Results of this run.
+        baseline_path (str): Results file of the previous run.
+        threshold (float): Ratio of the times above which a benchmark counts as a regression, e.g. 1.1 for 10%.
+
+    Returns:
+        int: Number of regressions.
+    """
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    previous = {(result["benchmark"], result["size"]): result for result in baseline["results"]}
+
+    print(f"🔎 Compared with {baseline.get('commit', 'unknown')[:8]} ({baseline_path}):")
+    regressions = 0
+    for result in results:
+        before = previous.get((result["benchmark"], result["size"]))
+        if before is None:
+            continue
+        ratio = result["min"] / before["min"] if before["min"] else float("inf")
+        if ratio > threshold:
+            regressions += 1
+            mark = "⛔ slower"
+        elif ratio < 1 / threshold:
+            mark = "✅ faster"
+        else:
+            mark = "   same"
+        print(f"{mark} {result['benchmark']:<32} {result['size']:>5} {before['min']:9.4f}s -> {result['min']:9.4f}s")
+    return regressions
+
+
+def main() -> None:
+    """Runs the suite, saves its results and optionally compares them with a previous run."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["1k", "100k"], help="Dataset sizes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs of each benchmark.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the data generators.")
+    parser.add_argument("--filter", nargs="*", default=[], help="Only run benchmarks whose name contains one of these.")
+    parser.add_argument("--mongo-uri", help="MongoDB loaded by the load benchmarks; an in-process mongomock if unset.")
+    parser.add_argument(
+        "--mongo-max-rows",
+        type=int,
+        help="Largest size loaded into MongoDB; 100000 rows into a mongod, 1000 into the slower mongomock by default.",
+    )
+    parser.add_argument("--output", default="benchmarks/results", help="Directory of the results files.")
+    parser.add_argument("--compare", help="Results file of a previous run to compare with.")
+    parser.add_argument("--threshold", type=float, default=1.1, help="Slowdown ratio reported as a regression.")
+    args = parser.parse_args()
+
+    client = MongoClient(args.mongo_uri) if args.mongo_uri else mongomock.MongoClient()
+    suite = [
+        benchmark
+        for benchmark in benchmarks(client, args.mongo_max_rows or (100_000 if args.mongo_uri else 1_000))
+        if not args.filter or any(pattern in benchmark.name for pattern in args.filter)
+    ]
+    results = run_suite(suite, args.sizes, args.repeat, args.seed)
+
+    commit, dirty = git_commit()
+    started = datetime.now(timezone.utc)
+    report = {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": started.isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "mongodb": "mongod" if args.mongo_uri else "mongomock",
+        "results": results,
+    }
+    os.makedirs(args.output, exist_ok=True)
+    path = os.path.join(args.output, f"{started:%Y%m%dT%H%M%S}-{commit[:8]}.json")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"✅ Results Saved to {path}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
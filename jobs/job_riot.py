@@ -1,37 +1,57 @@
+import argparse
 import time
+from typing import Optional
 
+from pylegends.common import metrics
+from pylegends.common.mongodb import MongoClientManager
+from pylegends.common.profiling import MODES, Profiler
 from pylegends.processing import Processing
+from pylegends.utils.config import Pipeline, Profiling
 
 
 class ETLRiot:
     """Class responsible for managing the ETL Process.
 
-    This class encapsulates the ETL process, handles exceptions, and records execution time.
+    This class encapsulates the ETL process, handles exceptions, and records execution time. Every task and step runs as
+    a metrics stage nested in the job's; their JSON lines are printed as they finish and their totals are exported to
+    the configured Prometheus textfile or Pushgateway when the job ends.
 
     Attributes:
         etl_process (Processing): An instance of the Processing class to run the ETL process.
+        profiler (Optional[Profiler]): Profiler of the run, if profiling is enabled.
     """
 
-    def __init__(self) -> None:
-        """Initializes the ETLRiot class and prepares the ETL process."""
-        self.etl_process = Processing()
+    def __init__(self, max_workers: int = Pipeline.MAX_WORKERS, profiler: Optional[Profiler] = None) -> None:
+        """Initializes the ETLRiot class and prepares the ETL process.
+
+        Args:
+            max_workers (int): Maximum number of pipeline tasks run concurrently.
+            profiler (Optional[Profiler]): Profiles the run, or the tasks it selects; defaults to the `PROFILE_*`
+                settings when `PROFILE_MODE` is set.
+        """
+        self.etl_process = Processing(max_workers=max_workers)
+        self.profiler = profiler if profiler is not None else (Profiler() if Profiling.MODE else None)
 
     def run(self) -> None:
         """Runs the ETL process and handles exceptions.
 
         Starts the ETL process, records the execution time, and handles any exceptions that may occur during the
-        process.
+        process. The shared MongoDB client is kept open for the whole job and shut down when it ends.
         """
         start_time = time.monotonic()
 
         try:
-            self.etl_process.run()
+            with metrics.stage("ETLRiot"), MongoClientManager():
+                self.etl_process.run(self.profiler)
             self._log_success(start_time)
 
         except Exception as e:
             self._log_failure(e)
             raise
 
+        finally:
+            metrics.registry.export()
+
     @staticmethod
     def _log_success(start_time: float) -> None:
         """Records the execution time of the ETL process in case of success.
@@ -57,6 +77,8 @@ class ETLRiot:
 
         time_str = " ".join(time_parts)
         print(f"✅ Success! Total Execution Time of ETL JOB: 🕒 {time_str}")
+        for line in metrics.registry.summary():
+            print(f"🕒 {line}")
 
     @staticmethod
     def _log_failure(error: Exception) -> None:
@@ -69,5 +91,33 @@ class ETLRiot:
 
 
 if __name__ == "__main__":
-    etl_job = ETLRiot()
+    parser = argparse.ArgumentParser(description="Runs the PyLegends ETL job.")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=Pipeline.MAX_WORKERS,
+        help="Maximum number of pipeline tasks run concurrently.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=MODES,
+        default=Profiling.MODE,
+        help="Profiles the run with cProfile (cpu), tracemalloc (memory) or both (all); tasks then run sequentially.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=Profiling.DIR,
+        help="Directory where the profiling reports are written.",
+    )
+    parser.add_argument(
+        "--profile-tasks",
+        nargs="+",
+        default=list(Profiling.TASKS),
+        metavar="TASK",
+        help="Tasks profiled separately (champs, items, mastery); the whole run is profiled if omitted.",
+    )
+    args = parser.parse_args()
+
+    profiler = Profiler(args.profile, args.profile_dir, args.profile_tasks) if args.profile else None
+    etl_job = ETLRiot(max_workers=args.max_workers, profiler=profiler)
     etl_job.run()
@@ -0,0 +1,187 @@
+import contextvars
+import gzip
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from pylegends.common.http_client import get_http_client
+from pylegends.utils.config import Cache, LocalPathCache, Riot
+
+
+class DataDragonCache:
+    """
+    Patch-versioned on-disk cache of Data Dragon static payloads.
+
+    Static data such as `champion.json` and `item.json` only changes once per patch, so each payload is stored as
+    gzip-compressed JSON keyed by (version, lang, resource) and is never downloaded twice for the same patch.
+
+    Attributes:
+        base_url (str): Template of the Data Dragon static data URL.
+        root (str): Directory where the payloads are stored.
+        enabled (bool): Whether cached payloads are used; when False every fetch downloads and refreshes the cache.
+    """
+
+    base_url = "https://ddragon.leagueoflegends.com/cdn/{}/data/{}/{}.json"
+    languages_url = "https://ddragon.leagueoflegends.com/cdn/languages.json"
+
+    def __init__(self, root: str = LocalPathCache.DDRAGON, enabled: bool = Cache.DDRAGON_ENABLED) -> None:
+        """Initializes the cache with its root directory."""
+        self.root = root
+        self.enabled = enabled
+
+    def fetch(self, version: str, lang: str, resource: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Returns the payload of a resource, downloading it only when the patch is not cached yet.
+
+        Args:
+            version (str): Data Dragon version (patch).
+            lang (str): Locale of the payload, e.g. "en_US".
+            resource (str): Name of the resource, e.g. "champion" or "item".
+
+        Returns:
+            Tuple[Dict[str, Any], bool]: The payload and whether it was downloaded (False when served from the cache).
+        """
+        payload = self.get(version, lang, resource) if self.enabled else None
+        if payload is not None:
+            return payload, False
+
+        payload = get_http_client().get_json(self.base_url.format(version, lang, resource))
+        self.put(version, lang, resource, payload)
+        return payload, True
+
+    def fetch_many(
+        self,
+        version: str,
+        main: str,
+        langs: Iterable[str],
+        resource: str,
+        concurrency: int = Riot.LANG_CONCURRENCY,
+    ) -> Dict[str, Tuple[Dict[str, Any], bool]]:
+        """
+        Returns the payloads of a resource in a main locale and extra ones, downloading the ones not cached yet
+        concurrently.
+
+        Each download runs in a copy of the caller's context, so its HTTP calls are counted in the caller's stage. Only
+        a failure of the main locale is raised: extra locales that Data Dragon does not list in languages.json, or
+        whose download fails, are reported and left out.
+
+        Args:
+            version (str): Data Dragon version (patch).
+            main (str): Locale whose payload is required, e.g. "en_US".
+            langs (Iterable[str]): Extra locales of the payloads, e.g. ("pt_BR", "ko_KR").
+            resource (str): Name of the resource, e.g. "champion" or "item".
+            concurrency (int): Maximum number of payloads downloaded at the same time.
+
+        Returns:
+            Dict[str, Tuple[Dict[str, Any], bool]]: The payload of the main locale and of each extra locale fetched, in
+                the given order, and whether it was downloaded.
+        """
+        langs = list(dict.fromkeys([main, *langs]))
+        known = self.languages(version)
+        if known is not None:
+            unknown = [lang for lang in langs[1:] if lang not in known]
+            if unknown:
+                print(f"⚠️ Unknown Data Dragon Locales {unknown}, Skipping Them!")
+            langs = [lang for lang in langs if lang == main or lang in known]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(langs)))) as executor:
+            futures = {
+                lang: executor.submit(contextvars.copy_context().run, self.fetch, version, lang, resource)
+                for lang in langs
+            }
+            fetched = {}
+            for lang, future in futures.items():
+                try:
+                    fetched[lang] = future.result()
+                except Exception as err:
+                    if lang == main:
+                        raise
+                    print(f"⚠️ Failed to Get {resource.capitalize()} Data in {lang}, Skipping It: {err}")
+            return fetched
+
+    def languages(self, version: str) -> Optional[List[str]]:
+        """
+        Returns the locales served by Data Dragon, cached with the payloads of the patch.
+
+        The list only validates the configured locales, so failing to fetch or cache it never fails the extraction.
+
+        Args:
+            version (str): Data Dragon version (patch) the list is cached with.
+
+        Returns:
+            Optional[List[str]]: The locales, or None if the list cannot be fetched.
+        """
+        payload = self.get(version, "all", "languages") if self.enabled else None
+        if payload is not None:
+            return payload["languages"]
+
+        try:
+            payload = {"languages": get_http_client().get_json(self.languages_url)}
+        except (requests.RequestException, ValueError) as err:
+            print(f"⚠️ Unable to Get Data Dragon Locales, Not Validating Them: {err}")
+            return None
+        try:
+            self.put(version, "all", "languages", payload)
+        except OSError as err:
+            print(f"⚠️ Unable to Cache Data Dragon Locales: {err}")
+        return payload["languages"]
+
+    def get(self, version: str, lang: str, resource: str) -> Optional[Dict[str, Any]]:
+        """
+        Reads a cached payload.
+
+        Args:
+            version (str): Data Dragon version (patch).
+            lang (str): Locale of the payload.
+            resource (str): Name of the resource.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached payload, or None if it is not cached or cannot be read.
+        """
+        try:
+            with gzip.open(self.path_for(version, lang, resource), "rt", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, version: str, lang: str, resource: str, payload: Dict[str, Any]) -> None:
+        """
+        Stores a payload in the cache, replacing the file atomically.
+
+        Each write goes through a temporary file of its own, so extracts storing the same payload at the same time
+        (e.g. the locales list) do not collide.
+
+        Args:
+            version (str): Data Dragon version (patch).
+            lang (str): Locale of the payload.
+            resource (str): Name of the resource.
+            payload (Dict[str, Any]): Decoded JSON payload.
+        """
+        path = self.path_for(version, lang, resource)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=f"{resource}.", suffix=".tmp", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as file:
+                json.dump(payload, file)
+            os.replace(temp_path, path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+    def path_for(self, version: str, lang: str, resource: str) -> str:
+        """
+        Builds the cache path of a payload.
+
+        Args:
+            version (str): Data Dragon version (patch).
+            lang (str): Locale of the payload.
+            resource (str): Name of the resource.
+
+        Returns:
+            str: Path of the compressed payload.
+        """
+        return os.path.join(self.root, version, lang, f"{resource}.json.gz")
@@ -0,0 +1,233 @@
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from pylegends.common import metrics
+from pylegends.utils.config import Http, Riot
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter enforcing several (requests, seconds) windows at once.
+
+    Each window is a bucket holding up to `requests` tokens that refills continuously over `seconds`. A call to
+    acquire blocks until every bucket has a token available, matching Riot's per-second and per-two-minute app limits.
+
+    Attributes:
+        limits (Sequence[Tuple[int, float]]): The (requests, seconds) windows enforced by the limiter.
+    """
+
+    def __init__(self, limits: Sequence[Tuple[int, float]]) -> None:
+        """Initializes the limiter with full buckets for each of the given windows."""
+        self.limits = limits
+        self._tokens: List[float] = [float(capacity) for capacity, _ in limits]
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a request can be made without exceeding any of the windows, then consumes a token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    missing = [
+                        (1 - tokens) * period / capacity
+                        for tokens, (capacity, period) in zip(self._tokens, self.limits)
+                        if tokens < 1
+                    ]
+                    if not missing:
+                        self._tokens = [tokens - 1 for tokens in self._tokens]
+                        return
+                    wait = max(missing)
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Blocks every caller for the given number of seconds, e.g. after a 429 with a Retry-After header.
+
+        Args:
+            seconds (float): Time to wait before the next request is allowed.
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def _refill(self, now: float) -> None:
+        """Adds the tokens accumulated since the last update to each bucket."""
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = [
+            min(float(capacity), tokens + elapsed * capacity / period)
+            for tokens, (capacity, period) in zip(self._tokens, self.limits)
+        ]
+
+
+class HttpClient:
+    """
+    HTTP client shared by every extractor to call the Riot Games and Data Dragon APIs.
+
+    Keeps a single keep-alive session with a connection pool, applies a timeout to every request, retries connection
+    errors and retryable status codes with exponential backoff (honoring Retry-After) and throttles requests to the
+    Riot Games API hosts with one rate limiter per host.
+
+    Attributes:
+        session (requests.Session): Session holding the pooled connections.
+        timeout (float): Seconds to wait for the server to connect or send data.
+        max_retries (int): Number of retries of a request that failed with a retryable error.
+        backoff_factor (float): Base delay, in seconds, of the exponential backoff between retries.
+        limiters (Dict[str, RateLimiter]): Rate limiters of the Riot Games API hosts, by host name.
+    """
+
+    def __init__(
+        self,
+        timeout: float = Http.TIMEOUT,
+        max_retries: int = Http.MAX_RETRIES,
+        backoff_factor: float = Http.BACKOFF_FACTOR,
+        pool_size: int = Http.POOL_SIZE,
+    ) -> None:
+        """Initializes the session and mounts a pooled adapter for HTTP and HTTPS."""
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        """
+        Sends a GET request, retrying connection errors and retryable status codes.
+
+        Args:
+            url (str): URL to request.
+            headers (Optional[Dict[str, str]]): Extra headers of the request.
+            params (Optional[Dict[str, Any]]): Query string parameters of the request.
+
+        Returns:
+            requests.Response: The last response received, which may still carry an error status.
+        """
+        limiter = self.limiter_for(url)
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            if limiter is not None:
+                limiter.acquire()
+
+            metrics.record("http_calls")
+            try:
+                response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as err:
+                if last_attempt:
+                    raise
+                delay = self.backoff(attempt)
+                print(f"⚠️ Request to {urlparse(url).netloc} failed ({err}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in RETRY_STATUSES or last_attempt:
+                return response
+
+            delay = self.retry_after(response) or self.backoff(attempt)
+            if response.status_code == 429 and limiter is not None:
+                limiter.pause(delay)
+            print(f"⚠️ {urlparse(url).netloc} answered {response.status_code}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+        raise RuntimeError("Unreachable: the retry loop always returns or raises.")
+
+    def get_json(
+        self, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Sends a GET request and decodes its JSON body, raising for error statuses.
+
+        Args:
+            url (str): URL to request.
+            headers (Optional[Dict[str, str]]): Extra headers of the request.
+            params (Optional[Dict[str, Any]]): Query string parameters of the request.
+
+        Returns:
+            Any: The decoded JSON body.
+        """
+        response = self.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def limiter_for(self, url: str) -> Optional[RateLimiter]:
+        """
+        Returns the rate limiter of the URL's host, creating it on first use.
+
+        Args:
+            url (str): URL about to be requested.
+
+        Returns:
+            Optional[RateLimiter]: The host's limiter, or None for hosts that are not rate limited (e.g. Data Dragon).
+        """
+        host = urlparse(url).hostname or ""
+        if not host.endswith(Riot.API_DOMAIN):
+            return None
+        with self._lock:
+            if host not in self.limiters:
+                self.limiters[host] = RateLimiter(Riot.RATE_LIMITS)
+            return self.limiters[host]
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Computes the exponential backoff delay of a retry, with jitter.
+
+        Args:
+            attempt (int): Zero-based number of the attempt that failed.
+
+        Returns:
+            float: Seconds to wait before the next attempt.
+        """
+        delay = self.backoff_factor * (2**attempt)
+        return min(Http.MAX_BACKOFF, delay + random.uniform(0, self.backoff_factor))
+
+    @staticmethod
+    def retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Reads the Retry-After header of a response.
+
+        Args:
+            response (requests.Response): Response of the failed attempt.
+
+        Returns:
+            Optional[float]: Seconds requested by the server, or None if the header is missing or not numeric.
+        """
+        value = response.headers.get("Retry-After")
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Returns the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        HttpClient: The shared HTTP client.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,308 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+import requests
+
+from pylegends.utils.config import Http, Metrics
+
+COUNTERS = ("rows_in", "rows_out", "bytes_read", "bytes_written", "http_calls", "mongo_ops")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_current: ContextVar[Optional["StageMetrics"]] = ContextVar("pylegends_stage", default=None)
+
+
+class StageMetrics:
+    """
+    Duration and counters of one run of a pipeline stage.
+
+    The counters recorded while a stage runs are added to it and to every stage enclosing it, so that a task reports
+    the totals of its steps:
+
+    - rows_in: rows read from data files or handed over in memory.
+    - rows_out: rows written to data files or MongoDB.
+    - bytes_read / bytes_written: size of the data files read and written.
+    - http_calls: requests sent to the Riot Games and Data Dragon APIs, retries included.
+    - mongo_ops: requests sent to MongoDB (bulk writes, queries, deletes, index and version updates).
+
+    Attributes:
+        name (str): Name of the stage, e.g. the class whose run it measures.
+        parent (Optional[StageMetrics]): Stage that was running when this one started.
+        counters (Dict[str, int]): Value of each counter.
+        started_at (float): Epoch time at which the stage started.
+        duration (float): Seconds the stage took, once finished.
+        status (str): "running", "success" or "failed".
+    """
+
+    def __init__(self, name: str, parent: Optional["StageMetrics"] = None) -> None:
+        """Initializes a running stage with every counter at zero."""
+        self.name = name
+        self.parent = parent
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.started_at = time.time()
+        self.duration = 0.0
+        self.status = "running"
+        self._lock = threading.Lock()
+
+    def add(self, counter: str, value: int = 1) -> None:
+        """
+        Increments a counter; stages may be updated from several threads at once.
+
+        Args:
+            counter (str): One of COUNTERS.
+            value (int): Amount added to the counter.
+        """
+        with self._lock:
+            self.counters[counter] += value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the stage into the record printed as a JSON line.
+
+        Returns:
+            Dict[str, Any]: Name, parent, status, start, duration and counters of the stage.
+        """
+        return {
+            "event": "stage",
+            "stage": self.name,
+            "parent": self.parent.name if self.parent else None,
+            "status": self.status,
+            "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            "duration_s": round(self.duration, 6),
+            **self.counters,
+        }
+
+
+class MetricsRegistry:
+    """
+    Collects the stages finished in the process and exports them.
+
+    Each finished stage is printed as a JSON line; at the end of the job the totals of each stage name can be written
+    to a Prometheus textfile (for the node exporter textfile collector) or pushed to a Prometheus Pushgateway.
+
+    Attributes:
+        enabled (bool): Whether stages are recorded at all.
+        log (bool): Whether each finished stage is printed as a JSON line.
+        stages (List[StageMetrics]): Stages finished so far, in finishing order.
+    """
+
+    def __init__(self, enabled: bool = Metrics.ENABLED, log: bool = Metrics.LOG) -> None:
+        """Initializes an empty registry."""
+        self.enabled = enabled
+        self.log = log
+        self.stages: List[StageMetrics] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Optional[StageMetrics]]:
+        """
+        Measures the code run inside the context as a stage nested in the current one.
+
+        Args:
+            name (str): Name of the stage.
+
+        Returns:
+            Iterator[Optional[StageMetrics]]: The running stage, or None if metrics are disabled.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        metrics = StageMetrics(name, _current.get())
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            yield metrics
+            metrics.status = "success"
+        except BaseException:
+            metrics.status = "failed"
+            raise
+        finally:
+            metrics.duration = time.perf_counter() - start
+            _current.reset(token)
+            self.finish(metrics)
+
+    def finish(self, metrics: StageMetrics) -> None:
+        """
+        Keeps a finished stage and prints it as a JSON line.
+
+        Args:
+            metrics (StageMetrics): The finished stage.
+        """
+        with self._lock:
+            self.stages.append(metrics)
+        if self.log:
+            print(json.dumps(metrics.to_dict()))
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Sums the finished stages by name.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Runs, failures, duration and counters of each stage name.
+        """
+        totals: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            stages = list(self.stages)
+        for metrics in stages:
+            empty = {"runs": 0, "failures": 0, "duration": 0.0, **dict.fromkeys(COUNTERS, 0)}
+            total = totals.setdefault(metrics.name, empty)
+            for counter, value in metrics.counters.items():
+                total[counter] += value
+            total["runs"] += 1
+            total["failures"] += metrics.status == "failed"
+            total["duration"] += metrics.duration
+        return totals
+
+    def summary(self, limit: int = 5) -> List[str]:
+        """
+        Describes the stages that took the longest, to spot the bottleneck of a run.
+
+        Args:
+            limit (int): Maximum number of stages described.
+
+        Returns:
+            List[str]: One line per stage name, slowest first.
+        """
+        totals = sorted(self.totals().items(), key=lambda item: item[1]["duration"], reverse=True)
+        return [
+            f"{name}: {total['duration']:.1f}s in {int(total['runs'])} run(s), "
+            f"{int(total['rows_in'])} rows in, {int(total['rows_out'])} rows out"
+            for name, total in totals[:limit]
+        ]
+
+    def to_prometheus(self) -> str:
+        """
+        Renders the totals of each stage name in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, one sample per stage name and metric.
+        """
+        totals = self.totals()
+        metrics = [
+            ("runs", "Runs of the stage."),
+            ("failures", "Failed runs of the stage."),
+            ("duration", "Seconds spent running the stage."),
+        ]
+        metrics.extend((counter, f"Total {counter.replace('_', ' ')} of the stage.") for counter in COUNTERS)
+
+        lines = []
+        for metric, description in metrics:
+            name = f"pylegends_stage_{metric}{'_seconds' if metric == 'duration' else ''}_total"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(f'{name}{{stage="{stage}"}} {total[metric]:g}' for stage, total in sorted(totals.items()))
+        return "\n".join(lines) + "\n"
+
+    def export(
+        self, textfile: Optional[str] = Metrics.TEXTFILE, pushgateway: Optional[str] = Metrics.PUSHGATEWAY
+    ) -> None:
+        """
+        Writes the Prometheus textfile and pushes to the Pushgateway, if configured. Failures are reported, not raised,
+        so that metrics never fail the job.
+
+        Args:
+            textfile (Optional[str]): Path of the Prometheus textfile, replaced atomically.
+            pushgateway (Optional[str]): Base URL of the Pushgateway; the metrics are grouped by `Metrics.JOB`.
+        """
+        if not self.enabled or not (textfile or pushgateway):
+            return
+        payload = self.to_prometheus()
+
+        if textfile:
+            try:
+                os.makedirs(os.path.dirname(textfile) or ".", exist_ok=True)
+                temp_path = f"{textfile}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as file:
+                    file.write(payload)
+                os.replace(temp_path, textfile)
+            except OSError as err:
+                print(f"⚠️ Unable to Write the Metrics Textfile {textfile}: {err}")
+
+        if pushgateway:
+            try:
+                response = requests.put(
+                    f"{pushgateway.rstrip('/')}/metrics/job/{Metrics.JOB}",
+                    data=payload.encode("utf-8"),
+                    headers={"Content-Type": "text/plain; version=0.0.4"},
+                    timeout=Http.TIMEOUT,
+                )
+                response.raise_for_status()
+            except Exception as err:
+                print(f"⚠️ Unable to Push the Metrics to {pushgateway}: {err}")
+
+
+registry = MetricsRegistry()
+
+
+def stage(name: str) -> Any:
+    """
+    Measures the code run inside the context as a stage of the process-wide registry.
+
+    Example:
+        with metrics.stage("job"):
+            Processing().run()
+
+    Args:
+        name (str): Name of the stage.
+
+    Returns:
+        Any: Context manager yielding the running StageMetrics, or None if metrics are disabled.
+    """
+    return registry.stage(name)
+
+
+def instrument(func: F) -> F:
+    """
+    Decorates a run method so that every call is measured as a stage named after its class, e.g. "TransformMastery".
+
+    Args:
+        func (F): The function to measure; placed under @staticmethod or @classmethod when combined with them.
+
+    Returns:
+        F: The measured function.
+    """
+    name = func.__qualname__.rsplit(".", 1)[0] if "." in func.__qualname__ else func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with registry.stage(name):
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def record(counter: str, value: int = 1) -> None:
+    """
+    Adds a value to a counter of the running stage and of every stage enclosing it; does nothing outside a stage.
+
+    Args:
+        counter (str): One of COUNTERS.
+        value (int): Amount added to the counter.
+    """
+    metrics = _current.get()
+    while metrics is not None:
+        metrics.add(counter, value)
+        metrics = metrics.parent
+
+
+def file_size(path: str) -> int:
+    """
+    Measures a data file, or the part files of a directory artifact.
+
+    Args:
+        path (str): Path of the file or directory.
+
+    Returns:
+        int: Size in bytes, or 0 if it does not exist.
+    """
+    if os.path.isdir(path):
+        return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+    return os.path.getsize(path) if os.path.exists(path) else 0
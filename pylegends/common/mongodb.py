@@ -1,17 +1,100 @@
+import hashlib
+import json
 import os
-from typing import Any, Dict
+import threading
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
 
+import numpy as np
 import pandas as pd
-from pymongo import MongoClient
+from pymongo import IndexModel, MongoClient, ReplaceOne, ReturnDocument, UpdateOne
+from pymongo.results import BulkWriteResult
+
+from pylegends.common import metrics
+from pylegends.common.storage import FrameStorage
+from pylegends.utils.config import MongoDB
+
+KeyNames = Union[str, Sequence[str]]
+
+
+class MongoClientManager:
+    """
+    Process-wide manager of a single pooled MongoClient shared by every loader.
+
+    The client is created on first use with the pool size, write concern and compressors defined in the config, and is
+    reused until the outermost context exits or shutdown is called. Contexts can be nested: only the outermost one
+    closes the client.
+
+    Example:
+        with MongoClientManager() as client:
+            client["pylegends"]["champs"].find_one()
+    """
+
+    _client: Optional[MongoClient] = None
+    _depth: int = 0
+    _lock = threading.Lock()
+
+    def __enter__(self) -> MongoClient:
+        """Opens a managed scope and returns the shared client."""
+        with MongoClientManager._lock:
+            MongoClientManager._depth += 1
+        return self.get_client()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the managed scope, shutting the shared client down when it is the outermost one."""
+        with MongoClientManager._lock:
+            MongoClientManager._depth -= 1
+            outermost = MongoClientManager._depth == 0
+        if outermost:
+            self.shutdown()
+
+    @classmethod
+    def get_client(cls) -> MongoClient:
+        """
+        Returns the shared client, creating it on first use.
+
+        Returns:
+            MongoClient: The pooled client shared across the process.
+        """
+        with cls._lock:
+            if cls._client is None:
+                connection_string = os.getenv("MONGODB_CONNECTION_STRING")
+                if connection_string is None:
+                    raise ValueError("MONGODB_CONNECTION_STRING environment variable is not set.")
+                cls._client = MongoClient(
+                    connection_string,
+                    maxPoolSize=MongoDB.MAX_POOL_SIZE,
+                    minPoolSize=MongoDB.MIN_POOL_SIZE,
+                    w=cls._write_concern(MongoDB.WRITE_CONCERN),
+                    compressors=MongoDB.COMPRESSORS,
+                )
+            return cls._client
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Closes the shared client and its connection pool."""
+        with cls._lock:
+            if cls._client is not None:
+                cls._client.close()
+                cls._client = None
+
+    @staticmethod
+    def _write_concern(value: str) -> Union[int, str]:
+        """Converts the configured write concern into the type expected by MongoClient."""
+        return int(value) if value.isdigit() else value
 
 
 class MongoDBConnector:
     """A class for connecting to MongoDB and writing data to a specified collection."""
 
     def __init__(self) -> None:
-        """Initializes the connection to MongoDB using the provided connection string."""
+        """Initializes the connector; the client is borrowed from the shared MongoClientManager on connect."""
         self.client = None
-        self.connection_string = os.getenv("MONGODB_CONNECTION_STRING")
 
     def run(self, db_name: str, collection_name: str, file_path: str, unique_key_name: str) -> None:
         """Runs the MongoDB loading process."""
@@ -20,15 +103,12 @@ class MongoDBConnector:
         self.close()
 
     def connect(self):
-        """Establishes connection to MongoDB using the connection string."""
-        if self.connection_string is None:
-            raise ValueError("MONGODB_CONNECTION_STRING environment variable is not set.")
-        self.client = MongoClient(self.connection_string)
+        """Borrows the shared, pooled MongoDB client."""
+        self.client = MongoClientManager.get_client()
 
     def close(self):
-        """Closes the connection to MongoDB."""
-        if hasattr(self, "client"):
-            self.client.close()
+        """Releases the shared client; the pool itself is closed by MongoClientManager at the end of the job."""
+        self.client = None
 
     def write_data(self, db_name: str, collection_name: str, data: Dict[str, Any], key: Dict[str, Any]) -> None:
         """Overwrites data in the specified MongoDB collection if the document with the given key exists,
@@ -36,21 +116,386 @@ class MongoDBConnector:
         db = self.client[db_name]
         collection = db[collection_name]
         collection.replace_one(key, data, upsert=True)
+        metrics.record("mongo_ops")
 
-    def load_data(self, db_name: str, collection_name: str, file_path: str, unique_key_name: str) -> None:
-        """Loads data from a CSV file into the specified MongoDB collection, overwriting existing documents.
+    def write_batch(self, db_name: str, collection_name: str, operations: List[ReplaceOne]) -> BulkWriteResult:
+        """
+        Sends a batch of replace operations to the collection in a single unordered bulk write.
 
         Args:
             db_name (str): The name of the database.
             collection_name (str): The name of the collection.
-            file_path (str): The file path of the CSV to load.
-            unique_key_name (str): The name of the unique key in the CSV file.
+            operations (List[ReplaceOne]): Upsert operations to be executed.
+
+        Returns:
+            BulkWriteResult: The result reported by MongoDB for the batch.
         """
-        data = pd.read_csv(file_path)
-        records = data.to_dict(orient="records")
+        collection = self.client[db_name][collection_name]
+        metrics.record("mongo_ops")
+        return collection.bulk_write(operations, ordered=False)
+
+    def load_data(
+        self,
+        db_name: str,
+        collection_name: str,
+        file_path: Union[str, pd.DataFrame, Iterable[pd.DataFrame]],
+        unique_key_name: KeyNames,
+        bulk: bool = True,
+        batch_size: int = MongoDB.BATCH_SIZE,
+        diff_only: bool = MongoDB.DIFF_ONLY,
+        delete_missing: bool = MongoDB.DELETE_MISSING,
+        chunk_size: Optional[int] = None,
+    ) -> None:
+        """Loads data from a data file into the specified MongoDB collection, overwriting existing documents.
 
-        for record in records:
-            key = {unique_key_name: record[unique_key_name]}
-            self.write_data(db_name, collection_name, record, key)
+        Args:
+            db_name (str): The name of the database.
+            collection_name (str): The name of the collection.
+            file_path (Union[str, pd.DataFrame, Iterable[pd.DataFrame]]): The path of the data file to load, without
+                extension, the data itself when it is already in memory, or an iterable of chunks of the data.
+            unique_key_name (KeyNames): The name of the unique key in the data file, or the names of a compound key.
+            bulk (bool): Whether to group the upserts into bulk writes instead of one request per record.
+            batch_size (int): Number of upserts sent in each bulk write.
+            diff_only (bool): Whether to skip records whose content hash matches the one stored on the last load.
+            delete_missing (bool): Whether to delete documents whose keys are no longer present in the file.
+            chunk_size (Optional[int]): Maximum number of rows converted and written at a time; the whole data at once
+                if None.
+        """
+        loaded: set = set()
+        changes = 0
+        for number, chunk in enumerate(self.iter_chunks(file_path, chunk_size), start=1):
+            if number > 1:
+                print(f"🧩 {collection_name.upper()}: chunk {number} ({len(chunk)} rows)")
+            ids, written = self.load_chunk(
+                db_name, collection_name, chunk, unique_key_name, bulk, batch_size, diff_only
+            )
+            loaded.update(ids)
+            changes += written
 
+        if delete_missing:
+            changes += self.delete_missing(db_name, collection_name, unique_key_name, loaded, batch_size)
+
+        if changes:
+            self.bump_version(db_name, collection_name)
         print(f"✅ Data Successfully Loaded into the Collection {collection_name.upper()}!")
+
+    @staticmethod
+    def iter_chunks(
+        data: Union[str, pd.DataFrame, Iterable[pd.DataFrame]], chunk_size: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Splits the data to be loaded into chunks of at most chunk_size rows, recording the rows handed over in memory.
+
+        Args:
+            data (Union[str, pd.DataFrame, Iterable[pd.DataFrame]]): Path of a data file, a DataFrame or its chunks.
+            chunk_size (Optional[int]): Maximum number of rows of each chunk; one chunk with all the rows if None.
+
+        Returns:
+            Iterator[pd.DataFrame]: The chunks of the data.
+        """
+        if isinstance(data, str):
+            storage = FrameStorage()
+            if chunk_size:
+                yield from storage.iter_frames(data, chunk_size)
+            else:
+                yield storage.read(data)
+        elif isinstance(data, pd.DataFrame):
+            metrics.record("rows_in", len(data))
+            step = chunk_size or max(len(data), 1)
+            for start in range(0, len(data), step):
+                yield data.iloc[start : start + step]
+        else:
+            for chunk in data:
+                metrics.record("rows_in", len(chunk))
+                yield chunk
+
+    def load_chunk(
+        self,
+        db_name: str,
+        collection_name: str,
+        data: pd.DataFrame,
+        unique_key_name: KeyNames,
+        bulk: bool = True,
+        batch_size: int = MongoDB.BATCH_SIZE,
+        diff_only: bool = MongoDB.DIFF_ONLY,
+    ) -> Tuple[List[Any], int]:
+        """
+        Upserts the records of one chunk of data, skipping the unchanged ones when diff_only is set.
+
+        Args:
+            db_name (str): The name of the database.
+            collection_name (str): The name of the collection.
+            data (pd.DataFrame): Records to be loaded.
+            unique_key_name (KeyNames): The name of the unique key, or the names of a compound key.
+            bulk (bool): Whether to group the upserts into bulk writes instead of one request per record.
+            batch_size (int): Number of upserts sent in each bulk write.
+            diff_only (bool): Whether to skip records whose content hash matches the one stored on the last load.
+
+        Returns:
+            Tuple[List[Any], int]: Hash collection identifiers of the records in the chunk and number of records
+                written.
+        """
+        records = [self.to_document(record) for record in data.to_dict(orient="records")]
+        ids = [self.key_id(record, unique_key_name) for record in records]
+        hashes = {key_id: self.record_hash(record) for key_id, record in zip(ids, records)}
+        to_write = list(zip(ids, records))
+
+        if diff_only:
+            stored = self.read_hashes(db_name, collection_name, list(hashes), batch_size)
+            to_write = [(key_id, record) for key_id, record in to_write if stored.get(key_id) != hashes[key_id]]
+            print(
+                f"🔎 {collection_name.upper()}: {len(to_write)} new or changed records, "
+                f"{len(records) - len(to_write)} unchanged."
+            )
+
+        if bulk:
+            self.bulk_load(db_name, collection_name, [record for _, record in to_write], unique_key_name, batch_size)
+        else:
+            for _, record in to_write:
+                self.write_data(db_name, collection_name, record, self.key_filter(record, unique_key_name))
+
+        written = {key_id: (hashes[key_id], self.key_filter(record, unique_key_name)) for key_id, record in to_write}
+        self.write_hashes(db_name, collection_name, written, batch_size)
+        metrics.record("rows_out", len(to_write))
+        return ids, len(to_write)
+
+    def bulk_load(
+        self,
+        db_name: str,
+        collection_name: str,
+        records: List[Dict[str, Any]],
+        unique_key_name: KeyNames,
+        batch_size: int = MongoDB.BATCH_SIZE,
+    ) -> None:
+        """
+        Upserts the records in batches of unordered bulk writes, reporting the counts of each batch.
+
+        Args:
+            db_name (str): The name of the database.
+            collection_name (str): The name of the collection.
+            records (List[Dict[str, Any]]): Documents to be written.
+            unique_key_name (KeyNames): The name of the field, or fields, that identify each document.
+            batch_size (int): Number of upserts sent in each bulk write.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        for number, start in enumerate(range(0, len(records), batch_size), start=1):
+            batch = records[start : start + batch_size]
+            operations = [ReplaceOne(self.key_filter(record, unique_key_name), record, upsert=True) for record in batch]
+            result = self.write_batch(db_name, collection_name, operations)
+            print(
+                f"📦 Batch {number} ({len(operations)} records) into {collection_name.upper()}: "
+                f"matched={result.matched_count}, upserted={result.upserted_count}, "
+                f"modified={result.modified_count}"
+            )
+
+    @classmethod
+    def to_document(cls, value: Any) -> Any:
+        """
+        Converts a record read from a data file into BSON-encodable Python types.
+
+        Lists read from Parquet arrive as NumPy arrays and missing timestamps as NaT; both are converted, recursively,
+        into lists and None.
+
+        Args:
+            value (Any): Record, or one of its values.
+
+        Returns:
+            Any: The converted value.
+        """
+        if isinstance(value, dict):
+            return {key: cls.to_document(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return [cls.to_document(item) for item in value]
+        if value is pd.NaT:
+            return None
+        if isinstance(value, pd.Timestamp):
+            return value.to_pydatetime()
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    @staticmethod
+    def key_filter(record: Dict[str, Any], unique_key_name: KeyNames) -> Dict[str, Any]:
+        """
+        Builds the filter that matches the document of a record.
+
+        Args:
+            record (Dict[str, Any]): Document being loaded.
+            unique_key_name (KeyNames): The name of the field, or fields, that identify each document.
+
+        Returns:
+            Dict[str, Any]: Equality filter on the key fields.
+        """
+        names = [unique_key_name] if isinstance(unique_key_name, str) else unique_key_name
+        return {name: record[name] for name in names}
+
+    @staticmethod
+    def key_id(record: Dict[str, Any], unique_key_name: KeyNames) -> Any:
+        """
+        Builds the identifier of a record in the hash side collection.
+
+        Args:
+            record (Dict[str, Any]): Document being loaded.
+            unique_key_name (KeyNames): The name of the field, or fields, that identify each document.
+
+        Returns:
+            Any: The key value itself, or its values joined by "|" for compound keys.
+        """
+        if isinstance(unique_key_name, str):
+            return record[unique_key_name]
+        return "|".join(str(record[name]) for name in unique_key_name)
+
+    @staticmethod
+    def record_hash(record: Dict[str, Any]) -> str:
+        """
+        Computes a stable content hash for a record, independent of the order of its fields.
+
+        Args:
+            record (Dict[str, Any]): Document whose content will be hashed.
+
+        Returns:
+            str: The SHA-256 hex digest of the record.
+        """
+        payload = json.dumps(record, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def read_hashes(
+        self, db_name: str, collection_name: str, keys: List[Any], batch_size: int = MongoDB.BATCH_SIZE
+    ) -> Dict[Any, str]:
+        """
+        Reads the content hashes stored on previous loads for the given keys.
+
+        Args:
+            db_name (str): The name of the database.
+            collection_name (str): The name of the collection whose hashes will be read.
+            keys (List[Any]): Unique keys of the records being loaded.
+            batch_size (int): Number of keys looked up in each query.
+
+        Returns:
+            Dict[Any, str]: Mapping of each known key to its stored hash.
+        """
+        hash_collection = self.client[db_name][collection_name + MongoDB.HASH_SUFFIX]
+        stored = {}
+        for start in range(0, len(keys), batch_size):
+            for document in hash_collection.find({"_id": {"$in": keys[start : start + batch_size]}}):
+                stored[document["_id"]] = document["hash"]
+            metrics.record("mongo_ops")
+        return stored
+
+    def write_hashes(
+        self,
+        db_name: str,
+        collection_name: str,
+        hashes: Dict[Any, Tuple[str, Dict[str, Any]]],
+        batch_size: int = MongoDB.BATCH_SIZE,
+    ) -> None:
+        """
+        Stores the content hashes of the records written to the collection.
+
+        Args:
+            db_name (str): The name of the database.
+            collection_name (str): The name of the collection the records were written to.
+            hashes (Dict[Any, Tuple[str, Dict[str, Any]]]): Content hash and key filter of each written record.
+            batch_size (int): Number of hashes sent in each bulk write.
+        """
+        hash_collection = self.client[db_name][collection_name + MongoDB.HASH_SUFFIX]
+        operations = [
+            UpdateOne({"_id": key_id}, {"$set": {"hash": value, "key": key}}, upsert=True)
+            for key_id, (value, key) in hashes.items()
+        ]
+        for start in range(0, len(operations), batch_size):
+            hash_collection.bulk_write(operations[start : start + batch_size], ordered=False)
+            metrics.record("mongo_ops")
+
+    def delete_missing(
+        self,
+        db_name: str,
+        collection_name: str,
+        unique_key_name: KeyNames,
+        keys: set,
+        batch_size: int = MongoDB.BATCH_SIZE,
+    ) -> int:
+        """
+        Deletes the documents loaded on previous runs whose keys are no longer present in the source.
+
+        Args:
+            db_name (str): The name of the database.
+            collection_name (str): The name of the collection.
+            unique_key_name (KeyNames): The name of the field, or fields, that identify each document.
+            keys (set): Hash collection identifiers of the records present in the current source.
+            batch_size (int): Number of documents removed by each delete.
+
+        Returns:
+            int: Number of documents deleted.
+        """
+        hash_collection = self.client[db_name][collection_name + MongoDB.HASH_SUFFIX]
+        documents = hash_collection.find({}, {"_id": 1, "key": 1})
+        vanished = [document for document in documents if document["_id"] not in keys]
+        metrics.record("mongo_ops")
+        for start in range(0, len(vanished), batch_size):
+            batch = vanished[start : start + batch_size]
+            filters = [document.get("key") or {unique_key_name: document["_id"]} for document in batch]
+            self.client[db_name][collection_name].delete_many({"$or": filters})
+            hash_collection.delete_many({"_id": {"$in": [document["_id"] for document in batch]}})
+            metrics.record("mongo_ops", 2)
+        print(f"🧹 {collection_name.upper()}: {len(vanished)} vanished records deleted.")
+        return len(vanished)
+
+    def drop_unkeyed(self, db_name: str, collection_name: str, unique_key_name: KeyNames) -> int:
+        """
+        Deletes the documents that lack a key field, left by loads keyed differently, and clears the stored hashes.
+
+        Unique indexes on the key would otherwise fail on the repeated null keys of those documents. Without their
+        hashes, the next load rewrites every document once.
+
+        Args:
+            db_name (str): The name of the database.
+            collection_name (str): The name of the collection.
+            unique_key_name (KeyNames): The name of the field, or fields, that identify each document.
+
+        Returns:
+            int: Number of documents deleted.
+        """
+        names = [unique_key_name] if isinstance(unique_key_name, str) else unique_key_name
+        result = self.client[db_name][collection_name].delete_many({"$or": [{name: None} for name in names]})
+        metrics.record("mongo_ops")
+        if result.deleted_count:
+            self.client[db_name].drop_collection(collection_name + MongoDB.HASH_SUFFIX)
+            self.bump_version(db_name, collection_name)
+            metrics.record("mongo_ops")
+            print(f"🧹 {collection_name.upper()}: {result.deleted_count} unkeyed documents deleted, hashes reset.")
+        return result.deleted_count
+
+    def create_indexes(self, db_name: str, collection_name: str, indexes: List[IndexModel]) -> None:
+        """
+        Creates the indexes of a collection; indexes that already exist are left as they are.
+
+        Args:
+            db_name (str): The name of the database.
+            collection_name (str): The name of the collection.
+            indexes (List[IndexModel]): Indexes used by the readers of the collection.
+        """
+        self.client[db_name][collection_name].create_indexes(indexes)
+        metrics.record("mongo_ops")
+
+    def bump_version(self, db_name: str, collection_name: str) -> int:
+        """
+        Increments the load version of a collection, which readers poll to detect that its data changed.
+
+        Args:
+            db_name (str): The name of the database.
+            collection_name (str): The name of the collection that changed.
+
+        Returns:
+            int: The new version of the collection.
+        """
+        document = self.client[db_name][MongoDB.META_COLLECTION].find_one_and_update(
+            {"_id": collection_name},
+            {"$inc": {"version": 1}, "$currentDate": {"updated_at": True}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        metrics.record("mongo_ops")
+        return document["version"]
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Optional
+
+
+class ProcessedMarker:
+    """
+    Data Dragon patch and locales whose static data was transformed and loaded successfully.
+
+    The marker is written only after the load, so a run whose transform or load fails processes the same patch again,
+    even though its payloads are already cached and extracted.
+
+    Attributes:
+        file_path (str): Path of the JSON marker file.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """Initializes the marker with the path of its file."""
+        self.file_path = file_path
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """
+        Reads the marker file.
+
+        Returns:
+            Optional[Dict[str, Any]]: The processed 'version' and 'langs', or None if nothing was processed yet or the
+                file cannot be read.
+        """
+        try:
+            with open(self.file_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def is_processed(self, version: str, langs: Iterable[str]) -> bool:
+        """
+        Checks whether a patch was already processed in the given locales.
+
+        Args:
+            version (str): Data Dragon version (patch).
+            langs (Iterable[str]): Locales of the extracted data.
+
+        Returns:
+            bool: true if the marker holds the same patch and locales.
+        """
+        return self.read() == self.entry(version, langs)
+
+    def write(self, version: str, langs: Iterable[str]) -> None:
+        """
+        Records a patch as processed, replacing the file atomically through a temporary file of its own.
+
+        Args:
+            version (str): Data Dragon version (patch).
+            langs (Iterable[str]): Locales of the processed data.
+        """
+        directory = os.path.dirname(self.file_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix="processed.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(self.entry(version, langs), file, indent=2)
+            os.replace(temp_path, self.file_path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def entry(version: str, langs: Iterable[str]) -> Dict[str, Any]:
+        """Builds the content of the marker file."""
+        return {"version": version, "langs": sorted(langs)}
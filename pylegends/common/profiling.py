@@ -0,0 +1,222 @@
+import cProfile
+import functools
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from pylegends.utils.config import Profiling
+
+MODES = ("cpu", "memory", "all")
+
+# Since Python 3.12 cProfile is built on sys.monitoring and already records every thread of the process.
+PROFILES_ALL_THREADS = sys.version_info >= (3, 12)
+
+
+class Profiler:
+    """
+    Profiles pipeline runs with cProfile and/or tracemalloc, writing one set of reports per profiled stage.
+
+    For each stage, the CPU profile is dumped to `<name>.prof` (readable with pstats or snakeviz) and the allocation
+    sites with the most memory still allocated when the stage ended are written to `<name>.memory.txt`; a short summary
+    of the hottest functions and of the peak memory is printed. tracemalloc traces the whole process, and so does
+    cProfile from Python 3.12 on; on older versions, each thread started while a stage is profiled (e.g. the worker
+    pools of ExtractMastery and DataDragonCache.fetch_many) gets its own cProfile, merged into the stage's report.
+    Since both profilers see every thread, profiled runs execute their tasks one at a time, so that the profile of a
+    task does not hold the work of the tasks running next to it.
+
+    Attributes:
+        mode (str): "cpu", "memory" or "all".
+        output_dir (str): Directory where the reports are written.
+        tasks (List[str]): Tasks profiled separately; the whole run is profiled as one stage if empty.
+        top (int): Number of functions and allocation sites listed in the summaries.
+    """
+
+    def __init__(
+        self,
+        mode: str = Profiling.MODE or "all",
+        output_dir: str = Profiling.DIR,
+        tasks: Iterable[str] = Profiling.TASKS,
+        top: int = Profiling.TOP,
+    ) -> None:
+        """Initializes the profiler; nothing is measured until a stage is profiled."""
+        if mode not in MODES:
+            raise ValueError(f"Unsupported profiling mode: {mode}. Expected one of {list(MODES)}.")
+        self.mode = mode
+        self.output_dir = output_dir
+        self.tasks = list(tasks)
+        self.top = top
+
+    @property
+    def cpu(self) -> bool:
+        """Whether the stages are profiled with cProfile."""
+        return self.mode in ("cpu", "all")
+
+    @property
+    def memory(self) -> bool:
+        """Whether the stages are traced with tracemalloc."""
+        return self.mode in ("memory", "all")
+
+    def selects(self, task: str) -> bool:
+        """
+        Checks whether a task is profiled separately.
+
+        Args:
+            task (str): Name of the task in the scheduler.
+
+        Returns:
+            bool: true if the task was selected.
+        """
+        return task in self.tasks
+
+    def wrap(self, name: str, task: Callable[[], object]) -> Callable[[], object]:
+        """
+        Wraps a task so that each of its runs is profiled as a stage.
+
+        Args:
+            name (str): Name of the stage, used for the report files.
+            task (Callable[[], object]): Callable that runs the task.
+
+        Returns:
+            Callable[[], object]: The profiled callable.
+        """
+
+        @functools.wraps(task)
+        def profiled() -> object:
+            with self.profile(name):
+                return task()
+
+        return profiled
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        """
+        Profiles the code run inside the context and writes its reports, even if it fails.
+
+        Args:
+            name (str): Name of the stage, used for the report files.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        profile = cProfile.Profile() if self.cpu else None
+        threads: List[cProfile.Profile] = []
+        hooked = profile is not None and not PROFILES_ALL_THREADS
+        if hooked:
+            threading.setprofile(self.thread_hook(threads))
+        tracing = self.memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        if self.memory:
+            tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            if hooked:
+                threading.setprofile(None)
+            elapsed = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot() if self.memory else None
+            peak = tracemalloc.get_traced_memory()[1] if self.memory else 0
+            if tracing:
+                tracemalloc.stop()
+            self.report(name, elapsed, profile, snapshot, peak, threads)
+
+    @staticmethod
+    def thread_hook(threads: List[cProfile.Profile]) -> Callable[[Any, str, Any], None]:
+        """
+        Builds the profile function installed in the threads started during a stage, which replaces itself with a
+        cProfile of the thread on its first call.
+
+        Args:
+            threads (List[cProfile.Profile]): Receives the profile of each thread.
+
+        Returns:
+            Callable[[Any, str, Any], None]: Function for threading.setprofile.
+        """
+
+        def start(frame: Any, event: str, arg: Any) -> None:
+            profile = cProfile.Profile()
+            threads.append(profile)
+            profile.enable()
+
+        return start
+
+    def report(
+        self,
+        name: str,
+        elapsed: float,
+        profile: Optional[cProfile.Profile],
+        snapshot: Optional[tracemalloc.Snapshot],
+        peak: int,
+        threads: Iterable[cProfile.Profile] = (),
+    ) -> None:
+        """
+        Writes the reports of a profiled stage and prints their summary.
+
+        Args:
+            name (str): Name of the stage.
+            elapsed (float): Seconds the stage took.
+            profile (Optional[cProfile.Profile]): CPU profile of the stage, if profiled.
+            snapshot (Optional[tracemalloc.Snapshot]): Memory still allocated at the end of the stage, if traced.
+            peak (int): Peak traced memory of the stage, in bytes.
+            threads (Iterable[cProfile.Profile]): CPU profiles of the threads started during the stage, merged into
+                the stage's profile.
+        """
+        base = os.path.join(self.output_dir, name)
+        print(f"🔥 Profile of {name.upper()}: {elapsed:.1f}s")
+
+        if profile is not None:
+            stats = pstats.Stats(profile, *threads)
+            stats.dump_stats(f"{base}.prof")
+            print(f"🔥 Hottest Functions (own time), Full Profile in {base}.prof:")
+            for line in self.hottest(stats):
+                print(f"   {line}")
+
+        if snapshot is not None:
+            lines = self.allocations(snapshot)
+            with open(f"{base}.memory.txt", "w", encoding="utf-8") as file:
+                file.write(f"Peak traced memory: {peak / 2**20:.1f} MiB\n\n")
+                file.write("\n".join(lines) + "\n")
+            print(f"🔥 Peak Memory {peak / 2**20:.1f} MiB, Top Allocations in {base}.memory.txt:")
+            for line in lines[: min(self.top, 5)]:
+                print(f"   {line}")
+
+    def hottest(self, stats: pstats.Stats) -> List[str]:
+        """
+        Lists the functions that spent the most time in their own code.
+
+        Args:
+            stats (pstats.Stats): Statistics of the CPU profile.
+
+        Returns:
+            List[str]: One line per function: own time, cumulative time, calls and location.
+        """
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[: self.top]
+        return [
+            f"{own:8.3f}s own {cumulative:8.3f}s cum {calls:>9} calls  {pstats.func_std_string(func)}"
+            for func, (_, calls, own, cumulative, _) in rows
+        ]
+
+    def allocations(self, snapshot: tracemalloc.Snapshot) -> List[str]:
+        """
+        Lists the source lines holding the most memory in a snapshot.
+
+        Args:
+            snapshot (tracemalloc.Snapshot): Memory allocated at the end of a stage.
+
+        Returns:
+            List[str]: One line per allocation site: size, number of blocks and location.
+        """
+        snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        return [
+            f"{stat.size / 2**20:8.2f} MiB {stat.count:>9} blocks  {stat.traceback}"
+            for stat in snapshot.statistics("lineno")[: self.top]
+        ]
@@ -0,0 +1,65 @@
+from typing import Optional
+
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import functions as F
+from pyspark.sql.types import ArrayType, MapType, StructType
+
+from pylegends.common.storage import FrameStorage
+
+
+class SparkStorage:
+    """
+    Reads and writes the pipeline artifacts with Spark, in the same paths and format as FrameStorage.
+
+    Spark writes each artifact as a directory of part files, which FrameStorage reads as a whole, so the pandas stages
+    (e.g. the MongoDB load and the dashboard) can consume what the Spark stages produce.
+
+    Attributes:
+        spark (SparkSession): Session used to read and write the artifacts.
+        storage (FrameStorage): Storage that defines the paths and format of the artifacts.
+    """
+
+    def __init__(self, spark: SparkSession, storage: Optional[FrameStorage] = None) -> None:
+        """Initializes the storage with the Spark session and the format of the artifacts."""
+        self.spark = spark
+        self.storage = storage or FrameStorage()
+
+    def read(self, stem: str) -> DataFrame:
+        """
+        Reads an artifact into a Spark DataFrame.
+
+        Args:
+            stem (str): Artifact path without extension.
+
+        Returns:
+            DataFrame: The artifact's data.
+        """
+        path = self.storage.path(stem)
+        if self.storage.fmt == "csv":
+            return self.spark.read.csv(path, header=True, inferSchema=True)
+        return self.spark.read.parquet(path)
+
+    def write(self, dataframe: DataFrame, stem: str) -> str:
+        """
+        Writes a Spark DataFrame as an artifact, replacing the previous one.
+
+        CSV has no nested types, so list and struct columns are written as JSON strings.
+
+        Args:
+            dataframe (DataFrame): Data to be written.
+            stem (str): Artifact path without extension.
+
+        Returns:
+            str: Path of the written artifact.
+        """
+        path = self.storage.path(stem)
+        if self.storage.fmt == "csv":
+            nested = (ArrayType, MapType, StructType)
+            columns = [
+                F.to_json(field.name).alias(field.name) if isinstance(field.dataType, nested) else F.col(field.name)
+                for field in dataframe.schema.fields
+            ]
+            dataframe.select(*columns).write.mode("overwrite").csv(path, header=True)
+        else:
+            dataframe.write.mode("overwrite").option("compression", self.storage.compression).parquet(path)
+        return path
@@ -0,0 +1,357 @@
+import glob
+import os
+import shutil
+from types import TracebackType
+from typing import Iterable, Iterator, List, Optional, Type
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from pylegends.common import metrics
+from pylegends.utils.config import Pipeline, Storage
+
+SUFFIXES = {"parquet": ".parquet", "csv": ".csv"}
+
+
+class FrameStorage:
+    """
+    Reads and writes the intermediate DataFrames of the pipeline in the configured format.
+
+    Artifacts are addressed by their path without extension (e.g. `LocalPathMastery.RAW`); the suffix of the configured
+    format is appended. Parquet keeps the column types (timestamps, lists, nested structures) between stages, while CSV
+    remains available as the storage format or as an extra export of each artifact. An artifact may also be a directory
+    of part files, as written by the Spark backend, which is read as a whole.
+
+    Attributes:
+        fmt (str): Storage format, "parquet" or "csv".
+        compression (str): Parquet compression codec.
+        export_csv (bool): Whether a CSV copy is written next to each Parquet artifact.
+    """
+
+    def __init__(
+        self,
+        fmt: str = Storage.FORMAT,
+        compression: str = Storage.COMPRESSION,
+        export_csv: bool = Storage.EXPORT_CSV,
+    ) -> None:
+        """Initializes the storage with the format and compression of the artifacts."""
+        if fmt not in SUFFIXES:
+            raise ValueError(f"Unsupported storage format: {fmt}. Expected one of {sorted(SUFFIXES)}.")
+        self.fmt = fmt
+        self.compression = compression
+        self.export_csv = export_csv and fmt != "csv"
+
+    def path(self, stem: str) -> str:
+        """
+        Builds the file path of an artifact.
+
+        Args:
+            stem (str): Artifact path without extension, or a path that already carries a known extension.
+
+        Returns:
+            str: The path with the extension of the configured format, or the given path if it already has one.
+        """
+        if os.path.splitext(stem)[1] in SUFFIXES.values():
+            return stem
+        return stem + SUFFIXES[self.fmt]
+
+    def exists(self, stem: str) -> bool:
+        """Checks whether an artifact has been written."""
+        return os.path.exists(self.path(stem))
+
+    def read(self, stem: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Reads an artifact into a DataFrame.
+
+        Args:
+            stem (str): Artifact path without extension.
+            columns (Optional[List[str]]): Columns to read; all of them by default.
+
+        Returns:
+            pd.DataFrame: The artifact's data.
+        """
+        path = self.path(stem)
+        if path.endswith(SUFFIXES["csv"]):
+            frames = [pd.read_csv(file, usecols=columns) for file in self.csv_files(path)]
+            dataframe = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        else:
+            dataframe = pd.read_parquet(path, columns=columns)
+        metrics.record("bytes_read", metrics.file_size(path))
+        metrics.record("rows_in", len(dataframe))
+        return dataframe
+
+    def iter_frames(
+        self, stem: str, chunk_size: int, columns: Optional[List[str]] = None, align_on: Optional[str] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Reads an artifact in chunks, so that only one chunk is held in memory at a time.
+
+        Parquet artifacts are read as Arrow record batches and CSV artifacts with pandas' chunked reader.
+
+        Args:
+            stem (str): Artifact path without extension.
+            chunk_size (int): Maximum number of rows read at a time.
+            columns (Optional[List[str]]): Columns to read; all of them by default.
+            align_on (Optional[str]): Column whose groups of consecutive equal values are never split between chunks,
+                e.g. "puuid" so that every chunk holds whole players.
+
+        Returns:
+            Iterator[pd.DataFrame]: The chunks of the artifact, in file order.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        path = self.path(stem)
+        if path.endswith(SUFFIXES["csv"]):
+            chunks: Iterable[pd.DataFrame] = (
+                chunk
+                for file in self.csv_files(path)
+                for chunk in pd.read_csv(file, usecols=columns, chunksize=chunk_size)
+            )
+        else:
+            batches = ds.dataset(path, format="parquet").to_batches(batch_size=chunk_size, columns=columns)
+            chunks = (batch.to_pandas() for batch in batches)
+        chunks = self.count_rows(chunks, metrics.file_size(path))
+        return chunks if align_on is None else self.align_groups(chunks, align_on)
+
+    @staticmethod
+    def count_rows(chunks: Iterable[pd.DataFrame], size: int) -> Iterator[pd.DataFrame]:
+        """
+        Records the rows of each chunk as they are read, and the size of the artifact once it has been read through.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Chunks read in file order.
+            size (int): Size of the artifact, in bytes.
+
+        Returns:
+            Iterator[pd.DataFrame]: The same chunks.
+        """
+        for chunk in chunks:
+            metrics.record("rows_in", len(chunk))
+            yield chunk
+        metrics.record("bytes_read", size)
+
+    @staticmethod
+    def align_groups(chunks: Iterable[pd.DataFrame], column: str) -> Iterator[pd.DataFrame]:
+        """
+        Moves the trailing group of each chunk to the next one, so that no group is split between chunks.
+
+        The groups are expected to be contiguous, as the extracted rows of each player are. A group larger than the
+        chunk size is yielded whole.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Chunks read in file order.
+            column (str): Column that identifies the groups.
+
+        Returns:
+            Iterator[pd.DataFrame]: Chunks holding whole groups only.
+        """
+        carry: Optional[pd.DataFrame] = None
+        for chunk in chunks:
+            if carry is not None:
+                chunk = pd.concat([carry, chunk], ignore_index=True)
+            if chunk.empty:
+                continue
+            values = chunk[column].to_numpy()
+            others = np.flatnonzero(values != values[-1])
+            cut = others[-1] + 1 if len(others) else 0
+            carry = chunk.iloc[cut:]
+            if cut:
+                yield chunk.iloc[:cut].reset_index(drop=True)
+        if carry is not None and not carry.empty:
+            yield carry.reset_index(drop=True)
+
+    @staticmethod
+    def csv_files(path: str) -> List[str]:
+        """
+        Lists the files of a CSV artifact, which is either a single file or a directory of part files.
+
+        Args:
+            path (str): Path of the artifact.
+
+        Returns:
+            List[str]: The file itself, or the part files of the directory in name order.
+        """
+        if os.path.isdir(path):
+            return sorted(glob.glob(os.path.join(path, "part-*.csv")))
+        return [path]
+
+    def write(self, dataframe: pd.DataFrame, stem: str) -> str:
+        """
+        Writes a DataFrame as an artifact, replacing the previous one.
+
+        Args:
+            dataframe (pd.DataFrame): Data to be written.
+            stem (str): Artifact path without extension.
+
+        Returns:
+            str: Path of the written file.
+        """
+        path = self.path(stem)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        if path.endswith(SUFFIXES["csv"]):
+            dataframe.to_csv(path, index=False)
+        else:
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+            pq.write_table(table, path, compression=self.compression)
+        if self.export_csv:
+            dataframe.to_csv(stem + SUFFIXES["csv"], index=False)
+        metrics.record("rows_out", len(dataframe))
+        metrics.record("bytes_written", metrics.file_size(path))
+        return path
+
+    def writer(self, stem: str, append: bool = False) -> "FrameWriter":
+        """
+        Opens an incremental writer of an artifact.
+
+        Args:
+            stem (str): Artifact path without extension.
+            append (bool): Whether to keep the rows already in the artifact.
+
+        Returns:
+            FrameWriter: Writer to be used as a context manager.
+        """
+        return FrameWriter(self, stem, append)
+
+
+class FrameWriter:
+    """
+    Writes an artifact incrementally, one DataFrame at a time, without keeping the previous ones in memory.
+
+    Parquet artifacts get one row group per written DataFrame; CSV artifacts are appended to. The artifact holds the
+    union of the columns of every DataFrame, as pd.concat would: missing columns are written as nulls, and a DataFrame
+    that adds columns, or types that do not fit the previous ones (e.g. values in a column that was all null so far),
+    widens the artifact, rewriting the rows already written once. The data goes to a temporary file that replaces the
+    artifact only when the writer is closed.
+
+    Attributes:
+        storage (FrameStorage): Storage that defines the format of the artifact.
+        path (str): Final path of the artifact.
+        rows (int): Number of rows written so far.
+    """
+
+    def __init__(self, storage: FrameStorage, stem: str, append: bool = False) -> None:
+        """Initializes the writer, carrying over the existing rows when appending."""
+        self.storage = storage
+        self.path = storage.path(stem)
+        self.stem = stem
+        self.rows = 0
+        self._temp_path = f"{self.path}.tmp"
+        self._columns: List[str] = []
+        self._schema: Optional[pa.Schema] = None
+        self._parquet: Optional[pq.ParquetWriter] = None
+        self._append = append
+
+    def __enter__(self) -> "FrameWriter":
+        """Opens the temporary file, copying the existing artifact into it when appending."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+        if self._append and os.path.exists(self.path):
+            self.write(self.storage.read(self.stem))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the temporary file and, if nothing failed, moves it over the artifact."""
+        if self._parquet is not None:
+            self._parquet.close()
+        if exc_type is None and os.path.exists(self._temp_path):
+            if os.path.isdir(self.path):
+                shutil.rmtree(self.path)
+            os.replace(self._temp_path, self.path)
+            metrics.record("bytes_written", metrics.file_size(self.path))
+            if self.storage.export_csv:
+                self.storage.read(self.stem).to_csv(self.stem + SUFFIXES["csv"], index=False)
+        elif os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+    @property
+    def columns(self) -> List[str]:
+        """Columns of the artifact: those of every DataFrame written so far, in the order they first appeared."""
+        return list(self._columns)
+
+    def write(self, dataframe: pd.DataFrame) -> None:
+        """
+        Appends a DataFrame to the artifact.
+
+        Args:
+            dataframe (pd.DataFrame): Rows to be appended; columns it lacks are written as nulls and columns it adds
+                widen the artifact.
+        """
+        new_columns = [col for col in dataframe.columns if col not in self._columns]
+        self._columns.extend(new_columns)
+
+        if self.path.endswith(SUFFIXES["csv"]):
+            new_file = not os.path.exists(self._temp_path)
+            if new_columns and not new_file:
+                self.widen_csv()
+            dataframe = dataframe.reindex(columns=self._columns)
+            dataframe.to_csv(self._temp_path, index=False, mode="w" if new_file else "a", header=new_file)
+        else:
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+            if self._parquet is None:
+                self._schema = table.schema
+                self._parquet = pq.ParquetWriter(self._temp_path, self._schema, compression=self.storage.compression)
+            else:
+                schema = pa.unify_schemas([self._schema, table.schema], promote_options="permissive")
+                if not schema.equals(self._schema):
+                    self.widen_parquet(schema)
+                table = self.conform(table, self._schema)
+            self._parquet.write_table(table)
+        self.rows += len(dataframe)
+        metrics.record("rows_out", len(dataframe))
+
+    def widen_parquet(self, schema: pa.Schema) -> None:
+        """
+        Rewrites the row groups written so far with a wider schema, and keeps writing with it.
+
+        Args:
+            schema (pa.Schema): Schema of the previous rows and of the new DataFrame together.
+        """
+        previous_path = f"{self._temp_path}.previous"
+        self._parquet.close()
+        os.replace(self._temp_path, previous_path)
+        self._schema = schema
+        self._parquet = pq.ParquetWriter(self._temp_path, schema, compression=self.storage.compression)
+        previous = pq.ParquetFile(previous_path)
+        for row_group in range(previous.num_row_groups):
+            self._parquet.write_table(self.conform(previous.read_row_group(row_group), schema))
+        previous.close()
+        os.remove(previous_path)
+
+    def widen_csv(self) -> None:
+        """Rewrites the rows written so far with the header of the current columns, the new ones left empty."""
+        previous_path = f"{self._temp_path}.previous"
+        os.replace(self._temp_path, previous_path)
+        for index, chunk in enumerate(pd.read_csv(previous_path, chunksize=Pipeline.CHUNK_SIZE)):
+            chunk.reindex(columns=self._columns).to_csv(
+                self._temp_path, index=False, mode="w" if index == 0 else "a", header=index == 0
+            )
+        os.remove(previous_path)
+
+    @staticmethod
+    def conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+        """
+        Casts a table to the schema of the artifact.
+
+        Args:
+            table (pa.Table): Rows to be written.
+            schema (pa.Schema): Schema of the artifact; its fields are a superset of the table's.
+
+        Returns:
+            pa.Table: The rows with the fields of the schema, in its order, and nulls for the fields the table lacks.
+        """
+        arrays = [
+            table[field.name].cast(field.type) if field.name in table.column_names else pa.nulls(len(table), field.type)
+            for field in schema
+        ]
+        return pa.Table.from_arrays(arrays, schema=schema)
@@ -1,16 +1,114 @@
-from typing import Optional
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
 
 import requests
 
+from pylegends.common.http_client import get_http_client
+from pylegends.utils.config import Cache, LocalPathCache
 
-def get_latest_version() -> Optional[str]:
+VERSIONS_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
+
+_latest_version: Optional[str] = None
+_lock = threading.Lock()
+
+
+def get_latest_version(refresh: bool = False) -> Optional[str]:
     """
     Gets the latest version of the game from the API.
 
+    The version is resolved once per process. Across processes it is kept in an on-disk cache that is trusted for
+    `Cache.VERSION_TTL` seconds and then revalidated with If-None-Match, falling back to the last known version when
+    the API cannot be reached.
+
+    Args:
+        refresh (bool): Whether to ignore the in-process memo and the cache TTL and revalidate with the API.
+
     Returns:
-        Optional[str]: The latest version of the game, or None if the request fails.
+        Optional[str]: The latest version of the game, or None if the request fails and nothing is cached.
+    """
+    global _latest_version
+    with _lock:
+        if _latest_version is None or refresh:
+            _latest_version = resolve_version(refresh)
+        return _latest_version
+
+
+def resolve_version(refresh: bool = False, cache_path: str = LocalPathCache.VERSION) -> Optional[str]:
     """
-    versions_url = "https://ddragon.leagueoflegends.com/api/versions.json"
-    response = requests.get(versions_url)
+    Resolves the latest version using the on-disk cache and a conditional request to the Versions API.
+
+    Args:
+        refresh (bool): Whether to revalidate with the API even if the cached entry is within its TTL.
+        cache_path (str): Path of the JSON file holding the cached version.
+
+    Returns:
+        Optional[str]: The latest version of the game, or None if the request fails and nothing is cached.
+    """
+    cached = read_cache(cache_path)
+    if cached and not refresh and time.time() - cached.get("fetched_at", 0) < Cache.VERSION_TTL:
+        return cached["version"]
+
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else None
+    try:
+        response = get_http_client().get(VERSIONS_URL, headers=headers)
+    except requests.RequestException as err:
+        return _fallback(cached, f"Versions API unreachable: {err}")
+
+    if response.status_code == 304 and cached:
+        cached["fetched_at"] = time.time()
+        write_cache(cache_path, cached)
+        return cached["version"]
+
+    if response.status_code != 200:
+        return _fallback(cached, f"Versions API answered {response.status_code}")
+
     versions = response.json()
-    return versions[0] if versions else None
+    version = versions[0] if versions else None
+    if version:
+        write_cache(cache_path, {"version": version, "etag": response.headers.get("ETag"), "fetched_at": time.time()})
+    return version
+
+
+def read_cache(cache_path: str = LocalPathCache.VERSION) -> Optional[Dict[str, Any]]:
+    """
+    Reads the cached version entry.
+
+    Args:
+        cache_path (str): Path of the JSON file holding the cached version.
+
+    Returns:
+        Optional[Dict[str, Any]]: The cached entry, or None if it does not exist or cannot be read.
+    """
+    try:
+        with open(cache_path, encoding="utf-8") as file:
+            entry = json.load(file)
+        return entry if entry.get("version") else None
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(cache_path: str, entry: Dict[str, Any]) -> None:
+    """
+    Writes the version entry to the cache, replacing the file atomically.
+
+    Args:
+        cache_path (str): Path of the JSON file holding the cached version.
+        entry (Dict[str, Any]): Entry with the version, its ETag and the time it was fetched.
+    """
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    temp_path = f"{cache_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(entry, file)
+    os.replace(temp_path, cache_path)
+
+
+def _fallback(cached: Optional[Dict[str, Any]], reason: str) -> Optional[str]:
+    """Returns the last known version after a failed lookup, if there is one."""
+    if cached:
+        print(f"⚠️ {reason}, using last known version {cached['version']}.")
+        return cached["version"]
+    print(f"⛔ {reason} and there is no cached version!!!")
+    return None
@@ -1,46 +1,78 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import dash
-import pandas as pd
-from dash import Input, Output, dash_table, dcc, html
+from dash import Input, Output, State, dash_table, dcc, html
+from flask import Response, request
 
-from pylegends.utils.config import LocalPathMastery
+from pylegends.dash.data import MasteryData
+from pylegends.utils.config import App
 
 
 class Dashboard:
     """Class to create an interactive dashboard using Dash.
 
-    This dashboard displays a periodically updated table with data on champions' mastery.
+    This dashboard displays a periodically updated table with data on champions' mastery. The data is served by a
+    cached data layer, and each client keeps the version it has in a dcc.Store, so the table is only sent again when
+    the data actually changed. In server-side mode, the table is paged, sorted and filtered by the server, which sends
+    only the visible page.
+
+    The instance holds no state shared between clients other than the data cache, whose versions are derived from the
+    data itself, so several worker processes (e.g. gunicorn serving `pylegends.dash.wsgi:server`) can each hold one.
 
     Attributes:
         app (dash.Dash): Dash app instance.
-        data (pd.DataFrame): DataFrame containing the data to be displayed on the dashboard.
-        columns (List[Dict[str, str]]): configuration of columns for the Dash table.
+        data (MasteryData): Cached data to be displayed on the dashboard.
+        server_side (bool): Whether the table is paged, sorted and filtered on the server.
+        page_size (int): Number of rows of each page in server-side mode.
     """
 
-    def __init__(self) -> None:
+    DEFAULT_SORT = [
+        {"column_id": "level", "direction": "desc"},
+        {"column_id": "points", "direction": "desc"},
+    ]
+
+    def __init__(
+        self, data: Optional[MasteryData] = None, server_side: bool = App.SERVER_SIDE, page_size: int = App.PAGE_SIZE
+    ) -> None:
         """Initializes the Dashboard class, loads the data and configures the Dash layout and callbacks."""
-        self.data = pd.read_csv(LocalPathMastery.FINAL)
-        self.app = dash.Dash(__name__)
-        self.load_data()
-        self.columns = [{"name": col.capitalize(), "id": col} for col in self.data.columns]
-        self.app.layout = self.create_layout()
+        self.data = data or MasteryData()
+        self.server_side = server_side
+        self.page_size = page_size
+        self.app = dash.Dash(__name__, compress=App.COMPRESS)
+        self.app.server.after_request(self.cache_static)
+        self.app.layout = self.create_layout
         self.setup_callbacks()
 
-    def run(self) -> None:
-        """Starts the Dash server."""
-        self.app.run_server(debug=True)
+    def run(self, debug: bool = App.DEBUG) -> None:
+        """Starts the Dash development server; production deployments serve `pylegends.dash.wsgi:server` instead.
+
+        Args:
+            debug (bool): Whether to enable the debugger and the reloader.
+        """
+        self.app.run(debug=debug)
+
+    @staticmethod
+    def cache_static(response: Response) -> Response:
+        """Adds caching headers to the static assets and component bundles that do not have them yet.
 
-    def load_data(self) -> None:
-        """Loads data from the CSV file specified in the config."""
-        self.data["title"] = self.data["title"].str.title()
+        Args:
+            response (Response): Response about to be sent.
+
+        Returns:
+            Response: The same response, cacheable by browsers if it is a static resource.
+        """
+        static = request.path.startswith(("/assets/", "/_dash-component-suites/"))
+        if static and response.status_code == 200 and "Cache-Control" not in response.headers:
+            response.headers["Cache-Control"] = f"public, max-age={App.STATIC_MAX_AGE}"
+        return response
 
     def create_layout(self) -> html.Div:
-        """Creates the HTML layout of the dashboard.
+        """Creates the HTML layout of the dashboard, on every page load so that it starts with the current data.
 
         Returns:
             html.Div: A Dash HTML component that represents the dashboard layout.
         """
+        self.data.refresh()
         return html.Div(
             [
                 html.H1("Champion Mastery", style={"textAlign": "center"}),
@@ -49,40 +81,120 @@ class Dashboard:
                     interval=1 * 1000,  # in milliseconds
                     n_intervals=0,
                 ),
+                dcc.Store(id="data-version", data=self.data.version),
                 dash_table.DataTable(
                     id="data-table",
-                    columns=self.columns,
-                    data=self.data.to_dict("records"),
-                    sort_action="native",
+                    columns=self.columns(),
+                    **self.table_mode(),
                     style_header={
                         "backgroundColor": "darkblue",
                         "color": "white",
                         "fontWeight": "bold",
                         "textAlign": "center",
                     },
-                    sort_by=[
-                        {"column_id": "level", "direction": "desc"},
-                        {"column_id": "points", "direction": "desc"},
-                    ],
+                    sort_by=self.DEFAULT_SORT,
                 ),
             ]
         )
 
+    def columns(self) -> List[Dict[str, str]]:
+        """Returns the configuration of the table columns, from the columns of the current data.
+
+        Returns:
+            List[Dict[str, str]]: The name and id of each column.
+        """
+        return [{"name": col.capitalize(), "id": col} for col in self.data.columns()]
+
+    def table_mode(self) -> Dict[str, Any]:
+        """Returns the properties of the table that depend on where it is paged, sorted and filtered.
+
+        Returns:
+            Dict[str, Any]: The initial data and the paging, sorting and filtering actions of the table.
+        """
+        if not self.server_side:
+            return {"data": self.data.records, "sort_action": "native"}
+        data, page_count = self.data.query(0, self.page_size, self.DEFAULT_SORT)
+        return {
+            "data": data,
+            "page_action": "custom",
+            "page_current": 0,
+            "page_size": self.page_size,
+            "page_count": page_count,
+            "sort_action": "custom",
+            "sort_mode": "multi",
+            "filter_action": "custom",
+            "filter_query": "",
+        }
+
     def setup_callbacks(self) -> None:
         """Configures callbacks for the Dash application."""
-        self.app.callback(Output("data-table", "data"), Input("interval-component", "n_intervals"))(self.update_data)
+        if self.server_side:
+            self.app.callback(
+                Output("data-table", "data"),
+                Output("data-table", "page_count"),
+                Output("data-table", "columns"),
+                Output("data-version", "data"),
+                Input("interval-component", "n_intervals"),
+                Input("data-table", "page_current"),
+                Input("data-table", "page_size"),
+                Input("data-table", "sort_by"),
+                Input("data-table", "filter_query"),
+                State("data-version", "data"),
+            )(self.update_page)
+            return
+
+        self.app.callback(
+            Output("data-table", "data"),
+            Output("data-table", "columns"),
+            Output("data-version", "data"),
+            Input("interval-component", "n_intervals"),
+            State("data-version", "data"),
+        )(self.update_data)
+
+    def update_data(self, n_intervals: int, client_version: Optional[str]) -> Tuple[Any, Any, Any]:
+        """Updates table data every defined time interval, if it changed since the client last received it.
 
-    def update_data(self, n_intervals: int) -> List[Dict[str, Any]]:
-        """Updates table data every defined time interval.
+        Args:
+            n_intervals (int): The number of times the interval has been triggered.
+            client_version (Optional[str]): Version of the data the client has.
+
+        Returns:
+            Tuple[Any, Any, Any]: The rows of the table, its columns and their version, or dash.no_update for all of
+                them if the client is up to date.
+        """
+        self.data.refresh()
+        if client_version == self.data.version:
+            return dash.no_update, dash.no_update, dash.no_update
+        return self.data.records, self.columns(), self.data.version
+
+    def update_page(
+        self,
+        n_intervals: int,
+        page_current: int,
+        page_size: int,
+        sort_by: Optional[List[Dict[str, str]]],
+        filter_query: Optional[str],
+        client_version: Optional[str],
+    ) -> Tuple[Any, Any, Any, Any]:
+        """Returns the visible page of the table when the client changes page, sorting or filter, or the data changed.
 
         Args:
             n_intervals (int): The number of times the interval has been triggered.
+            page_current (int): Zero-based number of the visible page.
+            page_size (int): Number of rows of each page.
+            sort_by (Optional[List[Dict[str, str]]]): Columns the table is sorted by.
+            filter_query (Optional[str]): Filter of the table.
+            client_version (Optional[str]): Version of the data the client has.
 
         Returns:
-            List[Dict[str, Any]]: List of dictionaries representing the updated rows of the table.
+            Tuple[Any, Any, Any, Any]: The rows of the page, the number of pages, the table columns and the version of
+                the data, or dash.no_update for all of them if the interval fired and the client is up to date.
         """
-        self.load_data()
-        return self.data.to_dict("records")
+        self.data.refresh()
+        if dash.ctx.triggered_id == "interval-component" and client_version == self.data.version:
+            return dash.no_update, dash.no_update, dash.no_update, dash.no_update
+        data, page_count = self.data.query(page_current or 0, page_size or self.page_size, sort_by, filter_query)
+        return data, page_count, self.columns(), self.data.version
 
 
 if __name__ == "__main__":
@@ -0,0 +1,449 @@
+import hashlib
+import math
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pylegends.common.mongodb import MongoClientManager
+from pylegends.common.storage import FrameStorage
+from pylegends.etl.mastery.join import SPECIFIC_COLUMNS, JoinChamps
+from pylegends.utils.config import App, LocalPathMastery, MongoDB
+
+FilterValue = Union[str, float]
+
+FILTER_OPERATORS = [
+    ("ge", (">=", "ge ")),
+    ("le", ("<=", "le ")),
+    ("lt", ("<", "lt ")),
+    ("gt", (">", "gt ")),
+    ("ne", ("!=", "ne ")),
+    ("eq", ("=", "eq ")),
+    ("contains", ("contains ",)),
+    ("datestartswith", ("datestartswith ",)),
+]
+
+RANGE_OPERATORS = {"lt": "$lt", "le": "$lte", "gt": "$gt", "ge": "$gte"}
+
+
+def parse_filter(part: str) -> Tuple[Optional[str], Optional[str], Optional[FilterValue]]:
+    """
+    Parses one condition of a DataTable filter query, e.g. "{points} >= 21600".
+
+    Args:
+        part (str): The condition.
+
+    Returns:
+        Tuple[Optional[str], Optional[str], Optional[FilterValue]]: Column, operator and value of the condition, or
+            None for each if it could not be parsed.
+    """
+    for operator, symbols in FILTER_OPERATORS:
+        for symbol in symbols:
+            if symbol not in part:
+                continue
+            name, raw = part.split(symbol, 1)
+            column = name[name.find("{") + 1 : name.rfind("}")]
+            raw = raw.strip()
+            if len(raw) > 1 and raw[0] == raw[-1] and raw[0] in "'\"`":
+                return column, operator, raw[1:-1].replace("\\" + raw[0], raw[0])
+            try:
+                return column, operator, float(raw)
+            except ValueError:
+                return column, operator, raw
+    return None, None, None
+
+
+class FileSource:
+    """
+    Mastery data read from the final data file.
+
+    Changes are detected in two steps: the size and modification time of the file, which are cheap to check on every
+    refresh, and, when those change, a hash of its content, so that a file rewritten with the same data is not reloaded.
+
+    Attributes:
+        stem (str): Artifact path without extension.
+        storage (FrameStorage): Storage that defines the format of the artifact.
+    """
+
+    def __init__(self, stem: str = LocalPathMastery.FINAL, storage: Optional[FrameStorage] = None) -> None:
+        """Initializes the source with the artifact to watch."""
+        self.stem = stem
+        self.storage = storage or FrameStorage()
+        self._stat: Optional[Tuple[Tuple[str, int, int], ...]] = None
+        self._hash: Optional[str] = None
+
+    def files(self) -> List[str]:
+        """Lists the files of the artifact: the file itself or the part files of a directory."""
+        path = self.storage.path(self.stem)
+        if os.path.isdir(path):
+            return sorted(os.path.join(path, name) for name in os.listdir(path) if not name.startswith((".", "_")))
+        return [path] if os.path.exists(path) else []
+
+    def version(self) -> Optional[str]:
+        """
+        Returns the content hash of the artifact, hashing the files again only if their size or mtime changed.
+
+        Returns:
+            Optional[str]: The hash of the current content, or None if the artifact does not exist.
+        """
+        files = self.files()
+        stat = tuple((file, os.stat(file).st_size, os.stat(file).st_mtime_ns) for file in files)
+        if stat != self._stat:
+            self._stat = stat
+            self._hash = self.content_hash(files) if files else None
+        return self._hash
+
+    @staticmethod
+    def content_hash(files: List[str]) -> str:
+        """Computes the SHA-256 of the content of the given files."""
+        digest = hashlib.sha256()
+        for file in files:
+            with open(file, "rb") as handle:
+                for block in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(block)
+        return digest.hexdigest()
+
+    def read(self) -> pd.DataFrame:
+        """Reads the artifact into a DataFrame."""
+        return self.storage.read(self.stem)
+
+
+class MongoSource:
+    """
+    Mastery data read from the 'mastery' collection, shared by every replica of the dashboard.
+
+    The version of the data is the load version that the loader bumps in the meta collection whenever the collection
+    changes, so detecting a change is a single lookup by _id. Pages are queried with the filter, sort, skip and limit
+    pushed down to MongoDB, served by the indexes created by LoadMastery, and a projection of the table columns.
+
+    Attributes:
+        db_name (str): The name of the database.
+        collection_name (str): The name of the collection.
+        fields (Optional[List[str]]): Fields of the documents shown in the table, looked up again for each version.
+    """
+
+    def __init__(self, db_name: str = MongoDB.DATABASE, collection_name: str = "mastery") -> None:
+        """Initializes the source with the collection to read; the client is the shared MongoClientManager one."""
+        self.db_name = db_name
+        self.collection_name = collection_name
+        self.fields: Optional[List[str]] = None
+        self._version: Optional[str] = None
+        self._fields_version: Optional[str] = None
+
+    @property
+    def database(self) -> Any:
+        """The database of the collection, on the shared client."""
+        return MongoClientManager.get_client()[self.db_name]
+
+    def version(self) -> Optional[str]:
+        """
+        Returns the load version of the collection.
+
+        Returns:
+            Optional[str]: The version, or None if the collection was never loaded.
+        """
+        meta = self.database[MongoDB.META_COLLECTION].find_one({"_id": self.collection_name}, {"version": 1})
+        self._version = str(meta["version"]) if meta else None
+        return self._version
+
+    def columns(self) -> List[str]:
+        """
+        Returns the columns of the final data, then the other fields of the documents, in the order of the final data
+        file and without _id.
+
+        The columns of the final data are always shown, even before the first load, and the other fields are looked up
+        again whenever the load version changes, so fields added by later loads show up without a restart.
+
+        Returns:
+            List[str]: The fields shown in the table.
+        """
+        if self.fields is None or self._fields_version != self._version:
+            document = self.database[self.collection_name].find_one({}, {"_id": 0}) or {}
+            self.fields = JoinChamps.ordered_columns(list(dict.fromkeys([*SPECIFIC_COLUMNS, *document])))
+            self._fields_version = self._version
+        return list(self.fields)
+
+    def projection(self) -> Dict[str, int]:
+        """Returns the projection of the table columns, without _id."""
+        projection = {field: 1 for field in self.columns()}
+        projection["_id"] = 0
+        return projection
+
+    def read(self) -> pd.DataFrame:
+        """Reads the whole collection into a DataFrame."""
+        return pd.DataFrame(list(self.database[self.collection_name].find({}, self.projection())))
+
+    def query(
+        self,
+        page: int,
+        page_size: int,
+        sort_by: Tuple[Tuple[str, str], ...],
+        filter_query: Optional[str],
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        Queries one page of the collection, sorted and filtered on the server.
+
+        Args:
+            page (int): Zero-based number of the page.
+            page_size (int): Number of rows of each page.
+            sort_by (Tuple[Tuple[str, str], ...]): Column and direction ("asc" or "desc") of each sort key.
+            filter_query (Optional[str]): Filter of the table, in the DataTable syntax.
+
+        Returns:
+            Tuple[pd.DataFrame, int]: The rows of the page and the number of rows that match the filter.
+        """
+        collection = self.database[self.collection_name]
+        query = self.mongo_filter(filter_query)
+        sort = [(column, -1 if direction == "desc" else 1) for column, direction in sort_by]
+        cursor = collection.find(query, self.projection()).sort(sort + [("_id", 1)]).skip(page * page_size)
+        return pd.DataFrame(list(cursor.limit(page_size))), collection.count_documents(query)
+
+    @staticmethod
+    def mongo_filter(filter_query: Optional[str]) -> Dict[str, Any]:
+        """
+        Translates a DataTable filter query into a MongoDB query.
+
+        Args:
+            filter_query (Optional[str]): Conditions joined by " && "; conditions that cannot be parsed are ignored.
+
+        Returns:
+            Dict[str, Any]: The MongoDB query matching every condition.
+        """
+        conditions = []
+        for part in (filter_query or "").split(" && "):
+            column, operator, value = parse_filter(part)
+            if not column or operator is None:
+                continue
+            values = [value]
+            if isinstance(value, float):
+                values.append(str(int(value)) if value.is_integer() else str(value))
+            if operator == "eq":
+                conditions.append({column: {"$in": values}})
+            elif operator == "ne":
+                conditions.append({column: {"$nin": values}})
+            elif operator in RANGE_OPERATORS:
+                conditions.append({column: {RANGE_OPERATORS[operator]: value}})
+            elif operator == "contains":
+                conditions.append({column: {"$regex": re.escape(str(value)), "$options": "i"}})
+            elif operator == "datestartswith":
+                try:
+                    period = pd.Period(str(value))
+                except ValueError:
+                    continue
+                start, end = period.start_time.to_pydatetime(), period.end_time.to_pydatetime()
+                conditions.append({column: {"$gte": start, "$lte": end}})
+        if not conditions:
+            return {}
+        return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+
+class MasteryData:
+    """
+    Cached mastery data served by the dashboard.
+
+    The data is reloaded, prepared for display and serialized only when the version of its source changes, and only
+    when it is needed as a whole; in between, every client gets the same cached records, and clients that already have
+    the current version get nothing at all. Pages of the data, sorted and filtered as the table asks, are queried from
+    MongoDB or sliced from a cached view of the file data that is computed again only when the sorting, the filter or
+    the data change.
+
+    Attributes:
+        source (Union[FileSource, MongoSource]): Where the mastery data is read from.
+        version (Optional[str]): Version of the cached data, or None if there is no data.
+    """
+
+    def __init__(self, source: Optional[Union[FileSource, MongoSource]] = None) -> None:
+        """Initializes the data layer with the given source, or the one selected in the config."""
+        self.source = source or self.default_source()
+        self.version: Optional[str] = None
+        self._frame: Optional[pd.DataFrame] = None
+        self._records: Optional[List[Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+        self._view_key: Optional[Tuple[Any, ...]] = None
+        self._view = pd.DataFrame()
+        self.refresh()
+
+    @staticmethod
+    def default_source() -> Union[FileSource, MongoSource]:
+        """Returns the source selected by App.SOURCE."""
+        if App.SOURCE == "file":
+            return FileSource()
+        if App.SOURCE == "mongodb":
+            return MongoSource()
+        raise ValueError(f"Unsupported dashboard source: {App.SOURCE}. Expected 'mongodb' or 'file'.")
+
+    def refresh(self) -> bool:
+        """
+        Checks whether the source changed since the last check, dropping the cached data if it did.
+
+        Returns:
+            bool: true if the data changed.
+        """
+        with self._lock:
+            version = self.source.version()
+            if version == self.version:
+                return False
+            self.version, self._frame, self._records = version, None, None
+            print(f"🔄 Dashboard Data Changed (version {version})")
+            return True
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """The whole data prepared for display, loaded on first use after each change."""
+        with self._lock:
+            if self._frame is None:
+                self._frame = self.prepare(self.source.read()) if self.version is not None else pd.DataFrame()
+            return self._frame
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """The whole data serialized as table rows, computed on first use after each change."""
+        frame = self.frame
+        with self._lock:
+            if self._records is None:
+                self._records = frame.to_dict("records")
+            return self._records
+
+    def columns(self) -> List[str]:
+        """Returns the columns of the data, without loading it all from MongoDB."""
+        if isinstance(self.source, MongoSource):
+            return self.source.columns()
+        return list(self.frame.columns)
+
+    def query(
+        self,
+        page: int = 0,
+        page_size: int = 50,
+        sort_by: Optional[List[Dict[str, str]]] = None,
+        filter_query: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Returns one page of the data, sorted and filtered with the DataTable syntax.
+
+        Args:
+            page (int): Zero-based number of the page.
+            page_size (int): Number of rows of each page.
+            sort_by (Optional[List[Dict[str, str]]]): Columns to sort by, as {"column_id": ..., "direction": ...}.
+            filter_query (Optional[str]): Filter of the table, e.g. "{level} >= 5 && {champion} contains ah".
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The rows of the page and the number of pages.
+        """
+        sort_key = tuple((item["column_id"], item["direction"]) for item in sort_by or [])
+        if isinstance(self.source, MongoSource):
+            rows, total = self.source.query(page, page_size, sort_key, filter_query)
+            return self.prepare(rows).to_dict("records"), max(1, math.ceil(total / page_size))
+
+        frame = self.frame
+        with self._lock:
+            key = (self.version, sort_key, filter_query or "")
+            if key != self._view_key:
+                self._view = self.sort(self.filter(frame, filter_query), sort_key)
+                self._view_key = key
+            view = self._view
+        page_count = max(1, math.ceil(len(view) / page_size))
+        start = page * page_size
+        return view.iloc[start : start + page_size].to_dict("records"), page_count
+
+    @staticmethod
+    def sort(data: pd.DataFrame, sort_by: Tuple[Tuple[str, str], ...]) -> pd.DataFrame:
+        """
+        Sorts the data by the given columns, keeping the order of ties.
+
+        Args:
+            data (pd.DataFrame): Data to be sorted.
+            sort_by (Tuple[Tuple[str, str], ...]): Column and direction ("asc" or "desc") of each sort key.
+
+        Returns:
+            pd.DataFrame: The sorted data.
+        """
+        sort_by = tuple((column, direction) for column, direction in sort_by if column in data.columns)
+        if not sort_by:
+            return data
+        return data.sort_values(
+            by=[column for column, _ in sort_by],
+            ascending=[direction == "asc" for _, direction in sort_by],
+            kind="stable",
+        )
+
+    @classmethod
+    def filter(cls, data: pd.DataFrame, filter_query: Optional[str]) -> pd.DataFrame:
+        """
+        Filters the data with a DataTable filter query, with one vectorized mask per condition.
+
+        Args:
+            data (pd.DataFrame): Data to be filtered.
+            filter_query (Optional[str]): Conditions joined by " && "; conditions on unknown columns are ignored.
+
+        Returns:
+            pd.DataFrame: The rows that meet every condition.
+        """
+        if not filter_query:
+            return data
+        mask = np.ones(len(data), dtype=bool)
+        for part in filter_query.split(" && "):
+            column, operator, value = parse_filter(part)
+            if column not in data.columns:
+                continue
+            mask &= cls.condition(data[column], operator, value)
+        return data.loc[mask]
+
+    @staticmethod
+    def condition(values: pd.Series, operator: Optional[str], value: Optional[FilterValue]) -> np.ndarray:
+        """
+        Evaluates one filter condition over a column.
+
+        Args:
+            values (pd.Series): Values of the column.
+            operator (Optional[str]): One of the operators in FILTER_OPERATORS.
+            value (Optional[FilterValue]): Value the column is compared to.
+
+        Returns:
+            np.ndarray: Boolean mask of the rows that meet the condition.
+        """
+        if operator in ("contains", "datestartswith"):
+            text = values.astype(str)
+            if operator == "datestartswith":
+                return text.str.startswith(str(value)).to_numpy()
+            return text.str.contains(str(value), case=False, regex=False).to_numpy()
+
+        if isinstance(value, float) and not pd.api.types.is_numeric_dtype(values):
+            value = str(int(value)) if value.is_integer() else str(value)
+        elif isinstance(value, str) and pd.api.types.is_numeric_dtype(values):
+            return np.zeros(len(values), dtype=bool)
+        if not pd.api.types.is_numeric_dtype(values):
+            values = values.astype(str)
+
+        comparisons = {
+            "eq": values.__eq__,
+            "ne": values.__ne__,
+            "lt": values.__lt__,
+            "le": values.__le__,
+            "gt": values.__gt__,
+            "ge": values.__ge__,
+        }
+        if operator not in comparisons:
+            return np.ones(len(values), dtype=bool)
+        return comparisons[operator](value).to_numpy(dtype=bool)
+
+    @staticmethod
+    def prepare(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Prepares the data read from the source for display.
+
+        Args:
+            data (pd.DataFrame): Final mastery data.
+
+        Returns:
+            pd.DataFrame: The data with title-cased titles and the tags joined into text.
+        """
+        if "title" in data.columns:
+            data["title"] = data["title"].astype(str).str.title()
+        if "tags" in data.columns:
+            data["tags"] = data["tags"].map(
+                lambda tags: ", ".join(tags) if isinstance(tags, (list, np.ndarray)) else tags
+            )
+        return data
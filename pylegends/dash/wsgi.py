@@ -0,0 +1,13 @@
+"""
+WSGI entry point of the mastery dashboard.
+
+Serve it with a production server and several workers, e.g.:
+
+    gunicorn pylegends.dash.wsgi:server --workers 4 --bind 0.0.0.0:8050
+"""
+
+from pylegends.dash.app import Dashboard
+
+dashboard = Dashboard()
+app = dashboard.app
+server = app.server
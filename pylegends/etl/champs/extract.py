@@ -1,58 +1,83 @@
-import os
-from typing import Dict
+from typing import Dict, List
 
 import pandas as pd
-import requests
 
+from pylegends.common import metrics
+from pylegends.common.cache import DataDragonCache
+from pylegends.common.storage import FrameStorage
 from pylegends.common.version import get_latest_version
 from pylegends.utils.config import LocalPathChamps, Riot
 
+LOCALIZED_FIELDS = ["name", "title", "blurb", "partype"]
+
 
 class ExtractChamps:
     """
     Class responsible for extracting information from Riot API Champions.
 
-    This class makes requests to the game's API to get the latest champion data and saves it to a CSV file.
+    This class makes requests to the game's API to get the latest champion data and saves it to the raw data file.
+    The payloads of every configured locale are downloaded concurrently: the locale-independent data (info, tags,
+    stats) is stored once, from the main locale, and only the strings of each locale are stored in the localized file.
 
     Attributes:
-        base_url (str): base URL for the Champions Data API.
+        cache (DataDragonCache): patch-versioned cache of the Data Dragon payloads.
         version (str): latest version of the game obtained from the Versions API.
+        lang (str): locale of the raw data file.
+        langs (Tuple[str, ...]): locales of the localized file.
+        fetched_langs (List[str]): locales fetched by the last run, the main one first.
+        changed (bool): whether the last fetch downloaded a payload that was not cached yet.
     """
 
     def __init__(self) -> None:
         """
-        Initializes the ExtractChamps Class, setting the base URL and getting the latest version of the game.
+        Initializes the ExtractChamps Class, setting up the payload cache and getting the latest version of the game.
         """
-        self.base_url = "https://ddragon.leagueoflegends.com/cdn/{}/data/{}/champion.json"
+        self.cache = DataDragonCache()
         self.version = get_latest_version()
         self.lang = Riot.LANG
+        self.langs = Riot.LANGS
+        self.fetched_langs: List[str] = []
+        self.changed = False
+        self.storage = FrameStorage()
 
-    def run(self) -> None:
+    @metrics.instrument
+    def run(self) -> bool:
         """
         Runs the champion data extraction process.
 
-        Fetches the data, converts it to a DataFrame and saves it to a CSV file.
+        Fetches the data, converts it to DataFrames and saves them to the raw and localized data files. When the
+        payloads of the current patch were already cached and extracted, nothing is written.
+
+        Returns:
+            bool: true if new champion data was saved, false if it is unchanged or could not be fetched.
         """
-        data = self.fetch_data()
-        if data:
-            df = self.to_dataframe(data)
-            self.save_to_csv(df)
-            print("✅ Extract Champion Data Saved Successfully!")
-        else:
+        payloads = self.fetch_data()
+        if not payloads:
             print("⛔ Failed to Get Champion Data!!!")
-
-    def fetch_data(self) -> Dict:
+            return False
+        extracted = self.storage.exists(LocalPathChamps.RAW) and self.storage.exists(LocalPathChamps.LOCALIZED)
+        if not self.changed and extracted:
+            print(f"⏭️ Champion Data for Patch {self.version} Already Extracted!")
+            return False
+
+        df = self.to_dataframe(payloads[self.lang])
+        self.save_data(df)
+        self.save_data(self.to_localized(payloads), LocalPathChamps.LOCALIZED)
+        print(f"✅ Extract Champion Data Saved Successfully! ({len(payloads)} locales)")
+        return True
+
+    def fetch_data(self) -> Dict[str, Dict]:
         """
-        Fetches champion data using the API.
+        Fetches champion data using the API, in every locale at once.
 
         Returns:
-            Dict: A dictionary with the champions' data, or an empty dictionary if there is a failure.
+            Dict[str, Dict]: The champions' data by locale, or an empty dictionary if there is a failure.
         """
         if self.version:
-            final_url = self.base_url.format(self.version, self.lang)
-            response = requests.get(final_url)
-            data = response.json()
-            return data["data"]
+            fetched = self.cache.fetch_many(self.version, self.lang, self.langs, "champion")
+            self.changed = any(changed for _, changed in fetched.values())
+            self.fetched_langs = list(fetched)
+            return {lang: payload["data"] for lang, (payload, _) in fetched.items()}
         else:
             print("⛔ Unable to Get Latest Version!!!")
             return {}
@@ -85,13 +110,29 @@ class ExtractChamps:
         return pd.DataFrame(champions)
 
     @staticmethod
-    def save_to_csv(df: pd.DataFrame, filepath: str = LocalPathChamps.RAW) -> None:
+    def to_localized(payloads: Dict[str, Dict]) -> pd.DataFrame:
+        """
+        Converts the strings of the champions in every locale into a Pandas DataFrame.
+
+        Args:
+            payloads (Dict[str, Dict]): Champion data by locale.
+
+        Returns:
+            pd.DataFrame: One row per champion and locale, keyed by the integer 'key' and 'lang'.
+        """
+        rows = [
+            {"key": champ_info["key"], "lang": lang, **{field: champ_info.get(field, "") for field in LOCALIZED_FIELDS}}
+            for lang, champs_data in payloads.items()
+            for champ_info in champs_data.values()
+        ]
+        return pd.DataFrame(rows, columns=["key", "lang", *LOCALIZED_FIELDS]).astype({"key": "int64"})
+
+    def save_data(self, df: pd.DataFrame, filepath: str = LocalPathChamps.RAW) -> None:
         """
-        Saves the DataFrame to a CSV file.
+        Saves the DataFrame to the raw data file.
 
         Args:
             df (pd.DataFrame): DataFrame containing champions data.
-            filepath (str): File path where the data will be saved.
+            filepath (str): File path, without extension, where the data will be saved.
         """
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        df.to_csv(filepath, index=False, sep=",")
+        self.storage.write(df, filepath)
@@ -0,0 +1,106 @@
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from pylegends.common.storage import FrameStorage
+from pylegends.utils.config import LocalPathChamps
+
+
+class ChampionIndex:
+    """
+    Champion dimension indexed by 'key', for joining large batches of mastery data with a positional lookup.
+
+    The champions table is small, so it is kept in memory with its text columns encoded as categoricals; joining a
+    batch looks up the position of each champion key once and takes the champion columns at those positions, which is
+    linear in the batch size and copies only category codes for the text columns. Indexes loaded from the clean file are
+    cached until the file changes.
+
+    Attributes:
+        keys (pd.Index): Champion keys, in the order of the table rows.
+        table (pd.DataFrame): Champion columns other than 'key', with text columns as categoricals.
+    """
+
+    _cache: Dict[str, Tuple[int, "ChampionIndex"]] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, champions: pd.DataFrame) -> None:
+        """
+        Builds the index from the clean champions table.
+
+        Args:
+            champions (pd.DataFrame): Champion data with a unique 'key' column.
+        """
+        if champions["key"].duplicated().any():
+            raise ValueError("The champions table has duplicated keys.")
+        self.keys = pd.Index(champions["key"].to_numpy())
+        self.table = self.encode(champions.drop(columns="key").reset_index(drop=True))
+
+    @classmethod
+    def load(cls, stem: str = LocalPathChamps.CLEAN, storage: Optional[FrameStorage] = None) -> "ChampionIndex":
+        """
+        Returns the index of the clean champions file, building it only if the file changed since the last call.
+
+        Args:
+            stem (str): Champions artifact path, without extension.
+            storage (Optional[FrameStorage]): Storage that defines the format of the artifact.
+
+        Returns:
+            ChampionIndex: The index of the current champions file.
+        """
+        storage = storage or FrameStorage()
+        path = os.path.abspath(storage.path(stem))
+        modified = os.stat(path).st_mtime_ns
+        with cls._lock:
+            cached = cls._cache.get(path)
+            if cached is None or cached[0] != modified:
+                cached = (modified, cls(storage.read(stem)))
+                cls._cache[path] = cached
+            return cached[1]
+
+    @staticmethod
+    def encode(table: pd.DataFrame) -> pd.DataFrame:
+        """
+        Encodes the text columns of the table as categoricals; list and numeric columns are kept as they are.
+
+        Args:
+            table (pd.DataFrame): Champion columns.
+
+        Returns:
+            pd.DataFrame: The table with its text columns encoded.
+        """
+        encoded = {}
+        for column in table.columns:
+            values = table[column]
+            is_text = pd.api.types.is_string_dtype(values.dtype) and all(isinstance(value, str) for value in values)
+            encoded[column] = values.astype("category") if is_text else values
+        return pd.DataFrame(encoded)
+
+    def join(self, mastery: pd.DataFrame, order: Optional[Callable[[List[str]], List[str]]] = None) -> pd.DataFrame:
+        """
+        Inner joins a batch of mastery data with the champions on 'key', keeping the order of the mastery rows.
+
+        Columns present in both tables get the "_x" (mastery) and "_y" (champion) suffixes, as in pd.merge. The result
+        shares the memory of the mastery columns instead of copying them.
+
+        Args:
+            mastery (pd.DataFrame): Mastery data with a 'key' column.
+            order (Optional[Callable[[List[str]], List[str]]]): Orders the columns of the result, in the same pass.
+
+        Returns:
+            pd.DataFrame: The joined data.
+        """
+        positions = self.keys.get_indexer(mastery["key"])
+        found = positions >= 0
+        if not found.all():
+            mastery = mastery.loc[found]
+            positions = positions[found]
+
+        shared = set(mastery.columns) & set(self.table.columns)
+        columns = {(f"{name}_x" if name in shared else name): mastery[name].array for name in mastery.columns}
+        for name in self.table.columns:
+            columns[f"{name}_y" if name in shared else name] = self.table[name].take(positions).array
+
+        names = order(list(columns)) if order else list(columns)
+        return pd.DataFrame({name: columns[name] for name in names}, copy=False)
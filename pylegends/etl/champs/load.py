@@ -1,20 +1,41 @@
+from pymongo import ASCENDING, IndexModel
+
+from pylegends.common import metrics
 from pylegends.common.mongodb import MongoDBConnector
-from pylegends.utils.config import LocalPathChamps
+from pylegends.utils.config import LocalPathChamps, MongoDB
 
 
 class LoadChamps:
-    """Class for loading data into MongoDB 'champs' collection."""
+    """Class for loading data into MongoDB 'champs' and 'champs_localized' collections."""
 
     @staticmethod
+    @metrics.instrument
     def run() -> None:
-        """Loads data from a CSV file into the 'champs' collection."""
+        """
+        Loads data from the data file into the 'champs' collection, keyed by 'key', and the strings of each locale into
+        'champs_localized', keyed by 'key' and 'lang'.
+        """
         loader = MongoDBConnector()
         loader.connect()
+        loader.create_indexes(MongoDB.DATABASE, "champs", [IndexModel("key", unique=True, name="key")])
         loader.load_data(
-            "pylegends",
+            MongoDB.DATABASE,
             "champs",
             LocalPathChamps.CLEAN,
             "key",
+            batch_size=MongoDB.BATCH_SIZE,
+        )
+        loader.create_indexes(
+            MongoDB.DATABASE,
+            "champs_localized",
+            [IndexModel([("key", ASCENDING), ("lang", ASCENDING)], unique=True, name="key_lang")],
+        )
+        loader.load_data(
+            MongoDB.DATABASE,
+            "champs_localized",
+            LocalPathChamps.LOCALIZED,
+            ["key", "lang"],
+            batch_size=MongoDB.BATCH_SIZE,
         )
         loader.close()
 
@@ -2,18 +2,20 @@ from typing import List, Optional, Tuple
 
 import pandas as pd
 
+from pylegends.common import metrics
+from pylegends.common.storage import FrameStorage
 from pylegends.utils.config import LocalPathChamps
 
 
 class TransformChamps:
     """Class responsible for transforming data from League of Legends Champions.
 
-    Loads data from a CSV file, performs transformations such as deleting and renaming columns, and saves the result to
-    a new CSV file.
+    Loads the raw data file, performs transformations such as deleting and renaming columns, and saves the result to
+    the clean data file.
 
     Attributes:
         dataframe (pd.DataFrame): DataFrame containing champions data.
-        file_path (str): path of the input CSV file.
+        file_path (str): path of the input data file.
         columns_to_drop (List[str]): List of columns to exclude from the DataFrame.
     """
 
@@ -26,20 +28,23 @@ class TransformChamps:
             "id",
             "championPointsSinceLastLevel",
         ]
+        self.storage = FrameStorage()
 
+    @metrics.instrument
     def run(self) -> Tuple[Optional[pd.DataFrame], str]:
         """
         Performs the complete data transformation process.
 
-        Load the CSV, delete columns, rename columns, calculate new columns and save the new DataFrame.
+        Load the data, delete columns, rename columns, cast column types and save the new DataFrame.
 
         Returns:
             Tuple[Optional[pd.DataFrame], str]: a tuple containing the transformed DataFrame and a status message.
         """
-        if self.load_csv(self.file_path) and self.drop_columns(self.columns_to_drop):
+        if self.load_data(self.file_path) and self.drop_columns(self.columns_to_drop):
             self.rename_columns()
+            self.cast_types()
 
-            save_status = self.save_csv(LocalPathChamps.CLEAN)
+            save_status = self.save_data(LocalPathChamps.CLEAN)
             if save_status:
                 return (
                     self.dataframe,
@@ -52,18 +57,18 @@ class TransformChamps:
                 )
         return None, "Error loading file or deleting columns!!!"
 
-    def load_csv(self, file_path: str) -> bool:
+    def load_data(self, file_path: str) -> bool:
         """
-        Loads the CSV file into a DataFrame.
+        Loads the data file into a DataFrame.
 
         Args:
-            file_path (str): CSV file path.
+            file_path (str): data file path, without extension.
 
         Returns:
             bool: true if the file is loaded successfully, false otherwise.
         """
         try:
-            self.dataframe = pd.read_csv(file_path)
+            self.dataframe = self.storage.read(file_path)
             return True
         except FileNotFoundError:
             print(f"File not found: {file_path}")
@@ -94,19 +99,26 @@ class TransformChamps:
         else:
             print("Dataframe Was Not Loaded!!!")
 
-    def save_csv(self, save_path: str) -> bool:
+    def cast_types(self) -> None:
+        """Casts the champion 'key' to integer, the type of the champion ids in the mastery data."""
+        if self.dataframe is not None:
+            self.dataframe["key"] = self.dataframe["key"].astype("int64")
+        else:
+            print("Dataframe Was Not Loaded!!!")
+
+    def save_data(self, save_path: str) -> bool:
         """
-        Saves the DataFrame to a CSV file.
+        Saves the DataFrame to the clean data file.
 
         Args:
-            save_path (str): Path of the destination CSV file.
+            save_path (str): Path of the destination file, without extension.
 
         Returns:
             bool: true if the file is saved successfully, false otherwise.
         """
         if self.dataframe is not None:
             try:
-                self.dataframe.to_csv(save_path, index=False)
+                self.storage.write(self.dataframe, save_path)
                 print("✅ Transform Champion Data Saved Successfully!")
                 return True
             except Exception as e:
@@ -1,74 +1,112 @@
-import json
-import os
-from typing import Dict
+from typing import Dict, List
 
 import pandas as pd
-import requests
 
+from pylegends.common import metrics
+from pylegends.common.cache import DataDragonCache
+from pylegends.common.storage import FrameStorage
 from pylegends.common.version import get_latest_version
 from pylegends.utils.config import LocalPathItems, Riot
 
+LOCALIZED_FIELDS = ["name", "description", "colloquial", "plaintext"]
+
 
 class ExtractItems:
     """
     Class responsible for extracting information from Riot API items.
 
-    This class makes requests to the game's API to obtain the latest item data and saves it in a JSON file.
+    This class makes requests to the game's API to obtain the latest item data and saves it to the raw data file.
+    The payloads of every configured locale are downloaded concurrently: the locale-independent data (gold, stats,
+    maps, tags, build tree) is stored once, from the main locale, and only the strings of each locale are stored in
+    the localized file.
     """
 
     def __init__(self):
         """Initializes the class with the desired version of the item data."""
-        self.base_url = "https://ddragon.leagueoflegends.com/cdn/{}/data/{}/item.json"
+        self.cache = DataDragonCache()
         self.version = get_latest_version()
         self.lang = Riot.LANG
+        self.langs = Riot.LANGS
+        self.fetched_langs: List[str] = []
+        self.changed = False
+        self.storage = FrameStorage()
 
-    def run(self) -> None:
-        """Performs the process of extracting data from items."""
-        data = self.fetch_data()
-        if data:
-            df = pd.DataFrame.from_dict(data, orient="index")
-            self.save_to_csv(df)
-            print("✅ Extract Item Data Saved Successfully!")
-        else:
+    @metrics.instrument
+    def run(self) -> bool:
+        """
+        Performs the process of extracting data from items.
+
+        Returns:
+            bool: true if new item data was saved, false if it is unchanged or could not be fetched.
+        """
+        payloads = self.fetch_data()
+        if not payloads:
             print("⛔ Failed to Get Item Data!!!")
+            return False
+        extracted = self.storage.exists(LocalPathItems.RAW) and self.storage.exists(LocalPathItems.LOCALIZED)
+        if not self.changed and extracted:
+            print(f"⏭️ Item Data for Patch {self.version} Already Extracted!")
+            return False
+
+        df = self.to_dataframe(payloads[self.lang])
+        self.save_data(df)
+        self.save_data(self.to_localized(payloads), LocalPathItems.LOCALIZED)
+        print(f"✅ Extract Item Data Saved Successfully! ({len(payloads)} locales)")
+        return True
 
-    def fetch_data(self) -> Dict:
+    def fetch_data(self) -> Dict[str, Dict]:
         """
-        Fetches champion data using the API.
+        Fetches item data using the API, in every locale at once.
 
         Returns:
-            Dict: A dictionary with the champions' data, or an empty dictionary if there is a failure.
+            Dict[str, Dict]: The items' data by locale, or an empty dictionary if there is a failure.
         """
         if self.version:
-            final_url = self.base_url.format(self.version, self.lang)
-            response = requests.get(final_url)
-            data = response.json()
-            return data["data"]
+            fetched = self.cache.fetch_many(self.version, self.lang, self.langs, "item")
+            self.changed = any(changed for _, changed in fetched.values())
+            self.fetched_langs = list(fetched)
+            return {lang: payload["data"] for lang, (payload, _) in fetched.items()}
         else:
             print("⛔ Unable to Get Latest Version!!!")
             return {}
 
-    def fetch_items(self) -> dict:
+    @staticmethod
+    def to_dataframe(items_data: Dict) -> pd.DataFrame:
         """
-        Makes the request to the API and returns the item data.
+        Converts item data into a Pandas DataFrame, keeping the item id, which is the key of each item in the payload.
+
+        Args:
+            items_data (Dict): Dictionary containing item data, by item id.
 
-         Returns:
-             dict: dictionary containing item data.
+        Returns:
+            pd.DataFrame: DataFrame containing item data, with the 'id' column first.
         """
-        response = requests.get(self.base_url)
-        if response.status_code == 200:
-            return json.loads(response.content)
-        else:
-            raise Exception(f"⛔ Error when fetching item data: {response.status_code}")
+        return pd.DataFrame.from_dict(items_data, orient="index").rename_axis("id").reset_index()
 
     @staticmethod
-    def save_to_csv(df: pd.DataFrame, filepath: str = LocalPathItems.RAW) -> None:
+    def to_localized(payloads: Dict[str, Dict]) -> pd.DataFrame:
+        """
+        Converts the strings of the items in every locale into a Pandas DataFrame.
+
+        Args:
+            payloads (Dict[str, Dict]): Item data by locale, each by item id.
+
+        Returns:
+            pd.DataFrame: One row per item and locale, keyed by the integer 'id' and 'lang'.
+        """
+        rows = [
+            {"id": item_id, "lang": lang, **{field: item_info.get(field, "") for field in LOCALIZED_FIELDS}}
+            for lang, items_data in payloads.items()
+            for item_id, item_info in items_data.items()
+        ]
+        return pd.DataFrame(rows, columns=["id", "lang", *LOCALIZED_FIELDS]).astype({"id": "int64"})
+
+    def save_data(self, df: pd.DataFrame, filepath: str = LocalPathItems.RAW) -> None:
         """
-        Saves the DataFrame to a CSV file.
+        Saves the DataFrame to the raw data file.
 
         Args:
-            df (pd.DataFrame): DataFrame containing champions data.
-            filepath (str): File path where the data will be saved.
+            df (pd.DataFrame): DataFrame containing items data.
+            filepath (str): File path, without extension, where the data will be saved.
         """
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        df.to_csv(filepath, index=False, sep=",")
+        self.storage.write(df, filepath)
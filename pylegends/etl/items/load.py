@@ -1,20 +1,58 @@
+from pymongo import ASCENDING, IndexModel
+
+from pylegends.common import metrics
 from pylegends.common.mongodb import MongoDBConnector
-from pylegends.utils.config import LocalPathItems
+from pylegends.utils.config import LocalPathItems, MongoDB
 
 
 class LoadItems:
-    """Class for loading data into MongoDB 'champs' collection."""
+    """Class for loading data into MongoDB 'items', 'items_tree' and 'items_localized' collections."""
 
     @staticmethod
+    @metrics.instrument
     def run() -> None:
-        """Loads data from a CSV file into the 'items' collection."""
+        """
+        Loads clean item data into the 'items' collection, keyed by 'id', the build tree into 'items_tree' and the
+        strings of each locale into 'items_localized', keyed by 'id' and 'lang'. Items loaded by earlier versions,
+        keyed by 'name' and without 'id', are deleted first.
+        """
         loader = MongoDBConnector()
         loader.connect()
+        loader.drop_unkeyed(MongoDB.DATABASE, "items", "id")
+        loader.create_indexes(MongoDB.DATABASE, "items", [IndexModel("id", unique=True, name="id")])
         loader.load_data(
-            "pylegends",
+            MongoDB.DATABASE,
             "items",
-            LocalPathItems.RAW,
-            "name",
+            LocalPathItems.CLEAN,
+            "id",
+            batch_size=MongoDB.BATCH_SIZE,
+        )
+        loader.create_indexes(
+            MongoDB.DATABASE,
+            "items_tree",
+            [
+                IndexModel([("id", ASCENDING), ("component", ASCENDING)], unique=True, name="id_component"),
+                IndexModel("component", name="component"),
+            ],
+        )
+        loader.load_data(
+            MongoDB.DATABASE,
+            "items_tree",
+            LocalPathItems.TREE,
+            ["id", "component"],
+            batch_size=MongoDB.BATCH_SIZE,
+        )
+        loader.create_indexes(
+            MongoDB.DATABASE,
+            "items_localized",
+            [IndexModel([("id", ASCENDING), ("lang", ASCENDING)], unique=True, name="id_lang")],
+        )
+        loader.load_data(
+            MongoDB.DATABASE,
+            "items_localized",
+            LocalPathItems.LOCALIZED,
+            ["id", "lang"],
+            batch_size=MongoDB.BATCH_SIZE,
         )
         loader.close()
 
@@ -1,85 +1,194 @@
-import json
-import os
-from typing import Dict, Optional
+import ast
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import requests
 
+from pylegends.common import metrics
+from pylegends.common.storage import FrameStorage
 from pylegends.utils.config import LocalPathItems
 
+TREE_COLUMNS = ["from", "into"]
+
+FILL_VALUES: Dict[str, Any] = {"stats": 0.0, "maps": False}
+
 
 class TransformItems:
     """
-    Class responsible for transform information from Riot API items.
+    Class responsible for transforming the item data extracted from Data Dragon.
+
+    Reads the raw item data file written by ExtractItems, so no request is made, and flattens its nested objects into
+    typed columns prefixed by the object's name, e.g. 'gold_total', 'stats_FlatArmorMod' or 'maps_11'. Stats missing
+    from an item are 0 and maps missing are False. The build tree held by the 'from' and 'into' lists is moved to a
+    separate edge table with one row per item and component. Both are saved keyed by the integer item 'id'.
 
-    This class makes requests to the game's API to obtain the latest item data and saves it in a JSON file.
+    Attributes:
+        dataframe (Optional[pd.DataFrame]): Raw item data, or the clean item data after run.
+        tree (Optional[pd.DataFrame]): Build tree edges, 'id' of the item and 'component' of one of its components.
+        file_path (str): Raw data file path, without extension.
+        persist (bool): Whether the clean data and the build tree are saved.
     """
 
-    def __init__(self):
-        """Initializes the class with the desired version of the item data."""
-        self.base_url = "https://ddragon.leagueoflegends.com/cdn/{}/data/pt_BR/item.json"
-        self.version = self.get_latest_version()
-
-    def run(self) -> None:
-        """Performs the process of extracting data from items."""
-        data = self.fetch_data()
-        if data:
-            df = pd.DataFrame.from_dict(data, orient="index")
-            self.save_to_csv(df)
-        else:
-            print("⛔ Failed to Get Item Data!!!")
-
-    def fetch_data(self) -> Dict:
+    def __init__(self, dataframe: Optional[pd.DataFrame] = None, persist: bool = True) -> None:
+        """
+        Initializes the class with the raw item data.
+
+        Args:
+            dataframe (Optional[pd.DataFrame]): Raw item data already in memory; read from the raw file if None.
+            persist (bool): Whether to save the clean data and the build tree.
+        """
+        self.dataframe: Optional[pd.DataFrame] = dataframe
+        self.tree: Optional[pd.DataFrame] = None
+        self.file_path = LocalPathItems.RAW
+        self.persist = persist
+        self.storage = FrameStorage()
+
+    @metrics.instrument
+    def run(self) -> Tuple[Optional[pd.DataFrame], str]:
+        """
+        Performs the transformation: loads the raw data, builds the tree, flattens the nested objects and saves them.
+
+        Returns:
+            Tuple[Optional[pd.DataFrame], str]: Clean item data and status message.
+        """
+        if self.dataframe is not None:
+            metrics.record("rows_in", len(self.dataframe))
+        elif not self.load_data(self.file_path):
+            return None, "⛔ Error loading file!!!"
+
+        raw = self.dataframe
+        if "id" not in raw.columns:
+            return None, "⛔ The raw item data has no 'id' column, extract it again!!!"
+        ids = raw["id"].astype("int64").to_numpy()
+        nested = {column: self.decode(raw[column]) for column in raw.columns if self.is_nested(raw[column])}
+
+        self.tree = self.build_tree(ids, {column: nested.pop(column) for column in TREE_COLUMNS if column in nested})
+        self.dataframe = self.flatten(raw.drop(columns=TREE_COLUMNS, errors="ignore"), nested)
+        self.dataframe["id"] = ids
+
+        save_status = self.save_data() if self.persist else True
+        return self.dataframe, "✅ Success!" if save_status else "⛔ Error saving!!!"
+
+    def load_data(self, file_path: str) -> bool:
+        """Load data file into DataFrame. Returns True if successful, False otherwise."""
+        try:
+            self.dataframe = self.storage.read(file_path)
+            return True
+        except FileNotFoundError:
+            print(f"⛔ File not found: {file_path}")
+            return False
+
+    @staticmethod
+    def is_nested(values: pd.Series) -> bool:
         """
-        Fetches champion data using the API.
+        Checks whether a column holds objects or lists: as read from Parquet (dicts and arrays) or from CSV (their
+        Python representation).
+
+        Args:
+            values (pd.Series): Column of the raw data.
 
         Returns:
-            Dict: a dictionary with the item data, or an empty dictionary if there is a failure.
+            bool: true if every non-null value is an object or a list.
         """
-        if self.version:
-            final_url = self.base_url.format(self.version)
-            response = requests.get(final_url)
-            data = response.json()
-            return data["data"]
-        else:
-            print("⛔ Unable to Get Latest Version!!!")
-            return {}
-
-    def fetch_items(self) -> dict:
+        present = values.dropna()
+        if present.empty or pd.api.types.is_numeric_dtype(present.dtype):
+            return False
+        if isinstance(present.iloc[0], (dict, list, np.ndarray)):
+            return True
+        text = present.astype(str)
+        return bool(((text.str[:1].isin(["{", "["])) & (text.str[-1:].isin(["}", "]"]))).all())
+
+    @staticmethod
+    def decode(values: pd.Series) -> List[Any]:
         """
-        Makes the request to the API and returns the item data.
+        Converts a nested column back to Python objects and lists.
+
+        Parquet structs carry every field seen in the column, so the fields an item does not have are dropped again.
+
+        Args:
+            values (pd.Series): Nested column of the raw data.
 
         Returns:
-            dict: Dictionary containing item data.
+            List[Any]: Dicts, lists or None, one per row.
         """
-        response = requests.get(self.base_url)
-        if response.status_code == 200:
-            return json.loads(response.content)
-        else:
-            raise Exception(f"Error when fetching item data: {response.status_code}")
+        decoded = []
+        for value in values:
+            if isinstance(value, str):
+                value = ast.literal_eval(value)
+            if isinstance(value, dict):
+                value = {key: item for key, item in value.items() if item is not None}
+            elif isinstance(value, np.ndarray):
+                value = value.tolist()
+            elif not isinstance(value, list):
+                value = None
+            decoded.append(value)
+        return decoded
 
     @staticmethod
-    def get_latest_version() -> Optional[str]:
+    def build_tree(ids: np.ndarray, lists: Dict[str, List[Optional[List[str]]]]) -> pd.DataFrame:
         """
-        Gets the latest version of the game from the API.
+        Builds the edge table of the build tree from the 'from' (components) and 'into' (upgrades) lists.
+
+        Args:
+            ids (np.ndarray): Item ids, in row order.
+            lists (Dict[str, List[Optional[List[str]]]]): Decoded 'from' and 'into' lists, one per row.
 
         Returns:
-            Optional[str]: The latest version of the game, or None if the request fails.
+            pd.DataFrame: Unique ('id', 'component') edges, sorted.
         """
-        versions_url = "https://ddragon.leagueoflegends.com/api/versions.json"
-        response = requests.get(versions_url)
-        versions = response.json()
-        return versions[0] if versions else None
+        edges = [pd.DataFrame({"id": pd.Series(dtype="int64"), "component": pd.Series(dtype="int64")})]
+        for column, values in lists.items():
+            exploded = pd.DataFrame({"item": ids, "linked": [value or [] for value in values]}).explode("linked")
+            exploded = exploded.dropna(subset=["linked"])
+            linked = exploded["linked"].astype("int64").to_numpy()
+            item = exploded["item"].to_numpy()
+            edge = {"id": item, "component": linked} if column == "from" else {"id": linked, "component": item}
+            edges.append(pd.DataFrame(edge))
+        tree = pd.concat(edges, ignore_index=True).drop_duplicates()
+        return tree.sort_values(["id", "component"], ignore_index=True)
 
     @staticmethod
-    def save_to_csv(df: pd.DataFrame, filepath: str = LocalPathItems.RAW) -> None:
+    def flatten(dataframe: pd.DataFrame, nested: Dict[str, List[Any]]) -> pd.DataFrame:
         """
-        Saves the DataFrame to a CSV file.
+        Replaces the object columns by one typed column per field, prefixed by the object's name.
 
         Args:
-            df (pd.DataFrame): DataFrame containing items data.
-            filepath (str): File path where the data will be saved.
+            dataframe (pd.DataFrame): Raw item data without the build tree.
+            nested (Dict[str, List[Any]]): Decoded nested columns; lists (e.g. 'tags') are kept as they are.
+
+        Returns:
+            pd.DataFrame: The item data with flat columns.
         """
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        df.to_csv(filepath, index=False, sep=",")
-        print("✅ Transform Items Data Saved Successfully!")
+        frames = [dataframe.drop(columns=list(nested))]
+        for column, values in nested.items():
+            if not any(isinstance(value, dict) for value in values):
+                frames.append(pd.DataFrame({column: values}, index=dataframe.index))
+                continue
+            flat = pd.json_normalize([value or {} for value in values], sep="_").add_prefix(f"{column}_")
+            flat.index = dataframe.index
+            if column in FILL_VALUES:
+                flat = flat.fillna(FILL_VALUES[column]).astype(type(FILL_VALUES[column]))
+            frames.append(flat.infer_objects())
+        return pd.concat(frames, axis=1)
+
+    def save_data(self) -> bool:
+        """
+        Saves the clean item data and the build tree.
+
+        Returns:
+            bool: true if both files are saved successfully, false otherwise.
+        """
+        try:
+            self.storage.write(self.dataframe, LocalPathItems.CLEAN)
+            self.storage.write(self.tree, LocalPathItems.TREE)
+            print(f"✅ Transform Items Data Saved Successfully! ({len(self.dataframe)} items, {len(self.tree)} edges)")
+            return True
+        except Exception as e:
+            print(f"⛔ Error saving file: {e}")
+            return False
+
+
+if __name__ == "__main__":
+    transformer = TransformItems()
+    dataframe, message = transformer.run()
+    print(message)
@@ -1,60 +1,281 @@
+import asyncio
+import contextvars
+import json
 import os
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 import requests
 
-from pylegends.utils.config import Riot
+from pylegends.common import metrics
+from pylegends.common.http_client import get_http_client
+from pylegends.common.storage import FrameStorage
+from pylegends.utils.config import LocalPathMastery, Riot
 
 
 class ExtractMastery:
     """
-    Class to extract champion mastery information for a specific player using the Riot Games API.
+    Class to extract champion mastery information for one or many players using the Riot Games API.
 
-    This class makes requests to the Riot Games API to obtain champions' mastery data and saves it to a CSV file.
+    This class makes requests to the Riot Games API to obtain champions' mastery data and saves it to the raw data
+    file. The requests of all players are fanned out concurrently on an asyncio event loop, within the Riot rate limits
+    enforced by the shared HTTP client; each player's rows are appended to the file as soon as they arrive and failed
+    players are recorded for a later retry instead of aborting the run. Each player is requested from the host of its
+    platform, and since the rate limits apply per platform, every platform has its own worker pool and all of them
+    progress at once.
 
     Attributes:
-        BASE_URL (str): Base URL to access champion mastery data.
-        PUUID (str): Player ID (PUUID) for which mastery will be extracted.
+        BASE_URL (str): Base URL to access champion mastery data, formatted with the platform.
+        PUUID (str): Player ID (PUUID) for which mastery will be extracted when no list is given.
         API_KEY (str): Riot Games API Key.
+        puuids (List[str]): Players whose mastery will be extracted.
+        platforms (Dict[str, str]): Platform of each player, e.g. "br1".
+        concurrency (int): Number of requests in flight at the same time on each platform.
+        failures (Dict[str, str]): Error of each player whose extraction failed.
+        in_memory (bool): Whether the extracted rows are also kept in memory and returned by run.
+        persist (bool): Whether the extracted rows are written to the raw data file.
     """
 
-    def __init__(self) -> None:
-        """Initializes the class with settings to access the Riot Games API."""
+    def __init__(
+        self,
+        puuids: Optional[List[str]] = None,
+        puuids_file: Optional[str] = Riot.PUUIDS_FILE,
+        concurrency: int = Riot.CONCURRENCY,
+        retry_failures: bool = False,
+        in_memory: bool = False,
+        persist: bool = True,
+    ) -> None:
+        """
+        Initializes the class with settings to access the Riot Games API.
+
+        Args:
+            puuids (Optional[List[str]]): Players to extract, as "<puuid>" or "<platform>,<puuid>"; takes precedence
+                over the file.
+            puuids_file (Optional[str]): File with one player per line, in the same format; defaults to the single
+                configured PUUID.
+            concurrency (int): Number of requests in flight at the same time on each platform.
+            retry_failures (bool): Whether to extract only the players that failed on the previous run, appending their
+                rows to the existing raw file.
+            in_memory (bool): Whether to keep the extracted rows in memory and return them from run.
+            persist (bool): Whether to write the extracted rows to the raw data file.
+        """
         self.BASE_URL = Riot.URL_CHAMPS
         self.PUUID = Riot.PUUID
         self.API_KEY = os.environ.get("API_KEY")
+        self.concurrency = concurrency
+        self.retry_failures = retry_failures
+        self.in_memory = in_memory
+        self.persist = persist
+        self.failures: Dict[str, str] = {}
+        self.storage = FrameStorage()
+
+        if retry_failures:
+            entries = list(self.read_failures())
+        elif puuids:
+            entries = list(puuids)
+        elif puuids_file:
+            entries = self.read_puuids(puuids_file)
+        else:
+            entries = [self.PUUID]
+        self.platforms: Dict[str, str] = dict(self.parse_player(entry) for entry in entries)
+        self.puuids = list(self.platforms)
 
-    def run(self) -> None:
+    @metrics.instrument
+    def run(self) -> Optional[pd.DataFrame]:
         """
-        Performs the process of extracting data from the API, transforming it into a DataFrame and saving it in CSV.
+        Performs the process of extracting data from the API, transforming it into a DataFrame and saving it.
+
+        Returns:
+            Optional[pd.DataFrame]: The extracted rows when running in memory, None otherwise.
         """
         try:
-            response = self.get_champion_mastery()
-            if not response:
+            frames: List[pd.DataFrame] = []
+            saved = asyncio.run(self.extract_all(frames.append if self.in_memory else None))
+            self.save_failures()
+            if not saved:
                 raise ValueError("⛔ No Data Returned by API!!!")
 
-            dataframe = self.response_to_dataframe(response)
-            self.save_dataframe_to_csv(dataframe)
-            print("✅ Extract Mastery Data Saved Successfully!")
+            platforms = len(set(self.platforms.values()))
+            print(
+                f"✅ Extract Mastery Data Saved Successfully! "
+                f"({saved} players on {platforms} platforms, {len(self.failures)} failed)"
+            )
+            return pd.concat(frames, ignore_index=True) if self.in_memory else None
         except Exception as err:
             raise Exception(f"⛔ Error During RiotGamesAPI Execution: {err}") from err
 
-    def get_champion_mastery(self) -> Optional[Dict]:
+    async def extract_all(self, collect: Optional[Callable[[pd.DataFrame], None]] = None) -> int:
+        """
+        Fetches the mastery of every player concurrently, handing each response over as soon as it arrives.
+
+        Each platform gets its own thread pool and semaphore, so that a slow or throttled platform does not hold the
+        workers of the others.
+
+        Args:
+            collect (Optional[Callable[[pd.DataFrame], None]]): Receives the rows of each player, in addition to the raw
+                data file when it is persisted.
+
+        Returns:
+            int: Number of players whose mastery was saved.
+        """
+        with ExitStack() as stack:
+            sinks = [collect] if collect else []
+            if self.persist:
+                writer = stack.enter_context(self.storage.writer(LocalPathMastery.RAW, append=self.retry_failures))
+                sinks.append(writer.write)
+
+            pools: Dict[str, Tuple[ThreadPoolExecutor, asyncio.Semaphore]] = {}
+            for platform in dict.fromkeys(self.platforms.values()):
+                executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix=f"mastery-{platform}")
+                )
+                pools[platform] = executor, asyncio.Semaphore(self.concurrency)
+            results = await asyncio.gather(
+                *(self.extract_player(puuid, *pools[self.platforms[puuid]], sinks) for puuid in self.puuids)
+            )
+        return sum(results)
+
+    async def extract_player(
+        self,
+        puuid: str,
+        executor: ThreadPoolExecutor,
+        semaphore: asyncio.Semaphore,
+        sinks: List[Callable[[pd.DataFrame], None]],
+    ) -> bool:
+        """
+        Fetches one player and hands the rows over, with the player's platform, recording the error if the request
+        fails.
+
+        Args:
+            puuid (str): Player ID (PUUID).
+            executor (ThreadPoolExecutor): Pool of the player's platform running the blocking HTTP requests.
+            semaphore (asyncio.Semaphore): Bounds the number of requests in flight on the player's platform.
+            sinks (List[Callable[[pd.DataFrame], None]]): Receivers of the player's rows.
+
+        Returns:
+            bool: true if rows of the player were saved.
+        """
+        async with semaphore:
+            try:
+                context = contextvars.copy_context()
+                response = await asyncio.get_running_loop().run_in_executor(
+                    executor, context.run, self.request_mastery, puuid
+                )
+            except Exception as err:
+                self.failures[f"{self.platforms[puuid]},{puuid}"] = str(err)
+                return False
+
+        dataframe = self.response_to_dataframe(response)
+        if dataframe.empty:
+            return False
+        if "puuid" not in dataframe.columns:
+            dataframe["puuid"] = puuid
+        dataframe["platform"] = self.platforms[puuid]
+        for sink in sinks:
+            sink(dataframe)
+        return True
+
+    def request_mastery(self, puuid: str) -> List[Dict]:
+        """
+        Requests the champion mastery of a player from the host of its platform, raising if the request fails.
+
+        Args:
+            puuid (str): Player ID (PUUID).
+
+        Returns:
+            List[Dict]: champion mastery data of the player.
+        """
+        url = f"{self.BASE_URL.format(platform=self.platforms.get(puuid, Riot.PLATFORM))}{puuid}"
+        response = get_http_client().get(url, headers={"X-Riot-Token": self.API_KEY})
+        response.raise_for_status()
+        return response.json()
+
+    def get_champion_mastery(self, puuid: Optional[str] = None) -> Optional[Dict]:
         """
         Get single-player champion mastery from the Riot Games API.
 
+        Args:
+            puuid (Optional[str]): Player ID (PUUID); defaults to the configured one.
+
         Returns:
             Optional[Dict]: champion mastery data or None if the request fails.
         """
-        url = f"{self.BASE_URL}{self.PUUID}?api_key={self.API_KEY}"
-        response = requests.get(url)
-
-        if response.status_code != 200:
-            print(f"⛔ Error when accessing the API - Status Code: {response.status_code}")
+        try:
+            return self.request_mastery(puuid or self.PUUID)
+        except requests.HTTPError as err:
+            print(f"⛔ Error when accessing the API - Status Code: {err.response.status_code}")
             return None
 
-        return response.json()
+    @staticmethod
+    def parse_player(entry: str, default_platform: str = Riot.PLATFORM) -> Tuple[str, str]:
+        """
+        Splits a player entry, "<puuid>" or "<platform>,<puuid>" (a space also separates them), into its parts.
+
+        Args:
+            entry (str): Player entry, as in the PUUIDs and failures files.
+            default_platform (str): Platform of the entries that do not give one.
+
+        Returns:
+            Tuple[str, str]: The PUUID and its platform.
+        """
+        parts = entry.replace(",", " ").split()
+        if len(parts) not in (1, 2):
+            raise ValueError(f"⛔ Invalid player entry: {entry!r}, expected '<puuid>' or '<platform>,<puuid>'!!!")
+        platform = parts[0].lower() if len(parts) == 2 else default_platform
+        if platform not in Riot.PLATFORMS:
+            raise ValueError(f"⛔ Unknown platform {platform!r} of player {parts[-1]}!!!")
+        return parts[-1], platform
+
+    @staticmethod
+    def read_puuids(file_path: str) -> List[str]:
+        """
+        Reads the players to extract from a file with one player per line, ignoring blank lines and comments.
+
+        Args:
+            file_path (str): Path of the file.
+
+        Returns:
+            List[str]: Unique player entries in file order.
+        """
+        with open(file_path, encoding="utf-8") as file:
+            lines = (line.strip() for line in file)
+            return list(dict.fromkeys(line for line in lines if line and not line.startswith("#")))
+
+    @staticmethod
+    def read_failures(file_path: str = LocalPathMastery.FAILURES) -> Dict[str, str]:
+        """
+        Reads the players that failed on the previous run.
+
+        Args:
+            file_path (str): Path of the failures file.
+
+        Returns:
+            Dict[str, str]: Error of each failed player, by "<platform>,<puuid>" entry, or an empty dictionary if there
+                is no file.
+        """
+        if not os.path.exists(file_path):
+            return {}
+        with open(file_path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def save_failures(self, file_path: str = LocalPathMastery.FAILURES) -> None:
+        """
+        Saves the players that failed on this run, or removes the file if every player succeeded.
+
+        Args:
+            file_path (str): Path of the failures file.
+        """
+        if not self.failures:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            return
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.failures, file, indent=2)
+        print(f"⚠️ {len(self.failures)} Players Failed, Saved to {file_path} for Retry!")
 
     @staticmethod
     def response_to_dataframe(response: Dict) -> pd.DataFrame:
@@ -69,19 +290,12 @@ class ExtractMastery:
         """
         return pd.DataFrame(response)
 
-    @staticmethod
-    def save_dataframe_to_csv(dataframe: pd.DataFrame, filename: str = "raw.csv") -> None:
+    def save_dataframe(self, dataframe: pd.DataFrame, filepath: str = LocalPathMastery.RAW) -> None:
         """
-        Saves the DataFrame to a CSV file.
+        Saves the DataFrame to the raw data file.
 
         Args:
             dataframe (pd.DataFrame): DataFrame to be saved.
-            filename (str): Output file name.
+            filepath (str): Output file path, without extension.
         """
-        base_path = os.path.join("data", "mastery")
-        full_path = os.path.join(base_path, filename)
-
-        if not os.path.exists(base_path):
-            os.makedirs(base_path)
-
-        dataframe.to_csv(full_path, sep=",", index=False)
+        self.storage.write(dataframe, filepath)
@@ -0,0 +1,137 @@
+import json
+import os
+import tempfile
+from typing import Dict, Optional
+
+import pandas as pd
+
+from pylegends.common import metrics
+from pylegends.common.storage import FrameStorage
+from pylegends.etl.mastery.transform import TransformMastery
+from pylegends.utils.config import LocalPathMastery
+
+
+class MasteryWatermarks:
+    """
+    Latest 'lastPlayTime' already processed for each player, used to process only the champions played since then.
+
+    The watermarks are epoch milliseconds, as returned by the Riot Games API, kept in a JSON file by PUUID. They are
+    advanced only after the changed rows have been loaded, so a failed run processes the same rows again.
+
+    Attributes:
+        file_path (str): Path of the watermarks file.
+        watermarks (Dict[str, int]): Latest processed 'lastPlayTime' of each player.
+    """
+
+    def __init__(self, file_path: str = LocalPathMastery.WATERMARKS) -> None:
+        """Initializes the watermarks with the ones saved on the previous run, if any."""
+        self.file_path = file_path
+        self.watermarks: Dict[str, int] = self.read()
+
+    def read(self) -> Dict[str, int]:
+        """
+        Reads the watermarks file.
+
+        Returns:
+            Dict[str, int]: Watermark of each player, or an empty dictionary if there is no file.
+        """
+        if not os.path.exists(self.file_path):
+            return {}
+        with open(self.file_path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def changed(self, raw: pd.DataFrame) -> pd.DataFrame:
+        """
+        Selects the raw mastery rows played after the watermark of their player.
+
+        Args:
+            raw (pd.DataFrame): Raw mastery data, with the 'puuid' and 'lastPlayTime' columns.
+
+        Returns:
+            pd.DataFrame: The rows newer than the watermarks; every row of players without one.
+        """
+        watermarks = raw["puuid"].map(self.watermarks).fillna(-1)
+        return raw.loc[raw["lastPlayTime"].to_numpy() > watermarks.to_numpy()].reset_index(drop=True)
+
+    def advance(self, raw: pd.DataFrame) -> None:
+        """
+        Moves the watermark of each player to the latest 'lastPlayTime' of its rows.
+
+        Args:
+            raw (pd.DataFrame): Raw mastery data that has been processed.
+        """
+        latest = raw.groupby("puuid")["lastPlayTime"].max()
+        for puuid, last_play_time in latest.items():
+            self.watermarks[puuid] = max(int(last_play_time), self.watermarks.get(puuid, -1))
+
+    def save(self) -> None:
+        """Writes the watermarks file, replacing it atomically through a temporary file of its own."""
+        directory = os.path.dirname(self.file_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix="watermarks.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(self.watermarks, file, indent=2)
+            os.replace(temp_path, self.file_path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+
+class MergeMastery:
+    """
+    Merges the changed rows of joined mastery data into the existing final data file.
+
+    The changed rows replace the existing ones of the same player and champion, and the champions of every affected
+    player are ranked again, since a champion that gained points can move the others.
+
+    Attributes:
+        changes (pd.DataFrame): Joined mastery data of the changed rows.
+        output_file (str): Path of the final data file, without extension.
+        dataframe (Optional[pd.DataFrame]): The merged final data, after run.
+    """
+
+    def __init__(self, changes: pd.DataFrame) -> None:
+        """
+        Initializes the class with the changed rows.
+
+        Args:
+            changes (pd.DataFrame): Joined mastery data of the changed rows.
+        """
+        self.changes = changes
+        self.output_file = LocalPathMastery.FINAL
+        self.dataframe: Optional[pd.DataFrame] = None
+        self.storage = FrameStorage()
+
+    @metrics.instrument
+    def run(self) -> pd.DataFrame:
+        """
+        Merges the changes into the final data file and saves it.
+
+        Returns:
+            pd.DataFrame: Every row of the affected players, with their new ranks, to be loaded into MongoDB.
+        """
+        metrics.record("rows_in", len(self.changes))
+        existing = self.storage.read(self.output_file) if self.storage.exists(self.output_file) else None
+        affected = self.changes["puuid"].unique()
+
+        if existing is None:
+            kept = self.changes.iloc[:0]
+            players = self.changes
+        else:
+            existing["last"] = pd.to_datetime(existing["last"])
+            in_affected = existing["puuid"].isin(affected).to_numpy()
+            kept = existing.loc[~in_affected]
+            previous = existing.loc[in_affected]
+            changed_keys = pd.MultiIndex.from_frame(self.changes[["puuid", "key"]])
+            unchanged = ~pd.MultiIndex.from_frame(previous[["puuid", "key"]]).isin(changed_keys)
+            players = pd.concat([previous.loc[unchanged], self.changes], ignore_index=True)
+
+        ranking = TransformMastery(dataframe=players.drop(columns="rank", errors="ignore"), persist=False)
+        ranking.create_rank_column()
+        players = ranking.dataframe[list(self.changes.columns)]
+
+        self.dataframe = pd.concat([kept, players], ignore_index=True)
+        self.storage.write(self.dataframe, self.output_file)
+        print(f"✅ Merged {len(self.changes)} Changed Rows of {len(affected)} Players into the Final Data!")
+        return players
@@ -1,62 +1,113 @@
-import os
+from typing import List, Optional, Union
 
 import pandas as pd
 
+from pylegends.common import metrics
+from pylegends.common.storage import FrameStorage
+from pylegends.etl.champs.index import ChampionIndex
 from pylegends.utils.config import LocalPathChamps, LocalPathMastery
 
+SPECIFIC_COLUMNS = [
+    "puuid",
+    "platform",
+    "rank",
+    "key",
+    "champion",
+    "title",
+    "level",
+    "tags",
+    "points",
+    "last",
+    "next",
+    "chest",
+    "tokens",
+    "final",
+]
+
 
 class JoinChamps:
     """
     Class for joining mastery data and champion information into a single DataFrame.
 
-    The class reads two CSV files, one containing mastery data and the other containing champion information, and joins
-    them into a single CSV file. It also organizes the columns of the resulting DataFrame.
+    The class reads two data files, one containing mastery data and the other containing champion information, and
+    joins them into a single data file, organizing the columns of the resulting DataFrame in the same pass. The
+    champion information is looked up through a cached ChampionIndex keyed by 'key'. The mastery data can also be
+    handed over in memory, in which case the clean mastery file is not read, and so can the champion information.
 
     Attributes:
-        file1 (str): path to the CSV file containing mastery data.
-        file2 (str): path to the CSV file containing champion information.
-        output_file (str): path to the output CSV file after joining the data.
+        file1 (str): path to the data file containing mastery data.
+        file2 (str): path to the data file containing champion information.
+        output_file (str): path to the output data file after joining the data.
+        mastery (Optional[pd.DataFrame]): mastery data already in memory, used instead of file1.
+        champions (Optional[Union[pd.DataFrame, ChampionIndex]]): champion information already in memory, used
+            instead of file2.
+        dataframe (Optional[pd.DataFrame]): the joined DataFrame.
     """
 
-    def __init__(self) -> None:
-        """Initializes the class with the input and output file paths."""
+    def __init__(
+        self,
+        mastery: Optional[pd.DataFrame] = None,
+        persist: bool = True,
+        champions: Optional[Union[pd.DataFrame, ChampionIndex]] = None,
+    ) -> None:
+        """
+        Initializes the class with the input and output file paths.
+
+        Args:
+            mastery (Optional[pd.DataFrame]): Clean mastery data already in memory; read from file1 if None.
+            persist (bool): Whether to save the joined DataFrame to the output file.
+            champions (Optional[Union[pd.DataFrame, ChampionIndex]]): Clean champion information already in memory, or
+                its index; the cached index of file2 if None.
+        """
         self.file1 = LocalPathMastery.CLEAN
         self.file2 = LocalPathChamps.CLEAN
         self.output_file = LocalPathMastery.FINAL
+        self.mastery = mastery
+        self.champions = champions
+        self.persist = persist
+        self.dataframe: Optional[pd.DataFrame] = None
+        self.storage = FrameStorage()
 
-    def run(self) -> None:
-        """Performs data joining and column organization processes."""
+    @metrics.instrument
+    def run(self) -> pd.DataFrame:
+        """
+        Performs data joining and column organization processes.
+
+        Returns:
+            pd.DataFrame: The joined DataFrame with its columns organized.
+        """
         self.join_data()
-        self.sort_columns()
-        print("✅ Join Mastery and Champion Data Saved Successfully!")
+        if self.persist:
+            self.storage.write(self.dataframe, self.output_file)
+            print("✅ Join Mastery and Champion Data Saved Successfully!")
+        return self.dataframe
 
     def join_data(self) -> None:
-        """Merge mastery data and champion information into a single DataFrame and save it to a CSV file."""
-        df1 = pd.read_csv(self.file1)
-        df2 = pd.read_csv(self.file2)
-        joined_df = pd.merge(df1, df2, on="key", how="inner", validate="many_to_many")
-        os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
-        joined_df.to_csv(self.output_file, index=False)
-
-    def sort_columns(self) -> None:
-        """Arranges the columns of the unified DataFrame and saves changes to the CSV file."""
-        df = pd.read_csv(self.output_file)
-        specific_columns = [
-            "rank",
-            "key",
-            "champion",
-            "title",
-            "level",
-            "tags",
-            "points",
-            "last",
-            "next",
-            "chest",
-            "tokens",
-            "final",
-        ]
-        specific_columns = [col for col in specific_columns if col in df.columns]
-        other_columns = sorted(col for col in df.columns if col not in specific_columns)
-        sorted_columns = specific_columns + other_columns
-        df = df[sorted_columns]
-        df.to_csv(self.output_file, index=False)
+        """Joins mastery data and champion information into a single DataFrame, with its columns organized."""
+        if self.mastery is not None:
+            metrics.record("rows_in", len(self.mastery))
+        mastery = self.mastery if self.mastery is not None else self.storage.read(self.file1)
+        self.dataframe = self.champion_index().join(mastery, order=self.ordered_columns)
+
+    def champion_index(self) -> ChampionIndex:
+        """Returns the index of the champion information, building or loading it as needed."""
+        if isinstance(self.champions, ChampionIndex):
+            return self.champions
+        if self.champions is not None:
+            return ChampionIndex(self.champions)
+        return ChampionIndex.load(self.file2, self.storage)
+
+    @staticmethod
+    def ordered_columns(columns: List[str]) -> List[str]:
+        """
+        Orders the columns of the joined data: the main mastery and champion columns first, then the rest by name.
+
+        Args:
+            columns (List[str]): Columns of the joined data.
+
+        Returns:
+            List[str]: The same columns, in display order.
+        """
+        specific_columns = [col for col in SPECIFIC_COLUMNS if col in columns]
+        other_columns = sorted(col for col in columns if col not in specific_columns)
+        return specific_columns + other_columns
@@ -1,20 +1,57 @@
+from typing import Iterable, Optional, Union
+
+import pandas as pd
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from pylegends.common import metrics
 from pylegends.common.mongodb import MongoDBConnector
-from pylegends.utils.config import LocalPathMastery
+from pylegends.utils.config import LocalPathMastery, MongoDB, Pipeline
 
 
 class LoadMastery:
-    """Class for loading data into MongoDB 'mastery' collection."""
+    """
+    Class for loading data into MongoDB 'mastery' collection.
+
+    Attributes:
+        INDEXES (List[IndexModel]): Indexes of the collection: the unique player and champion key, and the default sort
+            of the dashboard.
+    """
+
+    INDEXES = [
+        IndexModel([("puuid", ASCENDING), ("key", ASCENDING)], unique=True, name="puuid_key"),
+        IndexModel([("level", DESCENDING), ("points", DESCENDING)], name="level_points"),
+    ]
+
+    @classmethod
+    @metrics.instrument
+    def run(
+        cls,
+        dataframe: Optional[Union[pd.DataFrame, Iterable[pd.DataFrame]]] = None,
+        delete_missing: bool = MongoDB.DELETE_MISSING,
+    ) -> None:
+        """
+        Loads data from the data file into the 'mastery' collection, keyed by player and champion.
+
+        Documents of earlier versions, keyed by champion only, have no 'puuid' and are deleted first.
 
-    @staticmethod
-    def run() -> None:
-        """Loads data from a CSV file into the 'mastery' collection."""
+        Args:
+            dataframe (Optional[Union[pd.DataFrame, Iterable[pd.DataFrame]]]): Final mastery data already in memory, or
+                its chunks; read from the file, in chunks, if None.
+            delete_missing (bool): Whether to delete the documents missing from the data; must be False when loading
+                only part of the players.
+        """
         loader = MongoDBConnector()
         loader.connect()
+        loader.drop_unkeyed(MongoDB.DATABASE, "mastery", ["puuid", "key"])
+        loader.create_indexes(MongoDB.DATABASE, "mastery", cls.INDEXES)
         loader.load_data(
-            "pylegends",
+            MongoDB.DATABASE,
             "mastery",
-            LocalPathMastery.FINAL,
-            "key",
+            dataframe if dataframe is not None else LocalPathMastery.FINAL,
+            ["puuid", "key"],
+            batch_size=MongoDB.BATCH_SIZE,
+            delete_missing=delete_missing,
+            chunk_size=Pipeline.CHUNK_SIZE,
         )
         loader.close()
 
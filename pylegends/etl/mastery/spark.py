@@ -0,0 +1,157 @@
+from typing import Optional
+
+from pyspark.sql import DataFrame, SparkSession, Window
+from pyspark.sql import functions as F
+
+from pylegends.common.spark import SparkStorage
+from pylegends.etl.mastery.join import JoinChamps
+from pylegends.etl.mastery.transform import COLUMN_MAPPING, COLUMNS_TO_DROP
+from pylegends.utils.config import LocalPathChamps, LocalPathMastery
+
+
+class SparkTransformMastery:
+    """
+    Spark version of TransformMastery, for mastery data of more players than fit in a single worker.
+
+    Applies the same transformations as TransformMastery: deletes and renames columns, calculates the 'final' column,
+    converts 'last' to a timestamp and ranks the champions of each player with a window function. The rows are
+    partitioned by player so that each ranking is computed on a single executor.
+
+    Attributes:
+        spark (SparkSession): Session running the transformation.
+        num_executors (Optional[int]): Number of executors; used to size the partitioning by player.
+        dataframe (Optional[DataFrame]): Raw mastery data, or the transformed data after run.
+        persist (bool): Whether the transformed data is saved to the clean data file.
+    """
+
+    def __init__(
+        self,
+        spark: SparkSession,
+        num_executors: Optional[int] = None,
+        dataframe: Optional[DataFrame] = None,
+        persist: bool = True,
+    ) -> None:
+        """
+        Initializes the class with the Spark session and the data to be transformed.
+
+        Args:
+            spark (SparkSession): Session running the transformation.
+            num_executors (Optional[int]): Number of executors; the data is not repartitioned if None.
+            dataframe (Optional[DataFrame]): Raw mastery data; read from the raw file if None.
+            persist (bool): Whether to save the transformed data to the clean data file.
+        """
+        self.spark = spark
+        self.num_executors = num_executors
+        self.dataframe = dataframe
+        self.persist = persist
+        self.storage = SparkStorage(spark)
+
+    def run(self) -> DataFrame:
+        """
+        Performs the data transformation and, if persisting, saves it.
+
+        Returns:
+            DataFrame: The transformed mastery data.
+        """
+        df = self.dataframe if self.dataframe is not None else self.storage.read(LocalPathMastery.RAW)
+        df = df.drop(*COLUMNS_TO_DROP)
+        for old, new in COLUMN_MAPPING.items():
+            df = df.withColumnRenamed(old, new)
+
+        df = df.withColumn("final", F.when(F.col("level") >= 5, F.lit(0)).otherwise(21600 - F.col("points")))
+        df = df.withColumn("last", F.timestamp_millis(F.col("last")))
+        self.dataframe = self.create_rank_column(df)
+
+        if self.persist:
+            self.storage.write(self.dataframe, LocalPathMastery.CLEAN)
+            print("✅ Transform Mastery Data Saved Successfully!")
+        return self.dataframe
+
+    def create_rank_column(self, dataframe: DataFrame, group_by: str = "puuid") -> DataFrame:
+        """
+        Creates the 'rank' column ordering the champions of each player by 'level' and then 'points', both descending.
+
+        Ties are broken by the champion 'key', ascending, as in TransformMastery; row_number() would otherwise number
+        them in whatever order the rows reach the executor.
+
+        Args:
+            dataframe (DataFrame): Mastery data with the renamed columns.
+            group_by (str): Column whose values are ranked separately; the whole data is one ranking if it is missing.
+
+        Returns:
+            DataFrame: The data with the 'rank' column.
+        """
+        order = [F.col("level").desc(), F.col("points").desc()]
+        if "key" in dataframe.columns:
+            order.append(F.col("key").asc())
+        if group_by not in dataframe.columns:
+            return dataframe.withColumn("rank", F.row_number().over(Window.orderBy(*order)).cast("long"))
+
+        if self.num_executors:
+            cores = int(self.spark.conf.get("spark.executor.cores", "1"))
+            dataframe = dataframe.repartition(self.num_executors * cores, group_by)
+        window = Window.partitionBy(group_by).orderBy(*order)
+        return dataframe.withColumn("rank", F.row_number().over(window).cast("long"))
+
+
+class SparkJoinChamps:
+    """
+    Spark version of JoinChamps, joining mastery data and champion information.
+
+    The champions table is small, so it is broadcast to every executor and joined without shuffling the mastery data.
+    The columns are ordered as in JoinChamps.
+
+    Attributes:
+        spark (SparkSession): Session running the join.
+        num_executors (Optional[int]): Number of executors; kept for spark_task_submit.py.
+        mastery (Optional[DataFrame]): Clean mastery data; read from the clean file if None.
+        persist (bool): Whether the joined data is saved to the final data file.
+        champions (Optional[DataFrame]): Clean champion information; read from the clean champions file if None.
+        dataframe (Optional[DataFrame]): The joined data.
+    """
+
+    def __init__(
+        self,
+        spark: SparkSession,
+        num_executors: Optional[int] = None,
+        mastery: Optional[DataFrame] = None,
+        persist: bool = True,
+        champions: Optional[DataFrame] = None,
+    ) -> None:
+        """
+        Initializes the class with the Spark session and the data to be joined.
+
+        Args:
+            spark (SparkSession): Session running the join.
+            num_executors (Optional[int]): Number of executors.
+            mastery (Optional[DataFrame]): Clean mastery data; read from the clean file if None.
+            persist (bool): Whether to save the joined data to the final data file.
+            champions (Optional[DataFrame]): Clean champion information; read from the clean champions file if None.
+        """
+        self.spark = spark
+        self.num_executors = num_executors
+        self.mastery = mastery
+        self.champions = champions
+        self.persist = persist
+        self.dataframe: Optional[DataFrame] = None
+        self.storage = SparkStorage(spark)
+
+    def run(self) -> DataFrame:
+        """
+        Performs the broadcast join and column ordering and, if persisting, saves the result.
+
+        Returns:
+            DataFrame: The joined data, sorted by player and rank within each partition.
+        """
+        mastery = self.mastery if self.mastery is not None else self.storage.read(LocalPathMastery.CLEAN)
+        champions = self.champions if self.champions is not None else self.storage.read(LocalPathChamps.CLEAN)
+        df = mastery.join(F.broadcast(champions), on="key", how="inner")
+        df = df.select(*JoinChamps.ordered_columns(df.columns))
+        if {"puuid", "rank"} <= set(df.columns):
+            df = df.sortWithinPartitions("puuid", "rank")
+        self.dataframe = df
+
+        if self.persist:
+            self.storage.write(self.dataframe, LocalPathMastery.FINAL)
+            print("✅ Join Mastery and Champion Data Saved Successfully!")
+        return self.dataframe
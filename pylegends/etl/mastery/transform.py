@@ -1,50 +1,81 @@
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from pylegends.common import metrics
+from pylegends.common.storage import FrameStorage
 from pylegends.utils.config import LocalPathMastery
 
+COLUMNS_TO_DROP = ["summonerId", "championPointsSinceLastLevel"]
+
+COLUMN_MAPPING = {
+    "championId": "key",
+    "championLevel": "level",
+    "championPoints": "points",
+    "lastPlayTime": "last",
+    "championPointsSinceLastLevel": "since",
+    "championPointsUntilNextLevel": "next",
+    "chestGranted": "chest",
+    "tokensEarned": "tokens",
+}
+
 
 class TransformMastery:
     """
     Class for transforming League of Legends mastery data.
 
-    Reads a CSV file of raw mastery data, applies transformations such as deleting and renaming columns, calculating new
-    columns and saving it to another CSV.
+    Reads the raw mastery data file, applies transformations such as deleting and renaming columns, calculating new
+    columns and saving it to the clean data file. The raw data can also be handed over in memory, and saving the clean
+    data file made optional, so that no intermediate file is read or written.
 
     Attributes:
         dataframe (Optional[pd.DataFrame]): DataFrame for transformation.
-        file_path (str): Raw data CSV file path.
+        file_path (str): Raw data file path, without extension.
         columns_to_drop (list[str]): Columns to exclude from the DataFrame.
+        persist (bool): Whether the transformed DataFrame is saved to the clean data file.
     """
 
-    def __init__(self) -> None:
-        """Initializes the class with settings for data transformation."""
-        self.dataframe: Optional[pd.DataFrame] = None
+    def __init__(self, dataframe: Optional[pd.DataFrame] = None, persist: bool = True) -> None:
+        """
+        Initializes the class with settings for data transformation.
+
+        Args:
+            dataframe (Optional[pd.DataFrame]): Raw mastery data already in memory; read from the raw file if None.
+                It is transformed in place.
+            persist (bool): Whether to save the transformed DataFrame to the clean data file.
+        """
+        self.dataframe: Optional[pd.DataFrame] = dataframe
+        self.persist = persist
         self.file_path = LocalPathMastery.RAW
-        self.columns_to_drop = ["puuid", "summonerId", "championPointsSinceLastLevel"]
+        self.columns_to_drop = list(COLUMNS_TO_DROP)
+        self.storage = FrameStorage()
 
+    @metrics.instrument
     def run(self) -> Tuple[Optional[pd.DataFrame], str]:
         """
-        Performs data transformation: loads CSV, deletes/renames columns, calculates new columns and saves the new
+        Performs data transformation: loads data, deletes/renames columns, calculates new columns and saves the new
         DataFrame.
 
         Returns:
             Tuple[Optional[pd.DataFrame], str]: Transformed DataFrame and status message.
         """
-        if self.load_csv(self.file_path) and self.drop_columns(self.columns_to_drop):
+        if self.dataframe is not None:
+            metrics.record("rows_in", len(self.dataframe))
+        loaded = self.dataframe is not None or self.load_data(self.file_path)
+        if loaded and self.drop_columns(self.columns_to_drop):
             self.rename_columns()
             self.calculate_final()
             self.converter_timestamp()
             self.create_rank_column()
-            save_status = self.save_csv(LocalPathMastery.CLEAN)
+            save_status = self.save_data(LocalPathMastery.CLEAN) if self.persist else True
             return self.dataframe, "✅ Success!" if save_status else "⛔ Error saving!!!"
         return None, "⛔ Error loading file or deleting columns!!!"
 
-    def load_csv(self, file_path: str) -> bool:
-        """Load CSV file into DataFrame. Returns True if successful, False otherwise."""
+    def load_data(self, file_path: str) -> bool:
+        """Load data file into DataFrame. Returns True if successful, False otherwise."""
         try:
-            self.dataframe = pd.read_csv(file_path)
+            self.dataframe = self.storage.read(file_path)
             return True
         except FileNotFoundError:
             print(f"⛔ File not found: {file_path}")
@@ -62,29 +93,14 @@ class TransformMastery:
     def rename_columns(self) -> None:
         """Renames DataFrame columns according to defined mapping."""
         if self.dataframe is not None:
-            column_mapping = {
-                "championId": "key",
-                "championLevel": "level",
-                "championPoints": "points",
-                "lastPlayTime": "last",
-                "championPointsSinceLastLevel": "since",
-                "championPointsUntilNextLevel": "next",
-                "chestGranted": "chest",
-                "tokensEarned": "tokens",
-            }
-            self.dataframe.rename(columns=column_mapping, inplace=True)
+            self.dataframe.rename(columns=COLUMN_MAPPING, inplace=True)
         else:
             print("⛔ Dataframe not loaded!!!")
 
     def calculate_final(self) -> None:
-        """Calculates the 'final' column based on specific rules."""
+        """Calculates the 'final' column: the points missing to level 5, or 0 for champions already at level 5+."""
         if self.dataframe is not None:
-            self.dataframe["final"] = self.dataframe.apply(self.calculate_final_row, axis=1)
-
-    @staticmethod
-    def calculate_final_row(row: pd.Series) -> int:
-        """Helper to calculate 'final' for each line. Returns calculated value."""
-        return 0 if row["level"] >= 5 else 21600 - row["points"]
+            self.dataframe["final"] = np.where(self.dataframe["level"] >= 5, 0, 21600 - self.dataframe["points"])
 
     def converter_timestamp(self) -> None:
         """Converts 'last' to datetime format."""
@@ -93,29 +109,49 @@ class TransformMastery:
         else:
             print("⛔ Dataframe not loaded!!!")
 
-    def create_rank_column(self) -> None:
-        """Create 'ranking' column based on 'level 'points'."""
+    def create_rank_column(self, group_by: Optional[str] = "puuid") -> None:
+        """
+        Creates the 'rank' column ordering the champions by 'level' and then 'points', both descending.
+
+        The rows are sorted with a single lexicographic sort and ranked 1..n within each group; the whole DataFrame is
+        ranked as one group if the column is missing. Ties are broken by the champion 'key', ascending, as in
+        SparkTransformMastery, so both backends produce the same ranking; without a 'key' column they keep their
+        original order.
+
+        Args:
+            group_by (Optional[str]): Column whose values are ranked separately, e.g. one ranking per player.
+        """
         if self.dataframe is not None:
-            self.dataframe.sort_values(by=["level", "points"], ascending=[False, False], inplace=True)
-            self.dataframe["rank"] = (
-                self.dataframe[["level", "points"]].apply(tuple, axis=1).rank(method="first", ascending=False)
-            )
+            df = self.dataframe
+            grouped = group_by is not None and group_by in df.columns
+            keys = [-df["points"].to_numpy(), -df["level"].to_numpy()]
+            if "key" in df.columns:
+                keys.insert(0, df["key"].to_numpy())
+            if grouped:
+                keys.append(pd.factorize(df[group_by])[0])
+            order = np.lexsort(keys)
+            self.dataframe = df = df.iloc[order].reset_index(drop=True)
+
+            if grouped:
+                df["rank"] = df.groupby(group_by, sort=False).cumcount().to_numpy() + 1
+            else:
+                df["rank"] = np.arange(1, len(df) + 1)
         else:
             print("⛔ Dataframe not loaded!!!")
 
-    def save_csv(self, save_path: str) -> bool:
+    def save_data(self, save_path: str) -> bool:
         """
-        Saves the DataFrame to a CSV file.
+        Saves the DataFrame to the clean data file.
 
         Args:
-            save_path (str): Path of the destination CSV file.
+            save_path (str): Path of the destination file, without extension.
 
         Returns:
             bool: true if the file is saved successfully, false otherwise.
         """
         if self.dataframe is not None:
             try:
-                self.dataframe.to_csv(save_path, index=False)
+                self.storage.write(self.dataframe, save_path)
                 print("✅ Transform Mastery Data Saved Successfully!")
                 return True
             except Exception as e:
@@ -1,6 +1,130 @@
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+from pylegends.common.mongodb import MongoClientManager
+from pylegends.common.profiling import Profiler
 from pylegends.tasks.task_champs import TaskChamps
 from pylegends.tasks.task_items import TaskItems
 from pylegends.tasks.task_mastery import TaskMastery
+from pylegends.utils.config import Pipeline
+
+
+class InlineExecutor(Executor):
+    """Executor that runs each submitted callable right away on the calling thread, e.g. under a profiler."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """
+        Runs the callable and returns its already completed future.
+
+        Args:
+            fn (Callable[..., Any]): Callable to run.
+            *args (Any): Positional arguments of the callable.
+            **kwargs (Any): Keyword arguments of the callable.
+
+        Returns:
+            Future: Future holding the result or the exception of the call.
+        """
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as err:
+            future.set_exception(err)
+        return future
+
+
+class TaskScheduler:
+    """
+    Runs tasks concurrently while respecting the dependencies declared between them.
+
+    Each task starts as soon as all of its dependencies succeeded, on a thread pool bounded by `max_workers`, in a copy
+    of the scheduler's context so that its metrics stage nests in the caller's. A failing task does not stop the
+    others: only the tasks that depend on it, directly or not, are skipped.
+
+    Attributes:
+        max_workers (int): Maximum number of tasks run at the same time.
+        inline (bool): Whether the tasks run one at a time on the calling thread instead of the thread pool.
+        tasks (Dict[str, Callable[[], object]]): Callables of the registered tasks, by name.
+        dependencies (Dict[str, Set[str]]): Names of the tasks each task depends on.
+        status (Dict[str, str]): Final status of each task: "success", "failed" or "skipped".
+        errors (Dict[str, Exception]): Exception raised by each failed task.
+    """
+
+    def __init__(self, max_workers: int = Pipeline.MAX_WORKERS, inline: bool = False) -> None:
+        """Initializes an empty scheduler."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+        self.max_workers = max_workers
+        self.inline = inline
+        self.tasks: Dict[str, Callable[[], object]] = {}
+        self.dependencies: Dict[str, Set[str]] = {}
+        self.status: Dict[str, str] = {}
+        self.errors: Dict[str, Exception] = {}
+
+    def add(self, name: str, task: Callable[[], object], depends_on: Iterable[str] = ()) -> None:
+        """
+        Registers a task.
+
+        Args:
+            name (str): Unique name of the task.
+            task (Callable[[], object]): Callable executed to run the task.
+            depends_on (Iterable[str]): Names of the tasks that must succeed before this one starts.
+        """
+        if name in self.tasks:
+            raise ValueError(f"Task {name} is already registered.")
+        self.tasks[name] = task
+        self.dependencies[name] = set(depends_on)
+
+    def run(self) -> Dict[str, str]:
+        """
+        Runs every registered task, in parallel whenever their dependencies allow it.
+
+        Returns:
+            Dict[str, str]: Final status of each task.
+        """
+        unknown = {dep for deps in self.dependencies.values() for dep in deps} - set(self.tasks)
+        if unknown:
+            raise ValueError(f"Unknown task dependencies: {sorted(unknown)}")
+
+        pending = set(self.tasks)
+        running: Dict[Future, str] = {}
+        started: Dict[str, float] = {}
+
+        executor: Executor = InlineExecutor() if self.inline else ThreadPoolExecutor(max_workers=self.max_workers)
+        with executor:
+            while pending or running:
+                for name in sorted(pending):
+                    states = {self.status.get(dep) for dep in self.dependencies[name]}
+                    if states & {"failed", "skipped"}:
+                        pending.discard(name)
+                        self.status[name] = "skipped"
+                        print(f"⏭️ Task {name.upper()} Skipped: a Dependency Did Not Succeed!")
+                    elif states <= {"success"}:
+                        pending.discard(name)
+                        started[name] = time.monotonic()
+                        context = contextvars.copy_context()
+                        running[executor.submit(context.run, self.tasks[name])] = name
+
+                if not running:
+                    if pending:
+                        raise ValueError(f"Circular task dependencies: {sorted(pending)}")
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    elapsed = time.monotonic() - started[name]
+                    try:
+                        future.result()
+                        self.status[name] = "success"
+                        print(f"✅ Task {name.upper()} Finished in {elapsed:.1f}s!")
+                    except Exception as err:
+                        self.status[name] = "failed"
+                        self.errors[name] = err
+                        print(f"⛔ Task {name.upper()} Failed after {elapsed:.1f}s: {err}")
+
+        return self.status
 
 
 class Processing:
@@ -8,21 +132,72 @@ class Processing:
     Class responsible for coordinating Riot API data processing.
 
     This class orchestrates the execution of various data processing tasks, including data transformation, joining,
-    quality checking, and storage.
+    quality checking, and storage. Tasks declare their dependencies and independent ones run concurrently: champions
+    and items have no dependencies, while mastery waits for the champions it is joined with. When profiling, the tasks
+    run one at a time on the calling thread: the profilers see every thread of the process, including the worker pools
+    of the tasks, so running tasks side by side would mix their work in each other's profiles.
+
+    Attributes:
+        max_workers (int): Maximum number of tasks run concurrently.
     """
 
-    @staticmethod
-    def run() -> None:
+    def __init__(self, max_workers: int = Pipeline.MAX_WORKERS) -> None:
+        """Initializes the processing with the desired parallelism."""
+        self.max_workers = max_workers
+
+    def build_scheduler(self, profiler: Optional[Profiler] = None) -> TaskScheduler:
+        """
+        Registers the pipeline tasks and their dependencies.
+
+        Args:
+            profiler (Optional[Profiler]): Profiler of the run; the tasks it selects are wrapped in their own profile.
+
+        Returns:
+            TaskScheduler: Scheduler ready to run the pipeline.
+        """
+        scheduler = TaskScheduler(self.max_workers, inline=profiler is not None)
+        tasks: Dict[str, Callable[[], object]] = {
+            "champs": TaskChamps().run,
+            "items": TaskItems().run,
+            "mastery": TaskMastery().run,
+        }
+        if profiler is not None:
+            unknown = set(profiler.tasks) - set(tasks)
+            if unknown:
+                raise ValueError(f"Unknown tasks to profile: {sorted(unknown)}")
+            tasks = {
+                name: profiler.wrap(name, task) if profiler.selects(name) else task for name, task in tasks.items()
+            }
+
+        scheduler.add("champs", tasks["champs"])
+        scheduler.add("items", tasks["items"])
+        scheduler.add("mastery", tasks["mastery"], depends_on=["champs"])
+        return scheduler
+
+    def run(self, profiler: Optional[Profiler] = None) -> None:
         """
         Runs the full Riot API processing pipeline.
 
         Performs a series of tasks to process API data, including data transformation, joining, quality checks, and
-        other necessary steps.
+        other necessary steps. All tasks share a single pooled MongoDB client, closed once the pipeline ends. Failures
+        are isolated per task and reported together once every other task has finished.
+
+        Args:
+            profiler (Optional[Profiler]): Profiles the whole run, or only the tasks it selects; the tasks then run
+                sequentially.
         """
         try:
-            TaskChamps().run()
-            TaskMastery().run()
-            TaskItems().run()
+            with MongoClientManager():
+                scheduler = self.build_scheduler(profiler)
+                if profiler is not None and not profiler.tasks:
+                    with profiler.profile("run"):
+                        scheduler.run()
+                else:
+                    scheduler.run()
+
+            if scheduler.errors:
+                failed = ", ".join(f"{name} ({err})" for name, err in scheduler.errors.items())
+                raise RuntimeError(f"Tasks failed: {failed}")
 
         except Exception as e:
             print(f"An error occurred while processing the Data: {e}")
@@ -1,6 +1,9 @@
+from pylegends.common import metrics
+from pylegends.common.processed import ProcessedMarker
 from pylegends.etl.champs.extract import ExtractChamps
 from pylegends.etl.champs.load import LoadChamps
 from pylegends.etl.champs.transform import TransformChamps
+from pylegends.utils.config import LocalPathChamps
 
 
 class TaskChamps:
@@ -16,13 +19,30 @@ class TaskChamps:
         pass
 
     @staticmethod
+    @metrics.instrument
     def run() -> None:
         """
         Performs all ETL tasks for champion data.
 
         Starts the ETL process by executing, in sequence, the data extraction and transformation steps.
-        Tasks are performed in an order that ensures correct data manipulation and preparation.
+        Tasks are performed in an order that ensures correct data manipulation and preparation. Transform and load
+        are skipped when the champion data of the current patch and locales was already loaded, as recorded once the
+        load succeeds; a failed transform raises, so that the patch is processed again on the next run.
         """
-        ExtractChamps().run()
-        TransformChamps().run()
+        extract = ExtractChamps()
+        extract.run()
+        marker = ProcessedMarker(LocalPathChamps.PROCESSED)
+        if not extract.fetched_langs:
+            if marker.read() is None:
+                raise RuntimeError("⛔ Champion Data Could Not Be Extracted!!!")
+            print("⚠️ Champion Data Could Not Be Extracted, Keeping the Last Processed Patch!")
+            return
+        if marker.is_processed(extract.version, extract.fetched_langs):
+            print("⏭️ Champion Data Unchanged, Skipping Transform and Load!")
+            return
+
+        dataframe, status = TransformChamps().run()
+        if dataframe is None:
+            raise RuntimeError(status)
         LoadChamps().run()
+        marker.write(extract.version, extract.fetched_langs)
@@ -1,6 +1,9 @@
+from pylegends.common import metrics
+from pylegends.common.processed import ProcessedMarker
 from pylegends.etl.items.extract import ExtractItems
 from pylegends.etl.items.load import LoadItems
 from pylegends.etl.items.transform import TransformItems
+from pylegends.utils.config import LocalPathItems
 
 
 class TaskItems:
@@ -16,13 +19,30 @@ class TaskItems:
         pass
 
     @staticmethod
+    @metrics.instrument
     def run() -> None:
         """
         Performs all ETL tasks for item data.
 
         Starts the ETL process by executing, in sequence, the data extraction and transformation steps.
-        Tasks are performed in an order that ensures correct data manipulation and preparation.
+        Tasks are performed in an order that ensures correct data manipulation and preparation. Transform and load
+        are skipped when the item data of the current patch and locales was already loaded, as recorded once the load
+        succeeds; a failed transform raises, so that the patch is processed again on the next run.
         """
-        ExtractItems().run()
-        TransformItems().run()
+        extract = ExtractItems()
+        extract.run()
+        marker = ProcessedMarker(LocalPathItems.PROCESSED)
+        if not extract.fetched_langs:
+            if marker.read() is None:
+                raise RuntimeError("⛔ Item Data Could Not Be Extracted!!!")
+            print("⚠️ Item Data Could Not Be Extracted, Keeping the Last Processed Patch!")
+            return
+        if marker.is_processed(extract.version, extract.fetched_langs):
+            print("⏭️ Item Data Unchanged, Skipping Transform and Load!")
+            return
+
+        dataframe, status = TransformItems().run()
+        if dataframe is None:
+            raise RuntimeError(status)
         LoadItems().run()
+        marker.write(extract.version, extract.fetched_langs)
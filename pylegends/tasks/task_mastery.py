@@ -1,7 +1,17 @@
+from contextlib import ExitStack
+from typing import Iterator
+
+import pandas as pd
+
+from pylegends.common import metrics
+from pylegends.common.storage import FrameStorage
+from pylegends.etl.champs.index import ChampionIndex
 from pylegends.etl.mastery.extract import ExtractMastery
+from pylegends.etl.mastery.incremental import MasteryWatermarks, MergeMastery
 from pylegends.etl.mastery.join import JoinChamps
 from pylegends.etl.mastery.load import LoadMastery
 from pylegends.etl.mastery.transform import TransformMastery
+from pylegends.utils.config import LocalPathChamps, LocalPathMastery, Pipeline
 
 
 class TaskMastery:
@@ -10,21 +20,112 @@ class TaskMastery:
 
     Acts as an orchestrator for various ETL (Extract, Transform, Load) tasks for League of Legends mastery data,
     triggering specific ETL classes for each step and ensuring efficient execution of each transformation process.
+
+    Attributes:
+        in_memory (bool): Whether the stages hand their DataFrames to each other in memory instead of through files.
+        checkpoints (bool): Whether the raw and clean files are still written when running in memory.
+        streaming (bool): Whether the raw data is transformed, joined and loaded in chunks of whole players.
+        chunk_size (int): Maximum number of rows processed at a time when streaming.
+        incremental (bool): Whether only the champions played since the last run are transformed, joined and loaded.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        in_memory: bool = Pipeline.IN_MEMORY,
+        checkpoints: bool = Pipeline.CHECKPOINTS,
+        streaming: bool = Pipeline.STREAMING,
+        chunk_size: int = Pipeline.CHUNK_SIZE,
+        incremental: bool = Pipeline.INCREMENTAL,
+    ) -> None:
         """Initializes the instance of the TaskMastery class."""
-        pass
+        self.in_memory = in_memory
+        self.checkpoints = checkpoints
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.incremental = incremental
 
-    @staticmethod
-    def run() -> None:
+    @metrics.instrument
+    def run(self) -> None:
         """
         Performs all ETL tasks for mastery data.
 
         Calls the ETL classes responsible for extracting, transforming and joining mastery data, executing the tasks in
-        a logical sequence to ensure correct manipulation and preparation of data for later use.
+        a logical sequence to ensure correct manipulation and preparation of data for later use. In memory, each stage
+        receives the DataFrame produced by the previous one and only the final data file is written. When streaming,
+        the stages run chunk by chunk over the raw data file; incremental runs, which take precedence, process only the
+        champions played since the last run.
+        """
+        if self.incremental:
+            self.run_incremental()
+            return
+
+        if self.streaming:
+            self.run_streaming()
+            return
+
+        if not self.in_memory:
+            ExtractMastery().run()
+            TransformMastery().run()
+            JoinChamps().run()
+            LoadMastery().run()
+            return
+
+        raw = ExtractMastery(in_memory=True, persist=self.checkpoints).run()
+        clean, _ = TransformMastery(dataframe=raw, persist=self.checkpoints).run()
+        final = JoinChamps(mastery=clean).run()
+        LoadMastery().run(final)
+
+    def run_incremental(self) -> None:
+        """
+        Performs the ETL tasks only for the champions played after each player's watermark.
+
+        The changed rows are transformed and joined in memory, merged into the final data file, and every row of the
+        affected players is loaded into MongoDB, where the diff-only load skips the ones whose rank did not change.
+        The watermarks are advanced once the load succeeds.
+        """
+        raw = ExtractMastery(in_memory=True, persist=self.checkpoints).run()
+        watermarks = MasteryWatermarks()
+        changed = watermarks.changed(raw)
+        if changed.empty:
+            print("⏭️ No Champions Played Since the Last Run, Skipping Transform and Load!")
+            return
+
+        print(f"🔎 {len(changed)} of {len(raw)} Mastery Rows Changed Since the Last Run.")
+        clean, _ = TransformMastery(dataframe=changed, persist=self.checkpoints).run()
+        joined = JoinChamps(mastery=clean, persist=False).run()
+        affected = MergeMastery(joined).run()
+        LoadMastery().run(affected, delete_missing=False)
+        watermarks.advance(raw)
+        watermarks.save()
+
+    def run_streaming(self) -> None:
+        """
+        Performs the ETL tasks with the memory bounded by the chunk size.
+
+        The extraction already appends each player to the raw data file as it arrives. The raw data file is then read
+        in chunks holding whole players, so that their ranks are computed correctly, and each chunk is transformed,
+        joined with the champion information and loaded into MongoDB before the next one is read. The final data file
+        (and the clean one, with checkpoints) is written incrementally along the way.
         """
         ExtractMastery().run()
-        TransformMastery().run()
-        JoinChamps().run()
-        LoadMastery().run()
+        storage = FrameStorage()
+        champions = ChampionIndex.load(LocalPathChamps.CLEAN, storage)
+
+        with ExitStack() as stack:
+            final_writer = stack.enter_context(storage.writer(LocalPathMastery.FINAL))
+            clean_writer = stack.enter_context(storage.writer(LocalPathMastery.CLEAN)) if self.checkpoints else None
+
+            def chunks() -> Iterator[pd.DataFrame]:
+                """Transforms and joins the raw data chunk by chunk, writing the results as they are produced."""
+                for raw in storage.iter_frames(LocalPathMastery.RAW, self.chunk_size, align_on="puuid"):
+                    clean, status = TransformMastery(dataframe=raw, persist=False).run()
+                    if clean is None:
+                        raise ValueError(status)
+                    if clean_writer is not None:
+                        clean_writer.write(clean)
+                    final = JoinChamps(mastery=clean, champions=champions, persist=False).run()
+                    final_writer.write(final)
+                    yield final
+
+            LoadMastery().run(chunks())
+        print(f"✅ Mastery Data Streamed Successfully! ({final_writer.rows} rows)")
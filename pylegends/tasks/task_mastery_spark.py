@@ -0,0 +1,51 @@
+from typing import Optional
+
+from pyspark.sql import SparkSession
+
+from pylegends.common import metrics
+from pylegends.common.mongodb import MongoClientManager
+from pylegends.etl.mastery.load import LoadMastery
+from pylegends.etl.mastery.spark import SparkJoinChamps, SparkTransformMastery
+from pylegends.utils.config import Pipeline
+
+
+class SparkTaskMastery:
+    """
+    Class responsible for transforming and joining mastery data with Spark.
+
+    Entry point of spark/spark_task_submit.py, which instantiates it with the Spark session and the number of executors.
+    It reads the raw mastery data file written by the extraction, transforms and joins it on the cluster, writes the
+    final data file and loads it into MongoDB in chunks.
+
+    Attributes:
+        spark (SparkSession): Session running the tasks.
+        num_executors (Optional[int]): Number of executors of the cluster.
+        checkpoints (bool): Whether the clean data file is also written.
+        load (bool): Whether the final data is loaded into MongoDB.
+    """
+
+    def __init__(
+        self,
+        spark: SparkSession,
+        num_executors: Optional[int] = None,
+        checkpoints: bool = Pipeline.CHECKPOINTS,
+        load: bool = True,
+    ) -> None:
+        """Initializes the instance of the SparkTaskMastery class."""
+        self.spark = spark
+        self.num_executors = num_executors
+        self.checkpoints = checkpoints
+        self.load = load
+
+    @metrics.instrument
+    def run(self) -> None:
+        """Transforms and joins the raw mastery data with Spark, then loads the final data into MongoDB."""
+        clean = SparkTransformMastery(self.spark, self.num_executors, persist=self.checkpoints).run()
+        SparkJoinChamps(self.spark, self.num_executors, mastery=clean).run()
+        if self.load:
+            with MongoClientManager():
+                LoadMastery().run()
+
+
+if __name__ == "__main__":
+    SparkTaskMastery(SparkSession.builder.master("local[*]").getOrCreate()).run()
@@ -1,3 +1,7 @@
+import os
+from typing import Optional, Tuple
+
+
 class Riot:
     """
     Constants related to the Riot Games API.
@@ -5,57 +9,280 @@ class Riot:
     Stores URLs and identifiers used to make requests to the Riot Games API.
 
     Attributes:
-        URL_CHAMPS (str): Base URL for the Champion Mastery API.
+        URL_CHAMPS (str): Base URL for the Champion Mastery API, formatted with the platform of each player.
+        PLATFORM (str): Platform of the players whose platform is not given, e.g. "br1".
+        PLATFORMS (Tuple[str, ...]): Platforms (regional hosts) served by the Riot Games API.
         PUUID (str): Player identifier (PUUID).
+        PUUIDS_FILE (Optional[str]): File with one PUUID per line, optionally preceded by its platform ("br1,<puuid>"),
+            to extract instead of the single PUUID.
+        LANG (str): Locale of the champion and item data stored in the main tables.
+        LANGS (Tuple[str, ...]): Locales whose strings (names, titles, descriptions) are extracted to the localized
+            tables; LANG is always included.
+        LANG_CONCURRENCY (int): Number of Data Dragon locales downloaded at the same time.
+        CONCURRENCY (int): Number of mastery requests in flight at the same time on each platform.
+        API_DOMAIN (str): Domain of the rate limited Riot Games API hosts.
+        RATE_LIMITS (Tuple[Tuple[int, float], ...]): Application rate limits as (requests, seconds) windows.
     """
 
-    LANG: str = "en_US"
-    URL_CHAMPS: str = "https://br1.api.riotgames.com/lol/champion-mastery/v4/" "champion-masteries/by-puuid/"
+    LANG: str = os.getenv("DDRAGON_LANG", "en_US")
+    LANGS: Tuple[str, ...] = tuple(
+        dict.fromkeys([LANG, *(lang.strip() for lang in os.getenv("DDRAGON_LANGS", "").split(",") if lang.strip())])
+    )
+    LANG_CONCURRENCY: int = int(os.getenv("DDRAGON_CONCURRENCY", "8"))
+    URL_CHAMPS: str = "https://{platform}.api.riotgames.com/lol/champion-mastery/v4/" "champion-masteries/by-puuid/"
+    PLATFORM: str = os.getenv("RIOT_PLATFORM", "br1")
+    PLATFORMS: Tuple[str, ...] = (
+        "br1",
+        "eun1",
+        "euw1",
+        "jp1",
+        "kr",
+        "la1",
+        "la2",
+        "me1",
+        "na1",
+        "oc1",
+        "ph2",
+        "ru",
+        "sg2",
+        "th2",
+        "tr1",
+        "tw2",
+        "vn2",
+    )
     PUUID: str = "Hj9Nd07B27U2qvJV0VnHira-oC1uliJPeQIzbdR_a1pYJ13_Bon_4ekX4-GNDrIZLXDACvzBvWjVpg"
+    PUUIDS_FILE: Optional[str] = os.getenv("PUUIDS_FILE")
+    CONCURRENCY: int = int(os.getenv("MASTERY_CONCURRENCY", "10"))
+    API_DOMAIN: str = "api.riotgames.com"
+    RATE_LIMITS: Tuple[Tuple[int, float], ...] = ((20, 1.0), (100, 120.0))
 
 
 class LocalPathMastery:
     """
     Local paths to mastery data files.
 
-    Defines paths for raw, clean, and final CSV files related to mastery data.
+    Defines paths for raw, clean, and final files related to mastery data. Data paths have no extension: it is added by
+    the storage layer according to the configured format.
 
     Attributes:
-        RAW (str): raw CSV file path.
-        CLEAN (str): clean CSV file path.
-        FINAL (str): path of the final CSV file.
+        RAW (str): raw data path.
+        CLEAN (str): clean data path.
+        FINAL (str): final data path.
+        FAILURES (str): JSON file with the PUUIDs whose extraction failed, kept for a later retry.
+        WATERMARKS (str): JSON file with the latest 'lastPlayTime' already processed for each PUUID.
     """
 
-    RAW: str = "data/mastery/raw.csv"
-    CLEAN: str = "data/mastery/clear.csv"
-    FINAL: str = "data/mastery/final.csv"
+    RAW: str = "data/mastery/raw"
+    CLEAN: str = "data/mastery/clear"
+    FINAL: str = "data/mastery/final"
+    FAILURES: str = "data/mastery/failures.json"
+    WATERMARKS: str = "data/mastery/watermarks.json"
 
 
 class LocalPathChamps:
     """
     Local paths to champion data files.
 
-    Defines paths for raw, clean, and final CSV files related to champion data.
+    Defines paths for raw and clean files related to champion data, without extension.
 
     Attributes:
-        RAW (str): raw CSV file path.
-        CLEAN (str): clean CSV file path.
+        RAW (str): raw data path.
+        CLEAN (str): clean data path.
+        LOCALIZED (str): localized strings path, one row per champion and locale.
+        PROCESSED (str): JSON file with the patch and locales last transformed and loaded.
     """
 
-    RAW: str = "data/champs/raw.csv"
-    CLEAN: str = "data/champs/clean.csv"
+    RAW: str = "data/champs/raw"
+    CLEAN: str = "data/champs/clean"
+    LOCALIZED: str = "data/champs/localized"
+    PROCESSED: str = "data/champs/processed.json"
 
 
 class LocalPathItems:
     """
     Local paths to item data files.
 
-    Defines paths for raw, clean, and final CSV files related to item data.
+    Defines paths for raw and clean files related to item data, without extension.
+
+    Attributes:
+        RAW (str): Raw data path.
+        CLEAN (str): Clean data path.
+        TREE (str): Build tree data path, one row per item and component.
+        LOCALIZED (str): Localized strings path, one row per item and locale.
+        PROCESSED (str): JSON file with the patch and locales last transformed and loaded.
+    """
+
+    RAW: str = "data/items/raw"
+    CLEAN: str = "data/items/clean"
+    TREE: str = "data/items/tree"
+    LOCALIZED: str = "data/items/localized"
+    PROCESSED: str = "data/items/processed.json"
+
+
+class Storage:
+    """
+    Settings of the storage of intermediate data files.
+
+    Attributes:
+        FORMAT (str): Format of the raw, clean and final files: "parquet" or "csv".
+        COMPRESSION (str): Compression codec of the Parquet files.
+        EXPORT_CSV (bool): Whether a CSV copy is written next to each Parquet file.
+    """
+
+    FORMAT: str = os.getenv("STORAGE_FORMAT", "parquet")
+    COMPRESSION: str = os.getenv("STORAGE_COMPRESSION", "zstd")
+    EXPORT_CSV: bool = os.getenv("STORAGE_EXPORT_CSV", "false").lower() == "true"
+
+
+class LocalPathCache:
+    """
+    Local paths to cached API responses.
+
+    Attributes:
+        VERSION (str): JSON file holding the last resolved Data Dragon version and its ETag.
+        DDRAGON (str): Directory holding the compressed Data Dragon payloads, by version, language and resource.
+    """
+
+    VERSION: str = "data/cache/version.json"
+    DDRAGON: str = "data/cache/ddragon"
+
+
+class Cache:
+    """
+    Settings of the local caches of API responses.
+
+    Attributes:
+        VERSION_TTL (int): Seconds during which the cached Data Dragon version is used without revalidation.
+        DDRAGON_ENABLED (bool): Whether Data Dragon payloads are read from the local cache when available.
+    """
+
+    VERSION_TTL: int = int(os.getenv("VERSION_CACHE_TTL", "3600"))
+    DDRAGON_ENABLED: bool = os.getenv("DDRAGON_CACHE", "true").lower() == "true"
+
+
+class MongoDB:
+    """
+    Settings used when loading data into MongoDB.
+
+    Attributes:
+        DATABASE (str): Name of the database that receives the collections.
+        BATCH_SIZE (int): Number of operations sent in each bulk write.
+        DIFF_ONLY (bool): Whether loaders only write documents whose content changed since the last load.
+        DELETE_MISSING (bool): Whether loaders delete documents whose keys are no longer present in the source.
+        HASH_SUFFIX (str): Suffix of the side collection that stores the content hash of each loaded document.
+        META_COLLECTION (str): Collection holding the load version of each collection, bumped whenever it changes.
+        MAX_POOL_SIZE (int): Maximum number of pooled connections of the shared client.
+        MIN_POOL_SIZE (int): Minimum number of pooled connections kept open by the shared client.
+        WRITE_CONCERN (str): Write concern ("w" option) used by the shared client, e.g. "1" or "majority".
+        COMPRESSORS (str): Comma separated wire protocol compressors, e.g. "zstd,snappy,zlib".
+    """
+
+    DATABASE: str = "pylegends"
+    BATCH_SIZE: int = int(os.getenv("MONGODB_BATCH_SIZE", "1000"))
+    DIFF_ONLY: bool = os.getenv("MONGODB_DIFF_ONLY", "true").lower() == "true"
+    DELETE_MISSING: bool = os.getenv("MONGODB_DELETE_MISSING", "false").lower() == "true"
+    HASH_SUFFIX: str = "_hashes"
+    META_COLLECTION: str = "_meta"
+    MAX_POOL_SIZE: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+    MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+    WRITE_CONCERN: str = os.getenv("MONGODB_WRITE_CONCERN", "1")
+    COMPRESSORS: str = os.getenv("MONGODB_COMPRESSORS", "zlib")
+
+
+class Http:
+    """
+    Settings of the shared HTTP client used for the Riot Games and Data Dragon APIs.
+
+    Attributes:
+        TIMEOUT (float): Seconds to wait for the server to connect or send data.
+        MAX_RETRIES (int): Number of retries of a request that failed with a retryable error.
+        BACKOFF_FACTOR (float): Base delay, in seconds, of the exponential backoff between retries.
+        MAX_BACKOFF (float): Upper bound, in seconds, of the delay between retries.
+        POOL_SIZE (int): Number of keep-alive connections kept per host.
+    """
+
+    TIMEOUT: float = float(os.getenv("HTTP_TIMEOUT", "10"))
+    MAX_RETRIES: int = int(os.getenv("HTTP_MAX_RETRIES", "5"))
+    BACKOFF_FACTOR: float = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+    MAX_BACKOFF: float = float(os.getenv("HTTP_MAX_BACKOFF", "60"))
+    POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", "20"))
+
+
+class Pipeline:
+    """
+    Settings of the pipeline execution.
+
+    Attributes:
+        MAX_WORKERS (int): Maximum number of tasks run concurrently by the scheduler.
+        IN_MEMORY (bool): Whether the mastery stages hand their DataFrames to each other in memory.
+        CHECKPOINTS (bool): Whether the intermediate raw and clean files are still written when running in memory.
+        STREAMING (bool): Whether the mastery stages process the raw data in chunks, bounding the memory used.
+        INCREMENTAL (bool): Whether only the champions played since the last run are transformed, joined and loaded.
+        CHUNK_SIZE (int): Maximum number of rows processed at a time when streaming or loading a file into MongoDB.
+    """
+
+    MAX_WORKERS: int = int(os.getenv("PIPELINE_MAX_WORKERS", "3"))
+    IN_MEMORY: bool = os.getenv("PIPELINE_IN_MEMORY", "true").lower() == "true"
+    CHECKPOINTS: bool = os.getenv("PIPELINE_CHECKPOINTS", "false").lower() == "true"
+    STREAMING: bool = os.getenv("PIPELINE_STREAMING", "false").lower() == "true"
+    INCREMENTAL: bool = os.getenv("PIPELINE_INCREMENTAL", "false").lower() == "true"
+    CHUNK_SIZE: int = int(os.getenv("PIPELINE_CHUNK_SIZE", "100000"))
+
+
+class Metrics:
+    """
+    Settings of the stage metrics recorded by the pipeline.
+
+    Attributes:
+        ENABLED (bool): Whether the stages record their duration and counters.
+        LOG (bool): Whether each finished stage is printed as a JSON line.
+        TEXTFILE (Optional[str]): Prometheus textfile (node exporter textfile collector) written at the end of the job.
+        PUSHGATEWAY (Optional[str]): URL of a Prometheus Pushgateway the metrics are pushed to at the end of the job.
+        JOB (str): Job label of the exported metrics.
+    """
+
+    ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    LOG: bool = os.getenv("METRICS_LOG", "true").lower() == "true"
+    TEXTFILE: Optional[str] = os.getenv("METRICS_TEXTFILE")
+    PUSHGATEWAY: Optional[str] = os.getenv("METRICS_PUSHGATEWAY")
+    JOB: str = os.getenv("METRICS_JOB", "pylegends")
+
+
+class Profiling:
+    """
+    Settings of the optional profiling of pipeline runs.
+
+    Attributes:
+        MODE (Optional[str]): "cpu" (cProfile), "memory" (tracemalloc) or "all"; profiling is off if unset.
+        DIR (str): Directory where the profiling reports are written.
+        TASKS (Tuple[str, ...]): Tasks profiled separately, e.g. ("mastery",); the whole run is profiled if empty.
+        TOP (int): Number of functions and allocation sites listed in the reports' summaries.
+    """
+
+    MODE: Optional[str] = os.getenv("PROFILE_MODE") or None
+    DIR: str = os.getenv("PROFILE_DIR", "data/profiles")
+    TASKS: Tuple[str, ...] = tuple(task for task in os.getenv("PROFILE_TASKS", "").split(",") if task)
+    TOP: int = int(os.getenv("PROFILE_TOP", "10"))
+
+
+class App:
+    """
+    Settings of the mastery dashboard.
 
     Attributes:
-        RAW (str): Raw CSV file path.
-        CLEAN (str): Clean CSV file path.
+        SERVER_SIDE (bool): Whether the table is paged, sorted and filtered on the server, which sends only the
+            visible page.
+        PAGE_SIZE (int): Number of rows of each page of the table when paging on the server.
+        SOURCE (str): Where the dashboard reads the mastery data from: "mongodb" (the 'mastery' collection, shared by
+            every replica of the dashboard) or "file" (the local final data file).
+        DEBUG (bool): Whether the Dash debugger and reloader are enabled; never in production.
+        COMPRESS (bool): Whether responses are gzip compressed (requires flask-compress).
+        STATIC_MAX_AGE (int): Seconds browsers may cache the static assets and component bundles.
     """
 
-    RAW: str = "data/items/raw.csv"
-    CLEAN: str = "data/items/clean.csv"
+    SERVER_SIDE: bool = os.getenv("DASH_SERVER_SIDE", "true").lower() == "true"
+    PAGE_SIZE: int = int(os.getenv("DASH_PAGE_SIZE", "50"))
+    SOURCE: str = os.getenv("DASH_SOURCE", "mongodb")
+    DEBUG: bool = os.getenv("DASH_DEBUG", "false").lower() == "true"
+    COMPRESS: bool = os.getenv("DASH_COMPRESS", "true").lower() == "true"
+    STATIC_MAX_AGE: int = int(os.getenv("DASH_STATIC_MAX_AGE", "86400"))